@@ -0,0 +1,76 @@
+"""
+Microbenchmark: cache key derivation, legacy json.dumps + md5 vs cache.make_key.
+
+Usage: python scripts/bench_cache_key.py [iterations]
+"""
+import hashlib
+import json
+import sys
+import timeit
+
+from usaspending_mcp.cache import Cache, make_key
+
+AWARD_SEARCH_KEY = {
+    "tool": "award_search",
+    "filters": {
+        "award_type_codes": ["D", "C", "B", "A"],
+        "time_period": [{"start_date": "2023-10-01", "end_date": "2024-09-30"}],
+        "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Defense"}],
+        "keywords": ["cloud services"],
+        "recipient_search_text": ["Lockheed"],
+        "place_of_performance_locations": [{"country": "USA", "state": "VA"}],
+        "naics_codes": {"require": ["541511", "541512"]},
+    },
+    "fields": ["Award ID", "Recipient Name", "Awarding Agency", "Award Amount", "Action Date", "Award Type"],
+    "sort": "Award Amount",
+    "order": "desc",
+    "page": 1,
+    "limit": 10,
+}
+CATALOG_KEY = "bootstrap_catalog_v1"
+
+
+def legacy_key(key_data):
+    try:
+        serialized = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.md5(serialized.encode("utf-8")).hexdigest()
+    except TypeError:
+        return hashlib.md5(str(key_data).encode("utf-8")).hexdigest()
+
+
+def bench(label, func, iterations):
+    # Best of several runs to damp scheduler noise
+    seconds = min(timeit.repeat(func, number=iterations, repeat=5))
+    usec = seconds / iterations * 1e6
+    print(f"{label:<48} {usec:8.2f} us/op")
+    return usec
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("Key derivation")
+    for name, key in (("award_search filters", AWARD_SEARCH_KEY), ("string key", CATALOG_KEY)):
+        old = bench(f"  legacy json.dumps+md5 ({name})", lambda k=key: legacy_key(k), iterations)
+        new = bench(f"  make_key ({name})", lambda k=key: make_key(k), iterations)
+        print(f"  speedup: {old / new:.2f}x")
+
+    print("Cache miss path: get() then set()")
+    cache = Cache()
+
+    def get_then_set_normalizing_twice():
+        cache.get(AWARD_SEARCH_KEY)
+        cache.set(AWARD_SEARCH_KEY, 1, ttl_seconds=60)
+
+    def get_then_set_precomputed():
+        key = cache.make_key(AWARD_SEARCH_KEY)
+        cache.get(key)
+        cache.set(key, 1, ttl_seconds=60)
+
+    old = bench("  key_data passed to get() and set()", get_then_set_normalizing_twice, iterations)
+    new = bench("  make_key() once, reused", get_then_set_precomputed, iterations)
+    print(f"  speedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import bisect
+import math
+import re
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
+
+# Word abbreviations expanded before indexing and searching ("Dept of Defense")
+TOKEN_ALIASES = {
+    "dept": "department",
+    "dep": "department",
+    "admin": "administration",
+    "adm": "administration",
+    "natl": "national",
+    "intl": "international",
+    "govt": "government",
+    "fed": "federal",
+    "corp": "corporation",
+    "comm": "commission",
+    "svc": "service",
+    "svcs": "services",
+    "env": "environmental",
+}
+STOPWORDS = frozenset({"of", "the", "and", "for", "on", "in", "at", "to", "us", "u", "s"})
+
+# Minimum share of the query (IDF-weighted) an agency must cover to be returned
+MIN_SCORE = 0.5
+# Minimum trigram similarity for a misspelled query token to match an indexed token
+MIN_TOKEN_SIMILARITY = 0.5
+PREFIX_WEIGHT = 0.9
+
+# Match tiers, best first
+TIER_ABBREVIATION = 0
+TIER_PREFIX = 1
+TIER_SUBSTRING = 2
+TIER_TOKENS = 3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, "&" -> "and", punctuation dropped ("U.S." -> "us"), word aliases expanded."""
+    text = (text or "").lower().replace("&", " and ").replace(".", "").replace("'", "")
+    words = _NON_ALNUM.sub(" ", text).split()
+    return " ".join(TOKEN_ALIASES.get(w, w) for w in words)
+
+
+def tokens(normalized: str) -> List[str]:
+    return [w for w in normalized.split() if w not in STOPWORDS]
+
+
+def trigrams(token: str) -> FrozenSet[str]:
+    padded = f"  {token} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class AgencyIndex:
+    """
+    Search index over the toptier agency list, built once per catalog load.
+
+    Holds each agency's normalized name, an abbreviation map, a token inverted index
+    (with IDF weights, so "department" counts for little) and a trigram index over
+    the token vocabulary for misspellings. Results are ranked by match tier (exact
+    abbreviation, name prefix, substring, token match), then by the share of the
+    query they cover.
+    """
+
+    def __init__(self, agencies: List[Dict[str, Any]]):
+        self.agencies = list(agencies)
+        self._names: List[str] = []
+        self._abbreviations: Dict[str, Set[int]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._token_trigrams: Dict[str, FrozenSet[str]] = {}
+        self._trigram_postings: Dict[str, Set[str]] = {}
+
+        for i, agency in enumerate(self.agencies):
+            name = normalize(agency.get("agency_name") or agency.get("toptier_code") or "")
+            self._names.append(name)
+            abbreviation = normalize(agency.get("abbreviation") or "").replace(" ", "")
+            if abbreviation:
+                self._abbreviations.setdefault(abbreviation, set()).add(i)
+            for token in tokens(name):
+                self._postings.setdefault(token, set()).add(i)
+
+        for token in self._postings:
+            grams = trigrams(token)
+            self._token_trigrams[token] = grams
+            for gram in grams:
+                self._trigram_postings.setdefault(gram, set()).add(token)
+
+        self._vocabulary = sorted(self._postings)
+        count = max(1, len(self.agencies))
+        self._idf = {token: math.log(1 + count / len(ids)) for token, ids in self._postings.items()}
+        # Weight of a token that only matches an abbreviation, or nothing at all
+        self._max_idf = math.log(1 + count)
+
+    def __len__(self) -> int:
+        return len(self.agencies)
+
+    def _prefixed(self, token: str) -> List[str]:
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\uffff")
+        return [t for t in self._vocabulary[start:end] if t != token]
+
+    def _similar(self, token: str) -> Dict[str, float]:
+        grams = trigrams(token)
+        candidates = set().union(*(self._trigram_postings.get(g, ()) for g in grams))
+        scored = {t: similarity(grams, self._token_trigrams[t]) for t in candidates}
+        return {t: s for t, s in scored.items() if s >= MIN_TOKEN_SIMILARITY}
+
+    def _token_matches(self, token: str) -> Dict[int, float]:
+        """Agency index -> match weight (0..1] for one query token."""
+        matches: Dict[int, float] = {}
+
+        def add(ids: Set[int], weight: float) -> None:
+            for i in ids:
+                matches[i] = max(matches.get(i, 0.0), weight)
+
+        add(self._abbreviations.get(token, set()), 1.0)
+        add(self._postings.get(token, set()), 1.0)
+        if len(token) >= 3:
+            for vocab_token in self._prefixed(token):
+                add(self._postings[vocab_token], PREFIX_WEIGHT)
+        if not matches and len(token) >= 4:
+            for vocab_token, score in self._similar(token).items():
+                add(self._postings[vocab_token], score)
+        return matches
+
+    def _token_weight(self, token: str) -> float:
+        if token in self._idf:
+            return self._idf[token]
+        prefixed = self._prefixed(token) if len(token) >= 3 else []
+        if prefixed:
+            return max(self._idf[t] for t in prefixed)
+        return self._max_idf
+
+    def search(self, q: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Best-matching agencies (full catalog objects), best first."""
+        query = normalize(q)
+        if not query or limit <= 0:
+            return []
+
+        # agency index -> (tier, -score); lower sorts first
+        ranked: Dict[int, Tuple[int, float]] = {}
+        for i in self._abbreviations.get(query.replace(" ", ""), ()):
+            ranked[i] = (TIER_ABBREVIATION, -1.0)
+
+        query_tokens = tokens(query) or query.split()
+        coverage: Dict[int, float] = {}
+        total = 0.0
+        for token in query_tokens:
+            weight = self._token_weight(token)
+            total += weight
+            for i, match in self._token_matches(token).items():
+                coverage[i] = coverage.get(i, 0.0) + weight * match
+
+        for i, covered in coverage.items():
+            score = covered / total if total else 0.0
+            name = self._names[i]
+            if name.startswith(query):
+                tier = TIER_PREFIX
+            elif f" {query}" in f" {name}":
+                tier = TIER_SUBSTRING
+            elif score >= MIN_SCORE:
+                tier = TIER_TOKENS
+            else:
+                continue
+            ranked[i] = min(ranked.get(i, (tier, -score)), (tier, -score))
+
+        order = sorted(ranked.items(), key=lambda item: (item[1], self.agencies[item[0]].get("agency_name") or ""))
+        return [self.agencies[i] for i, _ in order[:limit]]
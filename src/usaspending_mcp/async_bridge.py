@@ -0,0 +1,33 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+# A single long-lived event loop serves every synchronous caller, so the
+# per-loop httpx.AsyncClient (and its connection pool) is reused across calls.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="usaspending-sync-bridge", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a coroutine to completion from synchronous code and returns its result.
+    Context variables (request_id, tool_name, ...) are propagated to the coroutine.
+    """
+    loop = _get_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the bridge event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
@@ -1,49 +1,387 @@
+import asyncio
 import hashlib
 import json
+import os
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from usaspending_mcp.cache_store import CacheStore, SQLiteCacheStore, StoredRow
+
+# List-valued keys whose element order does not change the meaning of a request.
+ORDER_INSENSITIVE_KEYS = frozenset({"award_type_codes", "def_codes", "types", "include", "views"})
+
+# Reused encoder: json.dumps() with non-default options builds a new encoder per call.
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+
+class CacheKey(str):
+    """A normalized cache key. Passing one to get()/set() skips key derivation."""
+
+
+def _canonicalize(key_data: Any) -> Any:
+    """
+    Sorts order-insensitive lists so equivalent requests share a key.
+    Only dicts are walked; lists are copied on write, never mutated in place.
+    """
+    if not isinstance(key_data, dict):
+        return key_data
+    canonical = None
+    for k, v in key_data.items():
+        if type(v) is dict:
+            new_v = _canonicalize(v)
+            if new_v is v:
+                continue
+        elif k in ORDER_INSENSITIVE_KEYS and type(v) is list:
+            try:
+                new_v = sorted(v)
+            except TypeError:
+                new_v = sorted(v, key=str)
+            if new_v == v:
+                continue
+        else:
+            continue
+        if canonical is None:
+            canonical = dict(key_data)
+        canonical[k] = new_v
+    return key_data if canonical is None else canonical
+
+
+def make_key(key_data: Any) -> CacheKey:
+    """
+    Derives a stable cache key.
+
+    Strings are used as-is (no hashing). Structured keys are canonicalized
+    (sorted dict keys and order-insensitive lists), compactly JSON-encoded
+    and hashed with a 128-bit blake2b digest. Keys are stable across processes.
+    """
+    if isinstance(key_data, CacheKey):
+        return key_data
+    if isinstance(key_data, str):
+        return CacheKey("s:" + key_data)
+    try:
+        serialized = _KEY_ENCODER.encode(_canonicalize(key_data))
+    except (TypeError, ValueError):
+        # Fallback for non-JSON serializable / unsortable objects (use str repr)
+        serialized = str(key_data)
+    return CacheKey("h:" + hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest())
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    stored_at: float
+    expires_at: float
+    # Expired entries are kept (and served by get_entry) until stale_until.
+    stale_until: float
+    size: int
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - self.stored_at
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        return self.expires_at - (now if now is not None else time.time())
+
+
+def _approx_size(value: Any) -> int:
+    """Approximate in-memory footprint of a cached value, using its JSON length."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
 
 
 class Cache:
-    def __init__(self):
-        self._store: Dict[str, Tuple[Any, float]] = {}
+    """
+    In-memory TTL cache with LRU eviction.
+
+    Bounded by entry count and approximate byte size; expired entries are
+    removed on read and by a periodic sweep that runs on cache access.
+    Entries set with stale_ttl_seconds outlive their TTL for that long so
+    callers can serve them stale (see get_entry) while refreshing.
+
+    With an optional L2 store (local SQLite file or shared remote cache), writes go
+    through to it and L1 misses read through from it, so cached data survives
+    restarts and is shared between instances. L2 I/O never runs under the cache
+    lock; async callers use aget/aget_entry/aset, which run it in a worker thread
+    so a slow store doesn't block the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval_seconds: Optional[float] = None,
+        l2: Optional[CacheStore] = None
+    ):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("CACHE_MAX_ENTRIES", "5000"))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.sweep_interval_seconds = (
+            sweep_interval_seconds if sweep_interval_seconds is not None
+            else float(os.getenv("CACHE_SWEEP_INTERVAL_S", "60"))
+        )
+
+        self.l2 = l2
+
+        # Ordered from least to most recently used
+        self._store: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _normalize_key(self, key_data: Any) -> CacheKey:
+        return make_key(key_data)
 
-    def _normalize_key(self, key_data: Any) -> str:
+    def make_key(self, key_data: Any) -> CacheKey:
         """
-        Generates a stable string hash for the cache key.
-        Handles dict key sorting to ensure stability.
+        Normalizes key_data once so a get() followed by set() doesn't derive it twice.
         """
-        try:
-            # Sort keys for consistent JSON representation
-            serialized = json.dumps(key_data, sort_keys=True, default=str)
-            return hashlib.md5(serialized.encode("utf-8")).hexdigest()
-        except TypeError:
-            # Fallback for non-JSON serializable objects (use str repr)
-            return hashlib.md5(str(key_data).encode("utf-8")).hexdigest()
+        return make_key(key_data)
+
+    def _remove(self, key: str) -> None:
+        entry = self._store.pop(key)
+        self._bytes -= entry.size
+
+    def _maybe_sweep(self, now: float) -> bool:
+        """Sweeps L1 if due (caller holds the lock). True means L2 should be purged too."""
+        if now - self._last_sweep >= self.sweep_interval_seconds:
+            self._sweep(now)
+            return self.l2 is not None
+        return False
+
+    def _sweep(self, now: float) -> int:
+        self._last_sweep = now
+        expired = [k for k, entry in self._store.items() if entry.stale_until <= now]
+        for k in expired:
+            self._remove(k)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _insert(self, key: str, value: Any, stored_at: float, expires_at: float, stale_until: float) -> bool:
+        """Adds an entry to L1 as most recently used. Returns False if it's too large to cache."""
+        size = _approx_size(value)
+        if key in self._store:
+            self._remove(key)
+        if size > self.max_bytes:
+            return False
+        self._store[key] = CacheEntry(value, stored_at, expires_at, stale_until, size)
+        self._bytes += size
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        while self._store and (len(self._store) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._store))
+            self._remove(oldest)
+            self.evictions += 1
 
     def get(self, key_data: Any) -> Tuple[Optional[Any], bool]:
         """
         Retrieves data from cache if it exists and hasn't expired.
         Returns (data, cache_hit_boolean)
         """
-        key = self._normalize_key(key_data)
-        if key in self._store:
-            data, expiry = self._store[key]
-            if time.time() < expiry:
-                return data, True
+        entry = self._lookup(key_data, allow_stale=False)
+        if entry is None:
+            return None, False
+        return entry.value, True
+
+    def get_entry(self, key_data: Any) -> Optional[CacheEntry]:
+        """
+        Returns the cache entry, including one that has expired but is still inside
+        its stale window, or None. Use entry.is_fresh() to tell the two apart.
+        """
+        return self._lookup(key_data, allow_stale=True)
+
+    async def aget(self, key_data: Any) -> Tuple[Optional[Any], bool]:
+        """get() for async callers: L2 reads run in a worker thread."""
+        entry = await self._alookup(key_data, allow_stale=False)
+        if entry is None:
+            return None, False
+        return entry.value, True
+
+    async def aget_entry(self, key_data: Any) -> Optional[CacheEntry]:
+        """get_entry() for async callers: L2 reads run in a worker thread."""
+        return await self._alookup(key_data, allow_stale=True)
+
+    def _check(self, key: str, entry: Optional[CacheEntry], now: float, allow_stale: bool) -> Optional[CacheEntry]:
+        """Hit/stale/miss accounting for a looked-up entry (caller holds the lock)."""
+        if entry is not None:
+            if entry.is_fresh(now):
+                self._store.move_to_end(key)
+                self.hits += 1
+                return entry
+            if now < entry.stale_until:
+                if allow_stale:
+                    self._store.move_to_end(key)
+                    self.stale_hits += 1
+                    return entry
             else:
                 # Cleanup expired item
-                del self._store[key]
-        return None, False
+                self._remove(key)
+                self.expirations += 1
+        self.misses += 1
+        return None
 
-    def set(self, key_data: Any, value: Any, ttl_seconds: int = 300) -> None:
+    def _lookup_l1(self, key: str, now: float, allow_stale: bool) -> Tuple[bool, Optional[CacheEntry], bool]:
         """
-        Stores data in cache with a TTL.
+        L1 part of a lookup: (done, entry, purge_l2). done=False means the key isn't
+        in L1 and L2 should be read.
         """
+        with self._lock:
+            purge = self._maybe_sweep(now)
+            entry = self._store.get(key)
+            if entry is None and self.l2 is not None:
+                return False, None, purge
+            return True, self._check(key, entry, now, allow_stale), purge
+
+    def _lookup_l2_row(self, key: str, row: Optional[StoredRow], now: float, allow_stale: bool) -> Optional[CacheEntry]:
+        with self._lock:
+            # Another caller may have filled L1 while L2 was being read
+            entry = self._store.get(key)
+            if entry is None and row is not None and self._insert(key, *row):
+                self.l2_hits += 1
+                entry = self._store[key]
+            return self._check(key, entry, now, allow_stale)
+
+    def _lookup(self, key_data: Any, allow_stale: bool) -> Optional[CacheEntry]:
+        key = self._normalize_key(key_data)
+        now = time.time()
+        done, entry, purge = self._lookup_l1(key, now, allow_stale)
+        if purge:
+            self.l2.purge()
+        if done:
+            return entry
+        return self._lookup_l2_row(key, self.l2.get(key), now, allow_stale)
+
+    async def _alookup(self, key_data: Any, allow_stale: bool) -> Optional[CacheEntry]:
+        key = self._normalize_key(key_data)
+        now = time.time()
+        done, entry, purge = self._lookup_l1(key, now, allow_stale)
+        if purge:
+            await asyncio.to_thread(self.l2.purge)
+        if done:
+            return entry
+        row = await asyncio.to_thread(self.l2.get, key)
+        return self._lookup_l2_row(key, row, now, allow_stale)
+
+    def _set_l1(
+        self, key_data: Any, value: Any, ttl_seconds: float, stale_ttl_seconds: float
+    ) -> Tuple[str, bool, StoredRow, bool]:
+        """Stores in L1. Returns (key, stored, row, purge_l2) for the L2 write."""
         key = self._normalize_key(key_data)
-        expiry = time.time() + ttl_seconds
-        self._store[key] = (value, expiry)
+        now = time.time()
+        expires_at = now + ttl_seconds
+        stale_until = expires_at + stale_ttl_seconds
+        with self._lock:
+            stored = self._insert(key, value, now, expires_at, stale_until)
+            purge = self._maybe_sweep(now)
+        return key, stored, (value, now, expires_at, stale_until), purge
+
+    def _write_l2(self, key: str, stored: bool, row: StoredRow, purge: bool) -> None:
+        if stored:
+            self.l2.set(key, *row)
+        else:
+            self.l2.delete(key)
+        if purge:
+            self.l2.purge()
+
+    def set(self, key_data: Any, value: Any, ttl_seconds: int = 300, stale_ttl_seconds: float = 0) -> None:
+        """
+        Stores data in cache with a TTL.
+        stale_ttl_seconds keeps the entry available to get_entry() for that long after it expires.
+        Values larger than max_bytes on their own are not cached.
+        """
+        key, stored, row, purge = self._set_l1(key_data, value, ttl_seconds, stale_ttl_seconds)
+        if self.l2 is not None:
+            self._write_l2(key, stored, row, purge)
+
+    async def aset(self, key_data: Any, value: Any, ttl_seconds: int = 300, stale_ttl_seconds: float = 0) -> None:
+        """set() for async callers: the L2 write runs in a worker thread."""
+        key, stored, row, purge = self._set_l1(key_data, value, ttl_seconds, stale_ttl_seconds)
+        if self.l2 is not None:
+            await asyncio.to_thread(self._write_l2, key, stored, row, purge)
+
+    def sweep(self) -> int:
+        """Removes all expired entries (past their stale window) now. Returns the number removed."""
+        with self._lock:
+            removed = self._sweep(time.time())
+        if self.l2 is not None:
+            self.l2.purge()
+        return removed
+
+    def _load_rows(self, rows: Iterable[Tuple[str, StoredRow]], write_through: bool) -> int:
+        loaded = 0
+        # Rows arrive most recent first; insert oldest first so recency order is kept.
+        for key, row in reversed(list(rows)):
+            with self._lock:
+                if not self._insert(key, *row):
+                    continue
+            if write_through and self.l2 is not None:
+                self.l2.set(key, *row)
+            loaded += 1
+        return loaded
+
+    def warm_from_l2(self) -> int:
+        """Loads the most recent live L2 entries into L1. Returns the number loaded."""
+        if self.l2 is None:
+            return 0
+        return self._load_rows(self.l2.items(limit=self.max_entries), write_through=False)
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        Loads live entries from a snapshot file (see save_snapshot) into L1 and L2,
+        so a new instance starts warm. Returns the number loaded.
+        """
+        snapshot = SQLiteCacheStore(path)
+        try:
+            return self._load_rows(snapshot.items(limit=self.max_entries), write_through=True)
+        finally:
+            snapshot.close()
+
+    def save_snapshot(self, path: str) -> int:
+        """Writes live L1 entries to a snapshot file. Returns the number written."""
+        now = time.time()
+        with self._lock:
+            entries = [(k, e) for k, e in self._store.items() if e.stale_until > now]
+        snapshot = SQLiteCacheStore(path)
+        try:
+            return sum(
+                snapshot.set(k, e.value, e.stored_at, e.expires_at, e.stale_until) for k, e in entries
+            )
+        finally:
+            snapshot.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "l2_hits": self.l2_hits,
+                "l2": self.l2.stats() if self.l2 is not None else None,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
 
     def clear(self) -> None:
-        """Clears the entire cache."""
-        self._store.clear()
\ No newline at end of file
+        """Clears the entire cache, including the L2 store."""
+        with self._lock:
+            self._store.clear()
+            self._bytes = 0
+        if self.l2 is not None:
+            self.l2.clear()
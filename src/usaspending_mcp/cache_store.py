@@ -0,0 +1,140 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Protocol, Tuple
+
+# (value, stored_at, expires_at, stale_until)
+StoredRow = Tuple[Any, float, float, float]
+
+
+class CacheStore(Protocol):
+    """Second-tier store behind cache.Cache (local SQLite file or shared remote server)."""
+
+    def get(self, key: str) -> Optional[StoredRow]: ...
+
+    def set(self, key: str, value: Any, stored_at: float, expires_at: float, stale_until: float) -> bool: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def items(self, limit: Optional[int] = None) -> Iterator[Tuple[str, StoredRow]]: ...
+
+    def purge(self) -> int: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+    def clear(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class SQLiteCacheStore:
+    """
+    Persistent L2 tier for cache.Cache, kept in a local SQLite file.
+
+    Values are stored as JSON together with their timestamps so TTLs and stale
+    windows survive restarts. The same file format doubles as a startup snapshot.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        self.path = path
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("CACHE_L2_MAX_ENTRIES", "50000"))
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Shared by the sync bridge thread and the server event loop; guarded by _lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " stale_until REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_stale_until ON cache (stale_until)")
+
+    def get(self, key: str) -> Optional[StoredRow]:
+        """Returns the stored row unless it is past its stale window."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, expires_at, stale_until FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at, expires_at, stale_until = row
+        if stale_until <= time.time():
+            self.delete(key)
+            return None
+        return json.loads(value), stored_at, expires_at, stale_until
+
+    def set(self, key: str, value: Any, stored_at: float, expires_at: float, stale_until: float) -> bool:
+        """Writes a row. Returns False (and stores nothing) if the value isn't JSON-serializable."""
+        try:
+            encoded = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at, stale_until) VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, stored_at, expires_at, stale_until)
+            )
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def items(self, limit: Optional[int] = None) -> Iterator[Tuple[str, StoredRow]]:
+        """Live rows, most recently stored first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, stored_at, expires_at, stale_until FROM cache"
+                " WHERE stale_until > ? ORDER BY stored_at DESC LIMIT ?",
+                (time.time(), -1 if limit is None else limit)
+            ).fetchall()
+        for key, value, stored_at, expires_at, stale_until in rows:
+            yield key, (json.loads(value), stored_at, expires_at, stale_until)
+
+    def purge(self) -> int:
+        """Deletes rows past their stale window and trims to max_entries. Returns rows removed."""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM cache WHERE stale_until <= ?", (time.time(),)).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+        return removed
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "sqlite", "entries": self.count()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def store_from_env() -> Optional[CacheStore]:
+    """
+    The L2 store from the environment: a shared remote cache (CACHE_REDIS_URL) takes
+    precedence over a local SQLite file (CACHE_L2_PATH). None when neither is set.
+    """
+    redis_url = os.getenv("CACHE_REDIS_URL")
+    if redis_url:
+        from usaspending_mcp.redis_store import RedisCacheStore  # avoid import cycle
+
+        return RedisCacheStore.from_url(redis_url)
+    path = os.getenv("CACHE_L2_PATH")
+    return SQLiteCacheStore(path) if path else None
@@ -0,0 +1,92 @@
+import bisect
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from usaspending_mcp.agency_index import normalize, tokens
+
+# A query made only of digits, letters and dots with no spaces is treated as a code prefix
+_CODE_QUERY = re.compile(r"^[0-9a-z][0-9a-z.]*$")
+
+
+def flatten_tree(nodes: Optional[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+    """
+    {"code", "description"} records for every node of a references/filter_tree/ response
+    (nodes carry "id", "description" and "children").
+    """
+    records = []
+    stack = list(reversed(nodes or []))
+    while stack:
+        node = stack.pop()
+        if node.get("id"):
+            records.append({"code": str(node["id"]), "description": node.get("description") or ""})
+        stack.extend(reversed(node.get("children") or []))
+    return records
+
+
+def listing_records(results: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """{"code", "description"} records from references/cfda/totals/ results."""
+    return [
+        {"code": str(r["code"]), "description": r.get("description") or r.get("program_title") or ""}
+        for r in results
+        if r.get("code")
+    ]
+
+
+class CodeIndex:
+    """
+    Local lookup over a static code list (PSC, NAICS, assistance listings).
+
+    Codes are kept sorted for prefix search ("5415" -> 541511, 541512, ...) and
+    descriptions go into a token inverted index; every query token must match a
+    description token (exactly, or as a prefix of one). A miss returns [] so the
+    caller can fall back to the upstream autocomplete.
+    """
+
+    def __init__(self, records: List[Dict[str, str]]):
+        self.records = list({r["code"]: r for r in records}.values())
+        self._codes = sorted((r["code"].lower(), i) for i, r in enumerate(self.records))
+        self._postings: Dict[str, Set[int]] = {}
+        for i, record in enumerate(self.records):
+            for token in tokens(normalize(record["description"])):
+                self._postings.setdefault(token, set()).add(i)
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _by_code(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self._codes, (prefix,))
+        end = bisect.bisect_left(self._codes, (prefix + "\uffff",))
+        # Exact code first, then broader (shorter) codes before their children
+        return [i for _, i in sorted(self._codes[start:end], key=lambda c: (len(c[0]), c[0]))]
+
+    def _token_ids(self, token: str) -> Set[int]:
+        ids = set(self._postings.get(token, ()))
+        if len(token) >= 3:
+            start = bisect.bisect_left(self._vocabulary, token)
+            end = bisect.bisect_left(self._vocabulary, token + "\uffff")
+            for vocab_token in self._vocabulary[start:end]:
+                ids |= self._postings[vocab_token]
+        return ids
+
+    def search(self, q: str, limit: int = 5) -> List[Dict[str, str]]:
+        query = (q or "").strip().lower()
+        if not query or limit <= 0:
+            return []
+
+        if _CODE_QUERY.match(query):
+            found = self._by_code(query)
+            if found:
+                return [self.records[i] for i in found[:limit]]
+
+        query_tokens = tokens(normalize(query))
+        if not query_tokens:
+            return []
+        ids = self._token_ids(query_tokens[0])
+        for token in query_tokens[1:]:
+            if not ids:
+                break
+            ids &= self._token_ids(token)
+        # Most specific (shortest) descriptions first
+        ranked = sorted(ids, key=lambda i: (len(self.records[i]["description"]), self.records[i]["code"]))
+        return [self.records[i] for i in ranked[:limit]]
@@ -1,4 +1,5 @@
-from typing import List
+import re
+from typing import List, Optional, Tuple
 
 ENDPOINT_MAP = {
     "bootstrap_catalog": {
@@ -37,7 +38,7 @@ ENDPOINT_MAP = {
             "/awards/{award_id}/",
             "/transactions/",
             "/subawards/",
-            "/awards/{award_id}/funding/",
+            "/awards/funding/",
             "/awards/{award_id}/funding_rollup/",
         ],
         "methods": ["GET", "POST"],
@@ -102,3 +103,51 @@ def get_endpoints_for_tool(tool_name: str) -> List[str]:
 def get_cost_hint(tool_name: str) -> int:
     """Return estimated number of HTTP calls for a tool."""
     return ENDPOINT_MAP.get(tool_name, {}).get("cost_hint", 1)
+
+
+# Ordered (pattern, template, cache TTL class) table for concrete upstream endpoints.
+# The first matching pattern wins; templates may use backreferences (expanded with
+# Match.expand), and a None template means the endpoint is already a template. TTL classes are keys of router_rules.json
+# "caching_ttl_seconds"; None means responses are never cached.
+ENDPOINT_CLASSES: List[Tuple[re.Pattern, str, Optional[str]]] = [
+    (re.compile(r"^references/.+"), None, "references"),
+    (re.compile(r"^autocomplete/.+"), None, "entity_resolution"),
+    (re.compile(r"^recipient/(count|state)/.*"), None, "entity_resolution"),
+    (re.compile(r"^recipient/[^/]+/$"), "recipient/{recipient_id}/", "entity_resolution"),
+    (re.compile(r"^recipient/[^/]+/children/$"), "recipient/{recipient_id}/children/", "entity_resolution"),
+    (re.compile(r"^awards/last_updated/$"), None, None),
+    (re.compile(r"^awards/(funding|funding_rollup|accounts)/$"), None, "award_details"),
+    (re.compile(r"^awards/[^/]+/$"), "awards/{award_id}/", "award_summary"),
+    (re.compile(r"^(transactions|subawards)/$"), None, "award_details"),
+    (re.compile(r"^idvs/amounts/[^/]+/$"), "idvs/amounts/{award_id}/", "award_details"),
+    (re.compile(r"^idvs/.+"), None, "award_details"),
+    (re.compile(r"^agency/[^/]+/$"), "agency/{toptier_code}/", "rollups"),
+    (
+        re.compile(r"^agency/[^/]+/(budgetary_resources|object_class|program_activity|federal_account)/$"),
+        r"agency/{toptier_code}/\1/",
+        "agency_accounts",
+    ),
+    (re.compile(r"^agency/[^/]+/([^/]+)/$"), r"agency/{toptier_code}/\1/", "rollups"),
+    (re.compile(r"^search/.+"), None, "rollups"),
+    (re.compile(r"^(spending|federal_obligations)/.*"), None, "rollups"),
+    (re.compile(r"^reporting/agencies/[^/]+/overview/$"), "reporting/agencies/{toptier_code}/overview/", None),
+]
+
+
+def _classify(endpoint: str) -> Tuple[str, Optional[str]]:
+    path = endpoint.strip("/") + "/"
+    for pattern, template, ttl_class in ENDPOINT_CLASSES:
+        match = pattern.match(path)
+        if match:
+            return (match.expand(template) if template else path), ttl_class
+    return path, None
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse IDs in a concrete endpoint, e.g. "awards/CONT_AWD_1/" -> "awards/{award_id}/"."""
+    return _classify(endpoint)[0]
+
+
+def get_cache_ttl_class(endpoint: str) -> Optional[str]:
+    """Return the caching_ttl_seconds class for an endpoint, or None if it is not cacheable."""
+    return _classify(endpoint)[1]
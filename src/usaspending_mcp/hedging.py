@@ -0,0 +1,93 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from usaspending_mcp.latency_tracker import LatencyTracker
+
+
+class HedgeBudget:
+    """
+    Caps hedged requests to a fraction of eligible requests: each eligible request
+    earns `ratio` credits (up to `burst`) and each hedge spends one.
+    """
+
+    def __init__(self, ratio: float = 0.05, burst: float = 5.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._credits = burst
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        with self._lock:
+            self._credits = min(self.burst, self._credits + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._credits < 1:
+                return False
+            self._credits -= 1
+            return True
+
+
+class HedgePolicy:
+    """
+    Decides whether, and after how long, a request is hedged: GETs to the configured
+    endpoint templates, after their recent p-th percentile latency (clamped).
+    """
+
+    def __init__(
+        self,
+        latency: LatencyTracker,
+        enabled: bool = True,
+        endpoints: Optional[List[str]] = None,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        min_delay_ms: float = 50.0,
+        max_delay_ms: float = 3000.0,
+        budget_ratio: float = 0.05,
+        budget_burst: float = 5.0
+    ):
+        self.latency = latency
+        self.enabled = enabled
+        # Templates (or template prefixes ending in "/") eligible for hedging
+        self.endpoints = endpoints or []
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay_ms / 1000
+        self.max_delay = max_delay_ms / 1000
+        self.budget = HedgeBudget(budget_ratio, budget_burst)
+
+        self.sent = 0
+        self.won = 0
+        self.denied = 0
+
+    @classmethod
+    def from_config(cls, latency: LatencyTracker, config: Dict[str, Any], enabled: bool = True) -> "HedgePolicy":
+        """Builds a policy from the router_rules "hedging" section."""
+        return cls(
+            latency,
+            enabled=enabled and config.get("enabled", True),
+            endpoints=config.get("endpoints", []),
+            percentile=config.get("percentile", 95.0),
+            min_samples=config.get("min_samples", 20),
+            min_delay_ms=config.get("min_delay_ms", 50.0),
+            max_delay_ms=config.get("max_delay_ms", 3000.0),
+            budget_ratio=config.get("budget_ratio", 0.05),
+            budget_burst=config.get("budget_burst", 5.0)
+        )
+
+    def _eligible(self, template: str) -> bool:
+        return any(template == e or (e.endswith("/") and template.startswith(e)) for e in self.endpoints)
+
+    def delay(self, method: str, template: str) -> Optional[float]:
+        """Seconds to wait before hedging this request, or None if it isn't hedged."""
+        if not self.enabled or method.upper() != "GET" or not self._eligible(template):
+            return None
+        self.budget.earn()
+        observed = self.latency.percentile(template, self.percentile, self.min_samples)
+        if observed is None:
+            # Not enough history to tell a slow response from a normal one
+            return None
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"sent": self.sent, "won": self.won, "budget_denied": self.denied}
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -9,7 +10,7 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.responses import JSONResponse
 from starlette.routing import Mount
 
-from usaspending_mcp.server import mcp
+from usaspending_mcp.server import cache, client, mcp, warm_caches
 
 # Initialize logger
 logger = logging.getLogger("uvicorn.error")
@@ -31,7 +32,14 @@ async def lifespan(app: FastAPI):
     # Note: mcp.session_manager is only available AFTER streamable_http_app() is called
     async with mcp.session_manager.run():
         logger.info("FastMCP Internal Server Started")
+        # Warm the catalog in the background so startup isn't blocked on USAspending
+        warmup = asyncio.create_task(warm_caches())
         yield
+        warmup.cancel()
+        await client.aclose()
+        snapshot_path = os.getenv("CACHE_SNAPSHOT_PATH")
+        if snapshot_path and os.getenv("CACHE_SNAPSHOT_SAVE", "false").lower() == "true":
+            logger.info(f"Saved {cache.save_snapshot(snapshot_path)} cache entries to snapshot {snapshot_path}")
         logger.info("FastMCP Internal Server Stopped")
 
 # -----------------------------------------------------------------------------
@@ -69,6 +77,10 @@ async def log_request_info(request: Request, call_next):
 async def healthz():
     return {"status": "ok"}
 
+@app.get("/metrics")
+async def metrics():
+    return {**client.metrics(), "cache": cache.stats()}
+
 @app.get("/")
 async def root():
     return {
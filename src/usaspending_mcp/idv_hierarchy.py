@@ -0,0 +1,237 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+from usaspending_mcp.award_types import FALLBACK_CONTRACT_CODES
+from usaspending_mcp.logging_config import get_logger
+from usaspending_mcp.request_context import current_request
+from usaspending_mcp.usaspending_client import APIError, USAspendingClient
+
+logger = get_logger("idv_hierarchy")
+
+# Group key that absorbs new agencies/recipients once max_groups distinct keys are tracked
+OTHER_GROUP = "(other)"
+ORDER_FIELDS = ["generated_unique_award_id", "piid", "awarding_agency", "obligated_amount", "description"]
+NOT_REPORTED = "(not reported)"
+# idvs/awards/ rows carry no recipient; child orders are looked up in spending_by_award in batches
+RECIPIENT_BATCH = 100
+RECIPIENT_FIELDS = ["Award ID", "Recipient Name", "generated_internal_id"]
+
+
+class IDVHierarchyCrawl:
+    """
+    Breadth-first crawl of an IDV's hierarchy through idvs/awards/: every page of child
+    orders and child IDVs, then the same for each child IDV, with `concurrency` IDVs
+    crawled at a time.
+
+    Orders are aggregated as they stream in (by level, awarding agency and recipient)
+    and only the top_n largest orders are kept, so memory depends on max_idvs and
+    max_groups, not on the size of the vehicle. idvs/awards/ doesn't report recipients,
+    so each batch of orders is matched against search/spending_by_award/ by PIID. The
+    crawl stops at the request deadline (or max_seconds) and reports what it had
+    aggregated so far.
+
+    Crawl pages bypass the response cache: they are one-off, and a large vehicle would
+    otherwise push hot entries out of it. Callers cache the rollup instead.
+    """
+
+    def __init__(
+        self,
+        client: USAspendingClient,
+        root_id: str,
+        request_id: Optional[str] = None,
+        concurrency: int = 4,
+        top_n: int = 10,
+        max_idvs: int = 500,
+        max_groups: int = 5000,
+        max_seconds: Optional[float] = None
+    ):
+        self.client = client
+        self.root_id = root_id
+        self.request_id = request_id
+        self.concurrency = max(1, concurrency)
+        self.top_n = top_n
+        self.max_idvs = max_idvs
+        self.max_groups = max_groups
+        self.max_seconds = max_seconds
+
+        self._queue: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
+        self._seen = {root_id}
+        # level -> [orders, child IDVs, obligated amount]
+        self._levels: Dict[int, List[float]] = {}
+        # name -> [orders, obligated amount]
+        self._agencies: Dict[str, List[float]] = {}
+        self._recipients: Dict[str, List[float]] = {}
+        # min-heap of (amount, seq, order) holding the top_n largest orders
+        self._top_orders: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = itertools.count()
+        self.pages = 0
+        self.errors: List[str] = []
+        self.stopped_reason: Optional[str] = None
+
+    def _level(self, level: int) -> List[float]:
+        return self._levels.setdefault(level, [0, 0, 0.0])
+
+    def _add_group(self, groups: Dict[str, List[float]], key: str, amount: float) -> None:
+        if key not in groups and len(groups) >= self.max_groups:
+            key = OTHER_GROUP
+        entry = groups.setdefault(key, [0, 0.0])
+        entry[0] += 1
+        entry[1] += amount
+
+    def _add_order(self, order: Dict[str, Any], level: int) -> None:
+        amount = float(order.get("obligated_amount") or 0)
+        stats = self._level(level)
+        stats[0] += 1
+        stats[2] += amount
+        self._add_group(self._agencies, order.get("awarding_agency") or "(unknown)", amount)
+
+        summary = {k: order.get(k) for k in ORDER_FIELDS} | {"recipient_name": None, "level": level}
+        item = (amount, next(self._seq), summary)
+        if len(self._top_orders) < self.top_n:
+            heapq.heappush(self._top_orders, item)
+        elif self.top_n > 0:
+            heapq.heappushpop(self._top_orders, item)
+
+    async def _fetch_recipients(self, orders: List[Dict[str, Any]]) -> Dict[str, str]:
+        """generated_unique_award_id -> recipient name for a batch of child orders."""
+        piids = sorted({order["piid"] for order in orders if order.get("piid")})
+        if not piids:
+            return {}
+        names = {}
+        rows = self.client.paginate(
+            "POST",
+            "search/spending_by_award/",
+            {"filters": {"award_ids": piids, "award_type_codes": FALLBACK_CONTRACT_CODES}, "fields": RECIPIENT_FIELDS},
+            request_id=self.request_id,
+            tool_name="idv_vehicle_bundle",
+            use_cache=False
+        )
+        async with rows:
+            async for row in rows:
+                if row.get("generated_internal_id") and row.get("Recipient Name"):
+                    names[row["generated_internal_id"]] = row["Recipient Name"]
+        return names
+
+    async def _add_recipients(self, idv_id: str, orders: List[Dict[str, Any]]) -> None:
+        try:
+            names = await self._fetch_recipients(orders)
+        except APIError as e:
+            # Orders are already counted; only their recipients go unreported
+            self._record_error(idv_id, e)
+            names = {}
+        for order in orders:
+            amount = float(order.get("obligated_amount") or 0)
+            self._add_group(self._recipients, names.get(order.get("generated_unique_award_id")) or NOT_REPORTED, amount)
+        for _, _, summary in self._top_orders:
+            if summary["generated_unique_award_id"] in names:
+                summary["recipient_name"] = names[summary["generated_unique_award_id"]]
+
+    def _add_child_idv(self, idv: Dict[str, Any], level: int) -> None:
+        self._level(level)[1] += 1
+        child_id = idv.get("generated_unique_award_id")
+        if not child_id or child_id in self._seen:
+            return
+        if len(self._seen) >= self.max_idvs:
+            self.stopped_reason = self.stopped_reason or "max_idvs"
+            return
+        self._seen.add(child_id)
+        self._queue.put_nowait((child_id, level))
+
+    async def _crawl_node(self, idv_id: str, level: int) -> None:
+        for child_type in ("child_idvs", "child_awards"):
+            pages = self.client.paginate(
+                "POST",
+                "idvs/awards/",
+                {"award_id": idv_id, "type": child_type, "sort": "obligated_amount", "order": "desc"},
+                request_id=self.request_id,
+                tool_name="idv_vehicle_bundle",
+                use_cache=False
+            )
+            batch: List[Dict[str, Any]] = []
+            try:
+                async with pages:
+                    async for record in pages:
+                        if child_type == "child_idvs":
+                            self._add_child_idv(record, level + 1)
+                            continue
+                        self._add_order(record, level + 1)
+                        batch.append(record)
+                        if len(batch) >= RECIPIENT_BATCH:
+                            await self._add_recipients(idv_id, batch)
+                            batch = []
+            finally:
+                self.pages += pages.pages
+            if batch:
+                await self._add_recipients(idv_id, batch)
+
+    def _record_error(self, idv_id: str, error: APIError) -> None:
+        # Keep crawling the rest; the result is marked incomplete
+        self.errors.append(f"{idv_id}: {error.message}")
+        if error.error_type == "deadline":
+            self.stopped_reason = "deadline"
+
+    async def _worker(self) -> None:
+        while True:
+            idv_id, level = await self._queue.get()
+            try:
+                await self._crawl_node(idv_id, level)
+            except APIError as e:
+                self._record_error(idv_id, e)
+            except Exception as e:
+                self.errors.append(f"{idv_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _remaining(self) -> Optional[float]:
+        ctx = current_request()
+        remaining = ctx.remaining() if ctx is not None else None
+        if self.max_seconds is not None:
+            remaining = self.max_seconds if remaining is None else min(remaining, self.max_seconds)
+        return remaining
+
+    def _top_groups(self, groups: Dict[str, List[float]]) -> List[Dict[str, Any]]:
+        top = heapq.nlargest(self.top_n, groups.items(), key=lambda item: item[1][1])
+        return [{"name": name, "orders": int(orders), "obligated_amount": round(amount, 2)} for name, (orders, amount) in top]
+
+    async def run(self) -> Dict[str, Any]:
+        self._queue.put_nowait((self.root_id, 0))
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.wait_for(self._queue.join(), self._remaining())
+        except asyncio.TimeoutError:
+            self.stopped_reason = "deadline"
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.stopped_reason is None and self.errors:
+            self.stopped_reason = "errors"
+        if self.stopped_reason:
+            logger.warning(
+                f"IDV hierarchy crawl of {self.root_id} incomplete ({self.stopped_reason})",
+                extra={"error_type": self.stopped_reason}
+            )
+
+        levels = sorted(self._levels.items())
+        return {
+            "totals": {
+                "orders": int(sum(stats[0] for _, stats in levels)),
+                "idvs": int(sum(stats[1] for _, stats in levels)),
+                "obligated_amount": round(sum(stats[2] for _, stats in levels), 2),
+                "levels": len(levels),
+                "pages": self.pages,
+            },
+            "by_level": [
+                {"level": level, "orders": int(orders), "idvs": int(idvs), "obligated_amount": round(amount, 2)}
+                for level, (orders, idvs, amount) in levels
+            ],
+            "top_agencies": self._top_groups(self._agencies),
+            "top_recipients": self._top_groups(self._recipients),
+            "top_orders": [order for _, _, order in sorted(self._top_orders, reverse=True)],
+            "complete": self.stopped_reason is None,
+            "stopped_reason": self.stopped_reason,
+            "errors": self.errors[:5],
+        }
@@ -0,0 +1,131 @@
+import bisect
+import math
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (bucket bounds grow by `growth`, ~10% error).
+    Once `max_samples` is reached every bucket is halved, so old samples decay
+    and percentiles follow recent behaviour.
+    """
+
+    def __init__(self, min_ms: float = 1.0, max_ms: float = 300_000.0, growth: float = 1.2, max_samples: int = 2000):
+        count = int(math.ceil(math.log(max_ms / min_ms, growth))) + 1
+        self.bounds: List[float] = [min_ms * growth ** i for i in range(count)]
+        self.counts: List[float] = [0.0] * (count + 1)  # last bucket: above max_ms
+        self.max_samples = max_samples
+        self.total = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.total += 1
+        if self.total >= self.max_samples:
+            self.counts = [c / 2 for c in self.counts]
+            self.total /= 2
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the p-th percentile, or None if empty."""
+        if self.total <= 0:
+            return None
+        target = self.total * p / 100.0
+        seen = 0.0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count > 0:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+
+class LatencyTracker:
+    """Thread-safe latency histograms per endpoint template."""
+
+    def __init__(self, max_samples: int = 2000):
+        self.max_samples = max_samples
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, template: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(template)
+            if histogram is None:
+                histogram = LatencyHistogram(max_samples=self.max_samples)
+                self._histograms[template] = histogram
+            histogram.record(seconds * 1000)
+
+    def percentile(self, template: str, p: float, min_samples: int = 1) -> Optional[float]:
+        """The p-th percentile latency in seconds, or None with fewer than min_samples samples."""
+        with self._lock:
+            histogram = self._histograms.get(template)
+            if histogram is None or histogram.total < min_samples:
+                return None
+            return histogram.percentile(p) / 1000
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                template: {
+                    "samples": int(h.total),
+                    "p50_ms": round(h.percentile(50), 1),
+                    "p95_ms": round(h.percentile(95), 1),
+                    "p99_ms": round(h.percentile(99), 1),
+                }
+                for template, h in sorted(self._histograms.items())
+                if h.total > 0
+            }
+
+
+class AdaptiveTimeout:
+    """
+    Per-template timeouts from observed latency: read timeout = p-th percentile x factor,
+    clamped to [floor, ceiling]. Templates without enough history get the ceiling.
+    """
+
+    def __init__(
+        self,
+        latency: LatencyTracker,
+        ceiling_seconds: float,
+        enabled: bool = True,
+        percentile: float = 99.9,
+        factor: float = 3.0,
+        min_samples: int = 50,
+        floor_seconds: float = 2.0,
+        connect_seconds: float = 5.0
+    ):
+        self.latency = latency
+        self.ceiling = ceiling_seconds
+        self.enabled = enabled
+        self.percentile = percentile
+        self.factor = factor
+        self.min_samples = min_samples
+        self.floor = min(floor_seconds, ceiling_seconds)
+        self.connect = min(connect_seconds, ceiling_seconds)
+
+    @classmethod
+    def from_config(
+        cls, latency: LatencyTracker, ceiling_seconds: float, config: Dict[str, Any], enabled: bool = True
+    ) -> "AdaptiveTimeout":
+        """Builds the policy from the router_rules "adaptive_timeouts" section."""
+        return cls(
+            latency,
+            ceiling_seconds,
+            enabled=enabled and config.get("enabled", True),
+            percentile=config.get("percentile", 99.9),
+            factor=config.get("factor", 3.0),
+            min_samples=config.get("min_samples", 50),
+            floor_seconds=config.get("floor_seconds", 2.0),
+            connect_seconds=config.get("connect_seconds", 5.0)
+        )
+
+    def read_timeout(self, template: str) -> float:
+        if not self.enabled:
+            return self.ceiling
+        observed = self.latency.percentile(template, self.percentile, self.min_samples)
+        if observed is None:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, observed * self.factor))
+
+    def connect_timeout(self, read_timeout: float) -> float:
+        # Connection setup doesn't depend on the endpoint; cap it separately
+        return min(self.connect, read_timeout)
@@ -25,6 +25,7 @@ class StructuredFormatter(logging.Formatter):
             "method": getattr(record, "method", None),
             "status_code": getattr(record, "status_code", None),
             "latency_ms": getattr(record, "latency_ms", None),
+            "queue_wait_ms": getattr(record, "queue_wait_ms", None),
             "cache_hit": getattr(record, "cache_hit", None),
             "error_type": getattr(record, "error_type", None),
             "circuit_state": getattr(record, "circuit_state", None),
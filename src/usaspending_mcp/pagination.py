@@ -0,0 +1,165 @@
+import asyncio
+import base64
+import binascii
+import json
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from usaspending_mcp.usaspending_client import USAspendingClient
+
+# Largest page most USAspending list endpoints accept
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Opaque, URL-safe cursor for keyset paging state."""
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True, default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Inverse of encode_cursor(). Raises ValueError for anything it didn't produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(state, dict):
+        raise ValueError("Malformed cursor")
+    return state
+
+
+class Paginator:
+    """
+    Streams records from a page/limit list endpoint (search/spending_by_award/,
+    transactions/, subawards/, idvs/awards/, ...).
+
+    Records are yielded lazily; while the caller consumes page N, page N+1 is already
+    being fetched. Iteration stops at the last page or once max_items / max_bytes
+    (JSON size of the yielded records) / max_pages is reached. Afterwards `truncated`
+    tells whether more records were available upstream.
+
+    Callers that may stop early (break out of `async for`) use it as an async context
+    manager, or call aclose(), so the prefetched page is cancelled right away:
+
+        async with client.paginate(...) as pages:
+            async for record in pages:
+                ...
+    """
+
+    def __init__(
+        self,
+        client: "USAspendingClient",
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        start_page: int = 1,
+        request_id: Optional[str] = None,
+        tool_name: str = "unknown",
+        use_cache: bool = True
+    ):
+        self.client = client
+        self.method = method
+        self.endpoint = endpoint
+        self.payload = payload
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.start_page = start_page
+        self.request_id = request_id
+        self.tool_name = tool_name
+        self.use_cache = use_cache
+
+        self.pages = 0
+        self.items = 0
+        self.bytes = 0
+        # page_metadata["total"] from the first page, when the endpoint reports it
+        self.total: Optional[int] = None
+        self.truncated = False
+        self._iterator: Optional[AsyncGenerator[Any, None]] = None
+
+    def _fetch(self, page: int) -> "asyncio.Task[Dict[str, Any]]":
+        payload = {**self.payload, "page": page, "limit": self.page_size}
+        return asyncio.ensure_future(
+            self.client.arequest(
+                self.method,
+                self.endpoint,
+                json_data=payload,
+                request_id=self.request_id,
+                tool_name=self.tool_name,
+                use_cache=self.use_cache
+            )
+        )
+
+    def _has_next(self, resp: Dict[str, Any], results: List[Any]) -> bool:
+        page_meta = resp.get("page_metadata") or {}
+        if "hasNext" in page_meta:
+            return bool(page_meta["hasNext"])
+        return len(results) >= self.page_size
+
+    def _budget_reached(self) -> bool:
+        return (
+            (self.max_items is not None and self.items >= self.max_items)
+            or (self.max_bytes is not None and self.bytes >= self.max_bytes)
+        )
+
+    def __aiter__(self) -> AsyncGenerator[Any, None]:
+        self._iterator = self._iterate()
+        return self._iterator
+
+    async def aclose(self) -> None:
+        """Stops iteration and cancels the prefetched page request, if any."""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+
+    async def __aenter__(self) -> "Paginator":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _iterate(self) -> AsyncGenerator[Any, None]:
+        page = self.start_page
+        pending = self._fetch(page)
+        try:
+            while pending is not None:
+                resp = await pending
+                pending = None
+                self.pages += 1
+                results = resp.get("results", [])
+                if self.total is None:
+                    self.total = (resp.get("page_metadata") or {}).get("total")
+
+                has_next = self._has_next(resp, results)
+                more_wanted = self.max_items is None or self.items + len(results) < self.max_items
+                if has_next and more_wanted and (self.max_pages is None or self.pages < self.max_pages):
+                    # Prefetch the next page while this one is consumed
+                    page += 1
+                    pending = self._fetch(page)
+
+                for record in results:
+                    if self._budget_reached():
+                        self.truncated = True
+                        return
+                    self.items += 1
+                    self.bytes += len(json.dumps(record, separators=(",", ":"), default=str))
+                    yield record
+
+                if has_next and (pending is None or self._budget_reached()):
+                    self.truncated = True
+                    return
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            elif pending is not None and not pending.cancelled():
+                pending.exception()  # mark retrieved
+
+    async def collect(self) -> List[Any]:
+        """All records within the budgets, as a list."""
+        async with self:
+            return [record async for record in self]
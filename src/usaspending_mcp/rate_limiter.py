@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from usaspending_mcp.endpoint_map import get_cache_ttl_class
+from usaspending_mcp.logging_config import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket: refills at `rate` tokens/second up to `burst`. Callers reserve a token
+    and are told how long to wait for it, so queued callers are served in order.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_factor(self, factor: float) -> None:
+        """Scales the refill rate (used to slow down while throttled)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = self.base_rate * factor
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds until it is available (0 if now)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Returns a reserved token whose caller gave up before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class RateLimiter:
+    """
+    Client-side limiter in front of USAspending: a global bucket plus optional
+    per-endpoint-class buckets (classes from endpoint_map).
+
+    429s halve the request rate (down to min_factor) and a Retry-After pauses all
+    requests until it passes; each success recovers the rate a little. Thread-safe,
+    so the sync bridge loop and the server loop share one budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        class_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        min_factor: float = 0.1,
+        recovery_step: float = 0.05,
+        max_retry_after: float = 60.0
+    ):
+        self._global = TokenBucket(rate, burst)
+        self._classes = {name: TokenBucket(r, b) for name, (r, b) in (class_limits or {}).items()}
+        self.min_factor = min_factor
+        self.recovery_step = recovery_step
+        self.max_retry_after = max_retry_after
+
+        self._lock = threading.Lock()
+        self.factor = 1.0
+        self._paused_until = 0.0
+
+        self.acquired = 0
+        self.queued = 0
+        self.total_wait_s = 0.0
+        self.throttled = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RateLimiter":
+        """Builds a limiter from the router_rules "rate_limits" section."""
+        class_limits = {
+            name: (limits["requests_per_second"], limits.get("burst", limits["requests_per_second"]))
+            for name, limits in config.get("endpoint_classes", {}).items()
+        }
+        return cls(
+            rate=config["requests_per_second"],
+            burst=config.get("burst", config["requests_per_second"]),
+            class_limits=class_limits,
+            max_retry_after=config.get("max_retry_after_seconds", 60.0)
+        )
+
+    async def acquire(self, endpoint: str) -> float:
+        """Waits for permission to send a request to endpoint. Returns seconds spent queued."""
+        start = time.monotonic()
+        paused = self._paused_until - start
+        if paused > 0:
+            await asyncio.sleep(paused)
+
+        reserved = [self._global]
+        wait = self._global.reserve()
+        bucket = self._classes.get(get_cache_ttl_class(endpoint))
+        if bucket is not None:
+            reserved.append(bucket)
+            wait = max(wait, bucket.reserve())
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # Abandoned while queued (e.g. its deadline passed): the tokens go back
+                for reserved_bucket in reserved:
+                    reserved_bucket.refund()
+                raise
+
+        if paused <= 0 and wait <= 0:
+            with self._lock:
+                self.acquired += 1
+            return 0.0
+
+        waited = time.monotonic() - start
+        with self._lock:
+            self.acquired += 1
+            self.queued += 1
+            self.total_wait_s += waited
+        return waited
+
+    def _apply_factor(self, factor: float) -> None:
+        self.factor = factor
+        self._global.set_factor(factor)
+        for bucket in self._classes.values():
+            bucket.set_factor(factor)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Called on a 429: slow down, and pause everyone until Retry-After passes."""
+        with self._lock:
+            self.throttled += 1
+            self._apply_factor(max(self.min_factor, self.factor * 0.5))
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, time.monotonic() + min(retry_after, self.max_retry_after))
+        logger.warning(
+            f"USAspending throttled; request rate now {self.factor:.0%} of configured",
+            extra={"error_type": "rate_limit"}
+        )
+
+    def on_success(self) -> None:
+        if self.factor >= 1.0:
+            return
+        with self._lock:
+            self._apply_factor(min(1.0, self.factor + self.recovery_step))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_factor": round(self.factor, 3),
+                "acquired": self.acquired,
+                "queued": self.queued,
+                "total_wait_ms": round(self.total_wait_s * 1000, 1),
+                "throttled": self.throttled,
+            }
@@ -0,0 +1,276 @@
+import json
+import os
+import socket
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+from usaspending_mcp.cache_store import StoredRow
+from usaspending_mcp.logging_config import get_logger
+
+logger = get_logger("redis_store")
+
+RESPReply = Union[None, int, bytes, str, List[Any]]
+
+# Value encoding: version byte, flags byte, stored_at/expires_at/stale_until (3 doubles), JSON body.
+_HEADER = struct.Struct(">BBddd")
+_FORMAT_VERSION = 1
+_FLAG_ZLIB = 0x01
+# Bodies shorter than this are stored uncompressed; zlib overhead isn't worth it.
+_COMPRESS_MIN_BYTES = 512
+
+
+class RESPError(Exception):
+    """Error reply from the server or a malformed response."""
+
+
+def encode_value(value: Any, stored_at: float, expires_at: float, stale_until: float) -> bytes:
+    """Compact binary encoding of a cache row: fixed header + (optionally zlib'd) JSON."""
+    body = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    flags = 0
+    if len(body) >= _COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(body, 6)
+        if len(compressed) < len(body):
+            body, flags = compressed, _FLAG_ZLIB
+    return _HEADER.pack(_FORMAT_VERSION, flags, stored_at, expires_at, stale_until) + body
+
+
+def decode_value(data: bytes) -> Optional[StoredRow]:
+    """Inverse of encode_value(); returns None for rows written in an unknown format."""
+    if len(data) < _HEADER.size:
+        return None
+    version, flags, stored_at, expires_at, stale_until = _HEADER.unpack_from(data)
+    if version != _FORMAT_VERSION:
+        return None
+    body = data[_HEADER.size:]
+    if flags & _FLAG_ZLIB:
+        body = zlib.decompress(body)
+    return json.loads(body), stored_at, expires_at, stale_until
+
+
+class RESPClient:
+    """
+    Minimal blocking Redis protocol (RESP2) client: one connection, one command at a time.
+    Only what the cache needs; thread-safe through a lock around each round trip.
+    """
+
+    def __init__(self, host: str, port: int = 6379, db: int = 0, password: Optional[str] = None, timeout: float = 0.25):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.25) -> "RESPClient":
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        password = unquote(parsed.password) if parsed.password else None
+        return cls(parsed.hostname or "localhost", parsed.port or 6379, db=db, password=password, timeout=timeout)
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self._round_trip(("AUTH", self.password))
+        if self.db:
+            self._round_trip(("SELECT", self.db))
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._file = None
+
+    def execute(self, *args: Union[str, bytes, int, float]) -> RESPReply:
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                return self._round_trip(args)
+            except (OSError, RESPError):
+                # The connection may be mid-reply; never reuse it.
+                self._close()
+                raise
+
+    def _round_trip(self, args) -> RESPReply:
+        self._sock.sendall(self._pack(args))
+        reply = self._read_reply()
+        if isinstance(reply, RESPError):
+            raise reply
+        return reply
+
+    @staticmethod
+    def _pack(args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    def _read_line(self) -> bytes:
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise RESPError("Connection closed by server")
+        return line[:-2]
+
+    def _read_reply(self) -> Union[RESPReply, RESPError]:
+        line = self._read_line()
+        prefix, rest = line[:1], line[1:]
+        if prefix == b"+":
+            return rest.decode("utf-8")
+        if prefix == b"-":
+            return RESPError(rest.decode("utf-8"))
+        if prefix == b":":
+            return int(rest)
+        if prefix == b"$":
+            length = int(rest)
+            if length == -1:
+                return None
+            data = self._file.read(length + 2)
+            if len(data) != length + 2:
+                raise RESPError("Connection closed by server")
+            return data[:-2]
+        if prefix == b"*":
+            count = int(rest)
+            if count == -1:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RESPError(f"Unexpected reply prefix: {prefix!r}")
+
+
+class RedisCacheStore:
+    """
+    Shared remote tier for cache.Cache, reached over the Redis protocol.
+
+    Rows use the compact binary encoding above and expire server-side at the end of
+    their stale window. Failures are logged and treated as misses; after an error the
+    store stays offline for retry_after_seconds so a dead server doesn't stall requests.
+    """
+
+    def __init__(
+        self,
+        client: RESPClient,
+        prefix: str = "usaspending:cache:v1:",
+        retry_after_seconds: float = 30.0,
+        scan_count: int = 500
+    ):
+        self.client = client
+        self.prefix = prefix
+        # Keys requested per SCAN/MGET batch
+        self.scan_count = scan_count
+        self.retry_after_seconds = retry_after_seconds
+        self._offline_until = 0.0
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheStore":
+        timeout = float(os.getenv("CACHE_REDIS_TIMEOUT_S", "0.25"))
+        return cls(RESPClient.from_url(url, timeout=timeout), prefix=os.getenv("CACHE_REDIS_PREFIX", "usaspending:cache:v1:"))
+
+    def _call(self, *args) -> Tuple[bool, RESPReply]:
+        """Runs a command; returns (ok, reply). Never raises."""
+        if time.time() < self._offline_until:
+            return False, None
+        try:
+            return True, self.client.execute(*args)
+        except (OSError, RESPError) as e:
+            self.errors += 1
+            self._offline_until = time.time() + self.retry_after_seconds
+            logger.warning(f"Remote cache unavailable, bypassing for {self.retry_after_seconds}s: {e}")
+            return False, None
+
+    def _scan(self) -> Iterator[List[bytes]]:
+        """Yields batches of keys under the prefix."""
+        cursor = "0"
+        while True:
+            ok, reply = self._call("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", self.scan_count)
+            if not ok:
+                return
+            cursor, keys = reply[0], reply[1]
+            if keys:
+                yield keys
+            if cursor in (b"0", "0"):
+                return
+
+    def get(self, key: str) -> Optional[StoredRow]:
+        ok, data = self._call("GET", self.prefix + key)
+        if not ok or data is None:
+            return None
+        row = decode_value(data)
+        if row is None or row[3] <= time.time():
+            return None
+        return row
+
+    def set(self, key: str, value: Any, stored_at: float, expires_at: float, stale_until: float) -> bool:
+        try:
+            data = encode_value(value, stored_at, expires_at, stale_until)
+        except (TypeError, ValueError):
+            return False
+        ttl_ms = int((stale_until - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return False
+        ok, _ = self._call("SET", self.prefix + key, data, "PX", ttl_ms)
+        return ok
+
+    def delete(self, key: str) -> None:
+        self._call("DEL", self.prefix + key)
+
+    def items(self, limit: Optional[int] = None) -> Iterator[Tuple[str, StoredRow]]:
+        """
+        Live rows, most recently stored first. The scan stops once `limit` rows are
+        found, so with a limit these are the newest of the rows scanned, not of the
+        whole keyspace.
+        """
+        rows = []
+        now = time.time()
+        for keys in self._scan():
+            ok, values = self._call("MGET", *keys)
+            if not ok:
+                break
+            for raw_key, data in zip(keys, values, strict=True):
+                row = decode_value(data) if data is not None else None
+                if row is not None and row[3] > now:
+                    rows.append((raw_key.decode("utf-8")[len(self.prefix):], row))
+            if limit is not None and len(rows) >= limit:
+                break
+        rows.sort(key=lambda item: item[1][1], reverse=True)
+        return iter(rows if limit is None else rows[:limit])
+
+    def purge(self) -> int:
+        """Nothing to do: the server expires rows at the end of their stale window."""
+        return 0
+
+    def count(self) -> int:
+        """Number of keys under the prefix (a full SCAN; not used on hot paths)."""
+        return sum(len(keys) for keys in self._scan())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "online": time.time() >= self._offline_until,
+            "errors": self.errors,
+        }
+
+    def clear(self) -> None:
+        for keys in self._scan():
+            self._call("DEL", *keys)
+
+    def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,83 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+
+class RequestContext:
+    """
+    Bookkeeping for a single tool call, shared by the client and the response envelope.
+    Concurrent sub-requests (asyncio tasks) inherit the same instance.
+    """
+
+    def __init__(self, deadline_ms: Optional[float] = None):
+        # time.monotonic() by which the tool call must finish; None means unbounded
+        self.deadline: Optional[float] = None
+        if deadline_ms is not None:
+            self.set_deadline(deadline_ms)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Age of the oldest stale response served in degraded mode, if any
+        self.stale_age_seconds: Optional[float] = None
+        self.stale_responses = 0
+
+    def set_deadline(self, deadline_ms: float) -> None:
+        self.deadline = time.monotonic() + deadline_ms / 1000
+
+    def extend_deadline(self, deadline: Optional[float]) -> None:
+        """Pushes the deadline out to `deadline` (monotonic; None = unbounded). Never shortens it."""
+        if self.deadline is not None:
+            self.deadline = None if deadline is None else max(self.deadline, deadline)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (never negative), or None if there is none."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def record_cache(self, hit: bool) -> None:
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def record_stale(self, age_seconds: float) -> None:
+        self.stale_responses += 1
+        self.stale_age_seconds = max(self.stale_age_seconds or 0.0, age_seconds)
+
+    def meta(self) -> Dict[str, Any]:
+        """Fields merged into the response meta by response.ok()."""
+        meta: Dict[str, Any] = {}
+        if self.cache_hits or self.cache_misses:
+            meta["cache_hit"] = self.cache_misses == 0
+            meta["upstream_cache"] = {"hits": self.cache_hits, "misses": self.cache_misses}
+        if self.stale_age_seconds is not None:
+            meta["warnings"] = ["stale_data"]
+            meta["stale_data_age_seconds"] = int(self.stale_age_seconds)
+        return meta
+
+
+_request_context_var: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+@contextmanager
+def request_scope(deadline_ms: Optional[float] = None):
+    """Start a request context for the duration of a tool call, optionally with a deadline."""
+    ctx = RequestContext(deadline_ms)
+    token = _request_context_var.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _request_context_var.reset(token)
+
+
+def current_request() -> Optional[RequestContext]:
+    return _request_context_var.get()
+
+
+def bind_request(ctx: Optional[RequestContext]) -> None:
+    """Makes ctx the current request context (e.g. inside a contextvars.Context for a new task)."""
+    _request_context_var.set(ctx)
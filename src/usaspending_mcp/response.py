@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
+from usaspending_mcp.request_context import current_request
+
 TOOL_VERSION = "1.0"
 
 TRIMMABLE_KEYS = ["results", "transactions", "subawards", "orders", "activity", "groups"]
@@ -21,6 +23,7 @@ REMEDIATION_HINTS = {
         "missing_required_filter": "At least one filter required: agency, recipient, time_period, or award_type",
         "invalid_scope_mode": "Valid scope_modes: 'all_awards', 'contracts_only', 'assistance_only'",
         "award_id_required": "award_explain requires an award_id. Use award_search first to find award IDs.",
+        "invalid_cursor": "Pass next_cursor from the previous award_search page unchanged, with the same filters, sort and order.",
         "idv_not_in_scope": "IDV tools not available for assistance_only scope. Use scope_mode='contracts_only' or 'all_awards'.",
         "default": "Check your input parameters."
     },
@@ -31,6 +34,9 @@ REMEDIATION_HINTS = {
         "default": "USAspending API returned an error. Try again or simplify your query.",
         "timeout": "Request timed out. Try a narrower time_period or fewer filters.",
     },
+    "deadline": {
+        "default": "The question ran out of time (max_wall_ms). Narrow the time_period or filters, or allow more time.",
+    },
     "network": {
         "default": "Network error connecting to USAspending. Check connectivity and retry.",
     },
@@ -157,6 +163,15 @@ def ok(
     truncation_meta = None
     if apply_trimming:
         data, truncation_meta = trim_payload(data)
+
+    # Upstream bookkeeping for this tool call (e.g. response cache hits); explicit extras win.
+    ctx = current_request()
+    if ctx is not None:
+        ctx_meta = ctx.meta()
+        ctx_warnings = ctx_meta.pop("warnings", [])
+        if ctx_warnings:
+            warnings = list(warnings or []) + [w for w in ctx_warnings if w not in (warnings or [])]
+        meta_extras = {**ctx_meta, **meta_extras}
         
     return {
         "tool_version": TOOL_VERSION,
@@ -0,0 +1,60 @@
+import threading
+from typing import Any, Dict
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries: each upstream request earns `ratio` retry credits
+    (up to `burst`) and each retry spends one, so retries stay near `ratio` of
+    request volume. When USAspending browns out the credits run dry and requests
+    fail fast instead of multiplying the load.
+    """
+
+    def __init__(self, ratio: float = 0.1, burst: float = 10.0, enabled: bool = True):
+        self.ratio = ratio
+        self.burst = burst
+        self.enabled = enabled
+        self._credits = burst
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], enabled: bool = True) -> "RetryBudget":
+        """Builds a budget from the router_rules "retry_budget" section."""
+        return cls(
+            ratio=config.get("ratio", 0.1),
+            burst=config.get("burst", 10.0),
+            enabled=enabled and config.get("enabled", True)
+        )
+
+    def earn(self) -> None:
+        """Called once per upstream request (not per attempt)."""
+        with self._lock:
+            self.requests += 1
+            self._credits = min(self.burst, self._credits + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Takes a credit for one retry. False means the retry should not happen."""
+        with self._lock:
+            if not self.enabled:
+                self.retries += 1
+                return True
+            if self._credits < 1:
+                self.denied += 1
+                return False
+            self._credits -= 1
+            self.retries += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "credits": round(self._credits, 2),
+                "requests": self.requests,
+                "retries": self.retries,
+                "denied": self.denied,
+            }
@@ -2,14 +2,17 @@ import json
 import os
 import re
 import time
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 from usaspending_mcp.award_types import SCOPE_ASSISTANCE_ONLY, infer_scope_mode
 from usaspending_mcp.cache import Cache
+from usaspending_mcp.request_context import current_request, request_scope
 from usaspending_mcp.response import fail, trim_payload
 from usaspending_mcp.tools.agency_portfolio import AgencyPortfolioTool
 from usaspending_mcp.tools.award_explain import AwardExplainTool
 from usaspending_mcp.tools.award_search import AwardSearchTool
+from usaspending_mcp.tools.bootstrap_catalog import BootstrapCatalogTool
 from usaspending_mcp.tools.idv_vehicle_bundle import IDVVehicleBundleTool
 from usaspending_mcp.tools.recipient_profile import RecipientProfileTool
 
@@ -18,7 +21,6 @@ from usaspending_mcp.tools.resolve_entities import ResolveEntitiesTool
 from usaspending_mcp.tools.spending_rollups import SpendingRollupsTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
-
 # Thin field list for the orchestrator path — omits "Description" to save tokens.
 THIN_FIELDS = [
     "Award ID",
@@ -31,20 +33,21 @@ THIN_FIELDS = [
 
 
 class Router:
-    def __init__(self, client: USAspendingClient, cache: Cache):
+    def __init__(self, client: USAspendingClient, cache: Cache, catalog: Optional[BootstrapCatalogTool] = None):
         self.client = client
         self.cache = cache
         self.rules = self._load_rules()
         
         # Tools initialized here for direct access
         self.tools = {
-            "resolve_entities": ResolveEntitiesTool(client, cache),
+            # Share the server's catalog so there is one agency index, rebuilt on refresh
+            "resolve_entities": ResolveEntitiesTool(client, cache, catalog=catalog),
             "award_search": AwardSearchTool(client),
             "award_explain": AwardExplainTool(client),
             "spending_rollups": SpendingRollupsTool(client),
             "recipient_profile": RecipientProfileTool(client, cache),
             "agency_portfolio": AgencyPortfolioTool(client),
-            "idv_vehicle_bundle": IDVVehicleBundleTool(client)
+            "idv_vehicle_bundle": IDVVehicleBundleTool(client, cache)
         }
 
     def _load_rules(self) -> Dict[str, Any]:
@@ -126,10 +129,12 @@ class Router:
              
         return signals
 
-    def route_request(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
-        request_id = request_id or f"req-{int(time.time())}"
-        start_time = time.time()
-        
+    def _plan(self, question: str, debug: bool, request_id: str) -> Dict[str, Any]:
+        """
+        Selects a route for the question and builds the tool call.
+        Returns a plan dict with "tool_name", "scope_mode" and "kwargs" (None when the
+        route has nothing to execute), or "response" when routing short-circuits.
+        """
         signals = self._extract_signals(question)
         scope_mode = signals["scope_mode"]
         
@@ -184,129 +189,189 @@ class Router:
         # Budget Check
         estimated_cost = selected_route.get("cost_hint", 1)
         if estimated_cost > budgets["max_usaspending_requests"]:
-             return fail(
-                 "budget_exceeded", 
-                 "Refinement required: Request is too broad or complex.", 
-                 request_id,
-                 meta_additions={"refinement_suggestion": "Please provide a specific Award ID or narrow your search."}
-             )
+             return {
+                 "response": fail(
+                     "budget_exceeded", 
+                     "Refinement required: Request is too broad or complex.", 
+                     request_id,
+                     meta_additions={"refinement_suggestion": "Please provide a specific Award ID or narrow your search."}
+                 )
+             }
 
-        # EXECUTION
-        result = {}
-        
-        try:
-            if tool_name == "spending_rollups":
-                # Default behavior: group by agency if unspecified
-                group_by = signals["agency_type_hint"] # Use inferred agency type (awarding or funding)
-                if "recipient" in question.lower():
-                    group_by = "recipient"
-                if "state" in question.lower():
-                    group_by = "state"
-                
-                # Determine metric
-                metric = self.rules.get("design_decisions", {}).get("default_metric", "obligations")
-                metric_map = self.rules.get("design_decisions", {}).get("metric_by_award_type", {})
-                
-                # Simple logic: if assistance only and 'loan' is mentioned, use face_value?
-                # Or map based on scope mode?
-                # If scope_mode is assistance_only, we might default to obligations unless specifically loan?
-                # If "loan" in question, use face_value_of_loan.
-                if "loan" in question.lower():
-                    metric = metric_map.get("loans", metric)
-                elif "grant" in question.lower():
-                    metric = metric_map.get("grants", metric)
-                elif "contract" in question.lower():
-                    metric = metric_map.get("contracts", metric)
-                
-                result = self.tools["spending_rollups"].execute(
-                    scope_mode=scope_mode,
-                    group_by=group_by,
-                    top_n=self.rules["defaults"]["spending_rollups"]["top_n_default"],
-                    metric=metric,
-                    debug=debug,
-                    request_id=request_id
-                )
-                
-            elif tool_name == "idv_vehicle_bundle":
-                result = self.tools["idv_vehicle_bundle"].execute(
-                    idv_award_id=signals["award_id"],
-                    scope_mode=scope_mode,
-                    request_id=request_id
-                )
-                
-            elif tool_name == "award_explain":
-                result = self.tools["award_explain"].execute(
-                    award_id=signals["award_id"],
-                    scope_mode=scope_mode,
-                    debug=debug,
-                    request_id=request_id
-                )
+        return {
+            "tool_name": tool_name,
+            "scope_mode": scope_mode,
+            "kwargs": self._build_tool_kwargs(tool_name, signals, question, debug, request_id)
+        }
 
-            elif tool_name == "award_search":
-                filters = {"keywords": [question]}
-                result = self.tools["award_search"].execute(
-                    filters=filters,
-                    fields=THIN_FIELDS,
-                    limit=self.rules["defaults"]["award_search"]["limit_default"],
-                    scope_mode=scope_mode,
-                    debug=debug,
-                    request_id=request_id
-                )
-                
-            elif tool_name == "resolve_entities":
-                q_clean = question.replace("Resolve:", "").replace("resolve", "").strip()
-                result = self.tools["resolve_entities"].execute(
-                    q=q_clean,
-                    types=["agency", "recipient", "psc", "naics", "assistance_listing"], 
-                    request_id=request_id
-                )
-            
-            elif tool_name == "recipient_profile":
-                # Extracted recipient hint logic or simple text
-                recipient_text = question # Simplified
-                result = self.tools["recipient_profile"].execute(
-                    recipient=recipient_text,
-                    scope_mode=scope_mode,
-                    request_id=request_id
-                )
+    def _build_tool_kwargs(
+        self,
+        tool_name: str,
+        signals: Dict[str, Any],
+        question: str,
+        debug: bool,
+        request_id: str
+    ) -> Optional[Dict[str, Any]]:
+        scope_mode = signals["scope_mode"]
 
-            elif tool_name == "agency_portfolio":
-                # Needs resolution first usually, but for stub:
-                # result = self.tools["agency_portfolio"].execute(...)
-                pass
+        if tool_name == "spending_rollups":
+            # Default behavior: group by agency if unspecified
+            group_by = signals["agency_type_hint"] # Use inferred agency type (awarding or funding)
+            if "recipient" in question.lower():
+                group_by = "recipient"
+            if "state" in question.lower():
+                group_by = "state"
+            
+            # Determine metric
+            metric = self.rules.get("design_decisions", {}).get("default_metric", "obligations")
+            metric_map = self.rules.get("design_decisions", {}).get("metric_by_award_type", {})
+            
+            # Simple logic: if assistance only and 'loan' is mentioned, use face_value?
+            # Or map based on scope mode?
+            # If scope_mode is assistance_only, we might default to obligations unless specifically loan?
+            # If "loan" in question, use face_value_of_loan.
+            if "loan" in question.lower():
+                metric = metric_map.get("loans", metric)
+            elif "grant" in question.lower():
+                metric = metric_map.get("grants", metric)
+            elif "contract" in question.lower():
+                metric = metric_map.get("contracts", metric)
+            
+            return dict(
+                scope_mode=scope_mode,
+                group_by=group_by,
+                top_n=self.rules["defaults"]["spending_rollups"]["top_n_default"],
+                metric=metric,
+                debug=debug,
+                request_id=request_id
+            )
+            
+        if tool_name == "idv_vehicle_bundle":
+            return dict(
+                idv_award_id=signals["award_id"],
+                scope_mode=scope_mode,
+                request_id=request_id
+            )
+            
+        if tool_name == "award_explain":
+            return dict(
+                award_id=signals["award_id"],
+                scope_mode=scope_mode,
+                debug=debug,
+                request_id=request_id
+            )
 
+        if tool_name == "award_search":
+            filters = {"keywords": [question]}
+            return dict(
+                filters=filters,
+                fields=THIN_FIELDS,
+                limit=self.rules["defaults"]["award_search"]["limit_default"],
+                scope_mode=scope_mode,
+                debug=debug,
+                request_id=request_id
+            )
             
-            # Unwrap the tool response to avoid double-wrapping.
-            # Tool responses from ok() have: {"tool_version", "meta", ...data_keys}
-            # We extract data keys and merge into a single flat envelope.
-            tool_meta = result.pop("meta", {})
-            result.pop("tool_version", None)
+        if tool_name == "resolve_entities":
+            q_clean = question.replace("Resolve:", "").replace("resolve", "").strip()
+            return dict(
+                q=q_clean,
+                types=["agency", "recipient", "psc", "naics", "assistance_listing"], 
+                request_id=request_id
+            )
+        
+        if tool_name == "recipient_profile":
+            # Extracted recipient hint logic or simple text
+            recipient_text = question # Simplified
+            return dict(
+                recipient=recipient_text,
+                scope_mode=scope_mode,
+                request_id=request_id
+            )
+
+        # agency_portfolio needs resolution first usually, but for stub there is nothing to run.
+        return None
 
-            # Merge router-level metadata into the tool's meta
-            tool_meta["route_name"] = tool_name
-            tool_meta["budgets_used"] = {"wall_ms": (time.time() - start_time) * 1000}
+    def _finalize(self, result: Dict[str, Any], tool_name: str, scope_mode: str, start_time: float) -> Dict[str, Any]:
+        # Unwrap the tool response to avoid double-wrapping.
+        # Tool responses from ok() have: {"tool_version", "meta", ...data_keys}
+        # We extract data keys and merge into a single flat envelope.
+        tool_meta = result.pop("meta", {})
+        result.pop("tool_version", None)
 
-            # Apply Output Policy (Summary First & Trimming)
-            max_bytes = self.rules["budgets"]["max_response_bytes"]
-            max_items = self.rules["budgets"]["max_items_per_list"]
+        # Merge router-level metadata into the tool's meta
+        tool_meta["route_name"] = tool_name
+        tool_meta["budgets_used"] = {"wall_ms": (time.time() - start_time) * 1000}
 
-            trimmed_result, truncation_info = trim_payload(result, max_bytes, max_items)
-            if truncation_info:
-                tool_meta["truncated"] = True
-                tool_meta["truncation"] = truncation_info
+        # Apply Output Policy (Summary First & Trimming)
+        max_bytes = self.rules["budgets"]["max_response_bytes"]
+        max_items = self.rules["budgets"]["max_items_per_list"]
+
+        trimmed_result, truncation_info = trim_payload(result, max_bytes, max_items)
+        if truncation_info:
+            tool_meta["truncated"] = True
+            tool_meta["truncation"] = truncation_info
+
+        return {
+            "tool_version": "1.0",
+            "meta": tool_meta,
+            "plan": {
+                "scope_mode": scope_mode,
+                "actions": [tool_name]
+            },
+            **trimmed_result
+        }
 
-            return {
-                "tool_version": "1.0",
-                "meta": tool_meta,
-                "plan": {
-                    "scope_mode": scope_mode,
-                    "actions": [tool_name]
-                },
-                **trimmed_result
-            }
+    @contextmanager
+    def _wall_budget(self) -> Iterator[None]:
+        """Bounds the routed tool call by budgets.max_wall_ms unless the caller already set a deadline."""
+        max_wall_ms = self.rules["budgets"]["max_wall_ms"]
+        ctx = current_request()
+        if ctx is None:
+            with request_scope(max_wall_ms):
+                yield
+            return
+        if ctx.deadline is None:
+            ctx.set_deadline(max_wall_ms)
+        yield
+
+    def route_request(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
+        request_id = request_id or f"req-{int(time.time())}"
+        start_time = time.time()
+        
+        plan = self._plan(question, debug, request_id)
+        if "response" in plan:
+            return plan["response"]
 
+        # EXECUTION (same wall-time budget as aroute_request)
+        try:
+            result = {}
+            if plan["kwargs"] is not None:
+                with self._wall_budget():
+                    result = self.tools[plan["tool_name"]].execute(**plan["kwargs"])
+            return self._finalize(result, plan["tool_name"], plan["scope_mode"], start_time)
+        except Exception as e:
+            return fail("unknown", str(e), request_id)
+
+    async def aroute_request(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
+        request_id = request_id or f"req-{int(time.time())}"
+        start_time = time.time()
+        
+        plan = self._plan(question, debug, request_id)
+        if "response" in plan:
+            return plan["response"]
+
+        try:
+            result = {}
+            if plan["kwargs"] is not None:
+                with self._wall_budget():
+                    result = await self.tools[plan["tool_name"]].aexecute(**plan["kwargs"])
+            return self._finalize(result, plan["tool_name"], plan["scope_mode"], start_time)
         except Exception as e:
             return fail("unknown", str(e), request_id)
 
     def execute(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
         return self.route_request(question, debug, request_id)
+
+    async def aexecute(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
+        return await self.aroute_request(question, debug, request_id)
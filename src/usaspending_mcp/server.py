@@ -1,10 +1,13 @@
+import asyncio
 import os
 import uuid
 
 from mcp.server.fastmcp import FastMCP
 
 from usaspending_mcp.cache import Cache
+from usaspending_mcp.cache_store import store_from_env
 from usaspending_mcp.logging_config import get_logger, log_context, setup_logging
+from usaspending_mcp.request_context import request_scope
 from usaspending_mcp.router import Router
 from usaspending_mcp.tools.agency_portfolio import AgencyPortfolioTool
 from usaspending_mcp.tools.answer_award_spending_question import AnswerAwardSpendingQuestionTool
@@ -23,22 +26,56 @@ setup_logging()
 logger = get_logger("server")
 
 # Initialize Shared Dependencies
-client = USAspendingClient()
-cache = Cache()
-router = Router(client, cache)
+# Optional persistent L2 (CACHE_L2_PATH) and startup snapshot (CACHE_SNAPSHOT_PATH) let new instances
+# start warm; both are loaded by warm_caches() at server startup, not at import.
+cache = Cache(l2=store_from_env())
+client = USAspendingClient(cache=cache)
+bootstrap_tool = BootstrapCatalogTool(client, cache)
+router = Router(client, cache, catalog=bootstrap_tool)
+# Default deadline for a tool call; query tools accept max_wall_ms to override it.
+MAX_WALL_MS = router.rules["budgets"]["max_wall_ms"]
 
 # Initialize Tool Instances
-bootstrap_tool = BootstrapCatalogTool(client, cache)
-resolve_tool = ResolveEntitiesTool(client, cache)
+resolve_tool = ResolveEntitiesTool(client, cache, catalog=bootstrap_tool)
 search_tool = AwardSearchTool(client)
 explain_tool = AwardExplainTool(client)
 rollups_tool = SpendingRollupsTool(client)
 recipient_tool = RecipientProfileTool(client, cache)
 agency_tool = AgencyPortfolioTool(client)
-idv_tool = IDVVehicleBundleTool(client)
+idv_tool = IDVVehicleBundleTool(client, cache)
 freshness_tool = DataFreshnessTool(client)
 orchestrator_tool = AnswerAwardSpendingQuestionTool(router)
 
+def warm_cache_from_storage() -> None:
+    """Fills L1 from the L2 store and the startup snapshot (blocking I/O; run in a thread)."""
+    loaded = cache.warm_from_l2()
+    if loaded:
+        logger.info(f"Loaded {loaded} cache entries from the L2 store")
+    snapshot_path = os.getenv("CACHE_SNAPSHOT_PATH")
+    if snapshot_path and os.path.exists(snapshot_path):
+        logger.info(f"Loaded {cache.load_snapshot(snapshot_path)} cache entries from snapshot {snapshot_path}")
+
+async def warm_caches() -> None:
+    """
+    Loads stored cache entries, then the bootstrap catalog, at startup so no user
+    request pays the cold fetch; afterwards the catalog is kept warm by
+    stale-while-revalidate and refresh-ahead.
+    """
+    try:
+        await asyncio.to_thread(warm_cache_from_storage)
+    except Exception as e:
+        logger.warning(f"Cache warm-up from storage failed: {e}")
+    with log_context(request_id="startup-warmup", tool_name="bootstrap_catalog"):
+        include = ["toptier_agencies", "award_types", "submission_periods"]
+        if os.getenv("USASPENDING_CODE_INDEXES", "false").lower() == "true":
+            # PSC/NAICS/assistance listing lists for local resolve_entities lookups
+            include.append("codes")
+        result = await bootstrap_tool.aexecute(include=include)
+        if "error" in result:
+            logger.warning(f"Cache warm-up failed: {result['error'].get('message')}")
+        else:
+            logger.info("Cache warm-up complete")
+
 # Initialize FastMCP server
 # stateless_http=True is required for Cloud Run (no persistent SSE connections)
 # stateless_http=False enables SSE support for Claude Desktop local usage
@@ -47,36 +84,37 @@ stateless_http = os.getenv("FASTMCP_STATELESS_HTTP", "true").lower() == "true"
 mcp = FastMCP("USAspending MCP", log_level="DEBUG", stateless_http=stateless_http)
 
 # Register Tools
+# Tools are async so in-flight upstream calls wait on the event loop instead of holding worker threads.
 @mcp.tool()
-def data_freshness(
+async def data_freshness(
     check_type: str = "submission_periods", 
     agency_code: str = None, 
     debug: bool = False
 ) -> dict:
     """Check data currency: submission periods, agency status, or DB update time."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="data_freshness"):
+    with log_context(request_id=request_id, tool_name="data_freshness"), request_scope(MAX_WALL_MS):
         logger.info(f"Executing data_freshness check_type={check_type}")
-        return freshness_tool.execute(check_type=check_type, agency_code=agency_code, debug=debug, request_id=request_id)
+        return await freshness_tool.aexecute(check_type=check_type, agency_code=agency_code, debug=debug, request_id=request_id)
 
 @mcp.tool()
-def bootstrap_catalog(include: list[str] = None, force_refresh: bool = False) -> dict:
-    """Load reference catalogs (agencies, award types). Run once at session start."""
+async def bootstrap_catalog(include: list[str] = None, force_refresh: bool = False) -> dict:
+    """Load reference catalogs (agencies, award types; "codes" = PSC/NAICS/CFDA lists). Run once at session start."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="bootstrap_catalog"):
+    with log_context(request_id=request_id, tool_name="bootstrap_catalog"), request_scope(MAX_WALL_MS):
         logger.info(f"Executing bootstrap_catalog force_refresh={force_refresh}")
-        return bootstrap_tool.execute(include=include, force_refresh=force_refresh, request_id=request_id)
+        return await bootstrap_tool.aexecute(include=include, force_refresh=force_refresh, request_id=request_id)
 
 @mcp.tool()
-def resolve_entities(q: str, types: list[str] = None, limit: int = 10) -> dict:
+async def resolve_entities(q: str, types: list[str] = None, limit: int = 10) -> dict:
     """Resolve names to canonical IDs (agencies, recipients, PSC, NAICS). Use before search if ambiguous."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="resolve_entities"):
+    with log_context(request_id=request_id, tool_name="resolve_entities"), request_scope(MAX_WALL_MS):
         logger.info(f"Executing resolve_entities q='{q}'")
-        return resolve_tool.execute(q=q, types=types, limit=limit, request_id=request_id)
+        return await resolve_tool.aexecute(q=q, types=types, limit=limit, request_id=request_id)
 
 @mcp.tool()
-def award_search(
+async def award_search(
     time_period: list[dict] = None, 
     filters: dict = None, 
     fields: list[str] = None, 
@@ -85,13 +123,15 @@ def award_search(
     page: int = 1, 
     limit: int = 10, 
     mode: str = "list", 
-    scope_mode: str = "all_awards"
+    scope_mode: str = "all_awards",
+    cursor: str = None,
+    max_wall_ms: int = None
 ) -> dict:
-    """Search awards by filters. Returns list or count."""
+    """Search awards by filters. Returns list or count. Pass next_cursor back as cursor for the next page."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="award_search"):
+    with log_context(request_id=request_id, tool_name="award_search"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing award_search mode={mode} scope_mode={scope_mode}")
-        return search_tool.execute(
+        return await search_tool.aexecute(
             time_period=time_period, 
             filters=filters, 
             fields=fields, 
@@ -101,44 +141,49 @@ def award_search(
             limit=limit, 
             mode=mode, 
             scope_mode=scope_mode,
+            cursor=cursor,
             request_id=request_id
         )
 
 @mcp.tool()
-def award_explain(
+async def award_explain(
     award_id: str, 
     include: list[str] = None, 
     transactions_limit: int = 25, 
     subawards_limit: int = 25, 
-    scope_mode: str = "all_awards"
+    funding_limit: int = 25,
+    scope_mode: str = "all_awards",
+    max_wall_ms: int = None
 ) -> dict:
-    """Get award details: summary, transactions, subawards."""
+    """Get award details: summary, transactions, subawards, funding."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="award_explain"):
+    with log_context(request_id=request_id, tool_name="award_explain"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing award_explain award_id={award_id}")
-        return explain_tool.execute(
+        return await explain_tool.aexecute(
             award_id=award_id, 
             include=include, 
             transactions_limit=transactions_limit, 
             subawards_limit=subawards_limit, 
+            funding_limit=funding_limit,
             scope_mode=scope_mode,
             request_id=request_id
         )
 
 @mcp.tool()
-def spending_rollups(
+async def spending_rollups(
     time_period: list[dict] = None, 
     filters: dict = None, 
     group_by: str = "awarding_agency", 
     top_n: int = 10, 
     metric: str = "obligations", 
-    scope_mode: str = "all_awards"
+    scope_mode: str = "all_awards",
+    max_wall_ms: int = None
 ) -> dict:
     """Get spending totals/Top-N breakdowns by agency/recipient. No award lists."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="spending_rollups"):
+    with log_context(request_id=request_id, tool_name="spending_rollups"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing spending_rollups group_by={group_by}")
-        return rollups_tool.execute(
+        return await rollups_tool.aexecute(
             time_period=time_period, 
             filters=filters, 
             group_by=group_by, 
@@ -149,17 +194,18 @@ def spending_rollups(
         )
 
 @mcp.tool()
-def recipient_profile(
+async def recipient_profile(
     recipient: str, 
     time_period: list[dict] = None, 
     include: list[str] = None, 
-    scope_mode: str = "all_awards"
+    scope_mode: str = "all_awards",
+    max_wall_ms: int = None
 ) -> dict:
     """Recipient overview: totals and top awards."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="recipient_profile"):
+    with log_context(request_id=request_id, tool_name="recipient_profile"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing recipient_profile recipient='{recipient}'")
-        return recipient_tool.execute(
+        return await recipient_tool.aexecute(
             recipient=recipient, 
             time_period=time_period, 
             include=include, 
@@ -168,17 +214,18 @@ def recipient_profile(
         )
 
 @mcp.tool()
-def agency_portfolio(
+async def agency_portfolio(
     toptier_code: str, 
     time_period: list[dict] = None, 
     views: list[str] = None, 
-    scope_mode: str = "all_awards"
+    scope_mode: str = "all_awards",
+    max_wall_ms: int = None
 ) -> dict:
-    """Agency overview: budget, top awards/recipients."""
+    """Agency overview. Views: summary, awards, award_totals, budgetary_resources, object_class, program_activity, federal_account."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="agency_portfolio"):
+    with log_context(request_id=request_id, tool_name="agency_portfolio"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing agency_portfolio toptier_code={toptier_code}")
-        return agency_tool.execute(
+        return await agency_tool.aexecute(
             toptier_code=toptier_code, 
             time_period=time_period, 
             views=views, 
@@ -187,28 +234,31 @@ def agency_portfolio(
         )
 
 @mcp.tool()
-def idv_vehicle_bundle(
+async def idv_vehicle_bundle(
     idv_award_id: str, 
     include: list[str] = None, 
     time_period: list[dict] = None, 
-    scope_mode: str = "all_awards"
+    scope_mode: str = "all_awards",
+    orders_limit: int = 10,
+    max_wall_ms: int = None
 ) -> dict:
-    """IDV details: task orders, funding, activity."""
+    """IDV details: task orders, funding, activity. include "hierarchy" rolls up all child orders and IDVs."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="idv_vehicle_bundle"):
+    with log_context(request_id=request_id, tool_name="idv_vehicle_bundle"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing idv_vehicle_bundle idv_award_id={idv_award_id}")
-        return idv_tool.execute(
+        return await idv_tool.aexecute(
             idv_award_id=idv_award_id, 
             include=include, 
             time_period=time_period, 
             scope_mode=scope_mode,
+            orders_limit=orders_limit,
             request_id=request_id
         )
 
 @mcp.tool()
-def answer_award_spending_question(question: str) -> dict:
+async def answer_award_spending_question(question: str, max_wall_ms: int = None) -> dict:
     """Answer a natural-language federal spending question."""
     request_id = str(uuid.uuid4())
-    with log_context(request_id=request_id, tool_name="answer_award_spending_question"):
+    with log_context(request_id=request_id, tool_name="answer_award_spending_question"), request_scope(max_wall_ms or MAX_WALL_MS):
         logger.info(f"Executing answer_award_spending_question question='{question}'")
-        return orchestrator_tool.execute(question=question, request_id=request_id)
+        return await orchestrator_tool.aexecute(question=question, request_id=request_id)
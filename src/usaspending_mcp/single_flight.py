@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from usaspending_mcp.request_context import RequestContext, bind_request
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls into a single execution.
+
+    The first caller for a key (the leader) starts the call; callers arriving while it is
+    in flight await the same task and receive the same result or exception. Results are
+    shared objects, so callers must treat them as read-only.
+
+    Each caller may pass its own deadline (time.monotonic()). The shared call runs in
+    its own request context whose deadline is the latest among the callers that joined
+    (unbounded if any caller is), while each caller stops waiting at its own deadline
+    with asyncio.TimeoutError.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> (loop, task, waiter count, shared request context). Tasks are loop-bound,
+        # so only callers on the same event loop can join an in-flight call.
+        self._inflight: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Task, int, RequestContext]] = {}
+        self.leader_count = 0
+        self.coalesced_count = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]], deadline: Optional[float] = None) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].done():
+                _, task, waiters, shared = entry
+                shared.extend_deadline(deadline)
+                self._inflight[key] = (loop, task, waiters + 1, shared)
+                self.coalesced_count += 1
+            else:
+                shared = RequestContext()
+                shared.deadline = deadline
+                context = contextvars.copy_context()
+                context.run(bind_request, shared)
+                task = loop.create_task(func(), context=context)
+                self._inflight[key] = (loop, task, 1, shared)
+                self.leader_count += 1
+                task.add_done_callback(lambda t, key=key: self._forget(key, t))
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            # Shield so one caller being cancelled (or timing out) doesn't cancel the call for the others.
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            self._release(key, task)
+            raise
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is not None and entry[1] is task:
+                del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; callers re-raise it themselves
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        """Drops a cancelled waiter; cancels the shared call once nobody is waiting on it."""
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is None or entry[1] is not task:
+                return
+            loop, _, waiters, shared = entry
+            if waiters > 1:
+                self._inflight[key] = (loop, task, waiters - 1, shared)
+                return
+            del self._inflight[key]
+        task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            inflight = len(self._inflight)
+        return {
+            "inflight": inflight,
+            "leaders": self.leader_count,
+            "coalesced": self.coalesced_count,
+        }
@@ -1,4 +1,17 @@
-from usaspending_mcp.server import mcp
+import asyncio
+
+from usaspending_mcp.server import client, mcp, warm_caches
+
+
+async def run_stdio() -> None:
+    # Warm the catalog in the background so the first request doesn't pay the cold fetch
+    warmup = asyncio.create_task(warm_caches())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+        await client.aclose()
 
 
 def main():
@@ -6,7 +19,7 @@ def main():
     Entrypoint for stdio transport.
     """
     print("Starting USAspending MCP Server (stdio)...")
-    mcp.run()
+    asyncio.run(run_stdio())
 
 if __name__ == "__main__":
     main()
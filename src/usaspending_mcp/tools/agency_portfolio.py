@@ -1,18 +1,85 @@
+import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Awaitable, Dict, List, Optional
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import SCOPE_ALL_AWARDS
 from usaspending_mcp.response import fail, ok
 from usaspending_mcp.tools.spending_rollups import SpendingRollupsTool
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
+# Account-level views: /agency/{toptier_code}/<view>/, keyed by fiscal year.
+# Their TTL class ("agency_accounts") comes from endpoint_map / router_rules.
+ACCOUNT_VIEWS = ["budgetary_resources", "object_class", "program_activity", "federal_account"]
+# /agency/{toptier_code}/awards/ (obligation and transaction totals); "awards" is the top-recipients rollup.
+AWARD_TOTALS_VIEW = "award_totals"
+ACCOUNT_VIEW_LIMIT = 10
+
+
+def _fiscal_year(time_period: Optional[List[Dict[str, str]]]) -> Optional[int]:
+    """
+    Federal fiscal year of the latest end_date in time_period (FY starts October 1).
+    Raises TypeError/ValueError for entries that aren't objects or dates that aren't ISO.
+    """
+    if not all(isinstance(p, dict) for p in time_period or []):
+        raise TypeError("time_period entries must be objects")
+    end_dates = [p.get("end_date") for p in time_period or [] if p.get("end_date")]
+    if not end_dates:
+        return None
+    end = date.fromisoformat(max(end_dates))
+    return end.year + 1 if end.month >= 10 else end.year
+
 
 class AgencyPortfolioTool:
     def __init__(self, client: USAspendingClient):
         self.client = client
         self.rollups = SpendingRollupsTool(client)
 
-    def execute(
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def _get_view(self, endpoint: str, params: Dict[str, Any], request_id: str) -> Any:
+        return await self.client.arequest(
+            "GET", endpoint, params=params or None, request_id=request_id, tool_name="agency_portfolio"
+        )
+
+    async def _top_recipients(
+        self,
+        toptier_code: str,
+        time_period: Optional[List[Dict[str, str]]],
+        scope_mode: str,
+        request_id: str
+    ) -> Dict[str, Any]:
+        # "awards" view: top recipients of this agency's awards, via spending_rollups.
+        # Filter schema: { "agencies": [ { "type": "awarding", "tier": "toptier", "toptier_code": "097" } ] }
+        # Note: "toptier_code" key support depends on endpoint. 
+        # award_search supports it. spending_by_category supports it.
+        agency_filter = {
+            "agencies": [
+                {
+                    "type": "awarding",
+                    "tier": "toptier",
+                    "toptier_code": toptier_code
+                }
+            ]
+        }
+        
+        rollup_res = await self.rollups.aexecute(
+            time_period=time_period,
+            filters=agency_filter,
+            group_by="recipient", # Top recipients for this agency
+            top_n=5,
+            scope_mode=scope_mode,
+            request_id=request_id
+        )
+        if "error" in rollup_res:
+            error = rollup_res["error"]
+            raise APIError(error["type"], error["message"], status_code=error.get("status_code"), endpoint=error.get("endpoint"))
+        return rollup_res
+
+    async def aexecute(
         self, 
         toptier_code: str,
         time_period: Optional[List[Dict[str, str]]] = None,
@@ -25,73 +92,66 @@ class AgencyPortfolioTool:
         views = views or ["summary", "awards"]
         endpoints_used = []
         result_bundle = {}
-        
         try:
-            # 1. Agency Summary / Overview
+            fiscal_year = _fiscal_year(time_period)
+        except (TypeError, ValueError):
+            return fail(
+                "validation",
+                "time_period must be a list of {start_date, end_date} objects; end_date must be an ISO date (YYYY-MM-DD).",
+                request_id,
+                scope_mode=scope_mode,
+                hint_key="invalid_time_period"
+            )
+        fy_params = {"fiscal_year": fiscal_year} if fiscal_year else {}
+
+        # All requested views are fetched concurrently; each upstream response is cached
+        # by the client with its endpoint's TTL. A failed view is reported as
+        # "<view>_error" and doesn't fail the others.
+        fetches: Dict[str, Awaitable[Any]] = {}
+        view_endpoints: Dict[str, str] = {}
+        if "summary" in views:
             # Endpoint: /api/v2/agency/<toptier_code>/
-            if "summary" in views:
-                endpoint = f"agency/{toptier_code}/"
-                try:
-                    resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="agency_portfolio")
-                    result_bundle["summary"] = resp
-                    endpoints_used.append(endpoint)
-                except APIError as e:
-                    # Some endpoints require FY param. 
-                    # If 400 or 404, we might need to fallback or ignore.
-                    result_bundle["summary_error"] = e.message
-
-            # 2. Awards View (Top awards for this agency)
-            # Use spending_rollups internally? No, user wants actual awards usually or rollup categories.
-            # "awards" view usually implies "recent awards" or "breakdown".
-            # Let's interpret "awards" as "Spending by Award Type" or "Top Awards". 
-            # Given PRD says "summary + awards views", we'll provide top categories via rollups.
-            
-            if "awards" in views:
-                # We'll fetch spending by Award Type (Category) for this agency
-                # Filter by awarding_agency_id or toptier code
-                # USASpending filters use "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Defense"}]
-                # But we have code. We might need to resolve code to name first if filter requires name?
-                # Actually, API v2 filters often accept "agencies": [{"toptier_code": "097"}]?? No, usually strictly name or ID.
-                # Wait, "agency" filter usually takes ID. 
-                # Let's use `spending_rollups` with `awarding_agency` filter if possible.
-                # Does `spending_rollups` support ID filter?
-                # Our rollups tool uses `filters` dict passed directly. 
-                # We need to construct the correct filter for Toptier Agency.
-                
-                # Filter schema: { "agencies": [ { "type": "awarding", "tier": "toptier", "toptier_code": "097" } ] }
-                # Note: "toptier_code" key support depends on endpoint. 
-                # award_search supports it. spending_by_category supports it.
-                
-                agency_filter = {
-                    "agencies": [
-                        {
-                            "type": "awarding",
-                            "tier": "toptier",
-                            "toptier_code": toptier_code
-                        }
-                    ]
-                }
-                
-                rollup_res = self.rollups.execute(
-                    time_period=time_period,
-                    filters=agency_filter,
-                    group_by="recipient", # Top recipients for this agency
-                    top_n=5,
-                    scope_mode=scope_mode,
-                    request_id=request_id
-                )
-                
-                result_bundle["top_recipients"] = rollup_res.get("groups", [])
-                endpoints_used.extend(rollup_res.get("meta", {}).get("endpoints_used", []))
+            view_endpoints["summary"] = f"agency/{toptier_code}/"
+            fetches["summary"] = self._get_view(view_endpoints["summary"], fy_params, request_id)
+        if "awards" in views:
+            fetches["awards"] = self._top_recipients(toptier_code, time_period, scope_mode, request_id)
+        if AWARD_TOTALS_VIEW in views:
+            view_endpoints[AWARD_TOTALS_VIEW] = f"agency/{toptier_code}/awards/"
+            fetches[AWARD_TOTALS_VIEW] = self._get_view(view_endpoints[AWARD_TOTALS_VIEW], fy_params, request_id)
+        for view in ACCOUNT_VIEWS:
+            if view in views:
+                view_endpoints[view] = f"agency/{toptier_code}/{view}/"
+                params = fy_params if view == "budgetary_resources" else {**fy_params, "limit": ACCOUNT_VIEW_LIMIT}
+                fetches[view] = self._get_view(view_endpoints[view], params, request_id)
+
+        try:
+            outcomes = await asyncio.gather(*fetches.values(), return_exceptions=True)
+
+            failed = []
+            for view, outcome in zip(fetches, outcomes, strict=True):
+                if isinstance(outcome, APIError):
+                    # Some endpoints require FY param or don't know the agency (400/404).
+                    result_bundle[f"{view}_error"] = outcome.message
+                    failed.append(view)
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+                if view == "awards":
+                    result_bundle["top_recipients"] = outcome.get("groups", [])
+                    endpoints_used.extend(outcome.get("meta", {}).get("endpoints_used", []))
+                    continue
+                result_bundle[view] = outcome
+                endpoints_used.append(view_endpoints[view])
 
+            partial_meta = {"partial": True, "failed_views": failed} if failed else {}
             return ok(
                 result_bundle,
                 request_id=request_id,
                 scope_mode=scope_mode,
-                endpoints_used=endpoints_used
+                endpoints_used=endpoints_used,
+                **partial_meta
             )
 
-        except APIError as e:
-            return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
         except Exception as e:
             return fail("unknown", str(e), request_id)
@@ -9,3 +9,6 @@ class AnswerAwardSpendingQuestionTool:
 
     def execute(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
         return self.router.route_request(question, debug, request_id)
+
+    async def aexecute(self, question: str, debug: bool = False, request_id: Optional[str] = None) -> Dict[str, Any]:
+        return await self.router.aroute_request(question, debug, request_id)
@@ -1,6 +1,8 @@
+import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import (
     FALLBACK_CONTRACT_CODES,
     FALLBACK_IDV_CODES,
@@ -8,6 +10,7 @@ from usaspending_mcp.award_types import (
     SCOPE_ASSISTANCE_ONLY,
     SCOPE_CONTRACTS_ONLY,
 )
+from usaspending_mcp.request_context import current_request
 from usaspending_mcp.response import fail, ok, out_of_scope, pick_fields
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
@@ -53,12 +56,60 @@ class AwardExplainTool:
             
         return True
 
-    def execute(
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    def _list_requests(
+        self,
+        award_id: str,
+        include: List[str],
+        transactions_limit: int,
+        subawards_limit: int,
+        funding_limit: int
+    ) -> Dict[str, Tuple[str, Dict[str, Any], int]]:
+        """
+        Builds the list-style sub-requests for the requested sections.
+        Returns {section: (endpoint, payload, limit)} in output order; paging is added by the paginator.
+        """
+        requests = {}
+        if "transactions" in include:
+            requests["transactions"] = ("transactions/", {
+                "award_id": award_id,
+                "sort": "action_date",
+                "order": "desc"
+            }, transactions_limit)
+        if "subawards" in include:
+            requests["subawards"] = ("subawards/", {
+                "award_id": award_id,
+                "order": "desc", 
+                "sort": "subaward_amount"
+            }, subawards_limit)
+        if "funding" in include:
+            requests["funding"] = ("awards/funding/", {
+                "award_id": award_id,
+                "sort": "reporting_fiscal_date",
+                "order": "desc"
+            }, funding_limit)
+        return requests
+
+    async def _fetch_list(
+        self, endpoint: str, payload: Dict[str, Any], limit: int, request_id: str
+    ) -> Tuple[List[Any], Optional[int]]:
+        """Up to `limit` records across pages, plus the upstream total if reported."""
+        pages = self.client.paginate(
+            "POST", endpoint, payload, page_size=limit, max_items=limit, request_id=request_id, tool_name="award_explain"
+        )
+        records = await pages.collect()
+        return records, pages.total
+
+    async def aexecute(
         self, 
         award_id: str,
         include: Optional[List[str]] = None, 
         transactions_limit: int = 10,
         subawards_limit: int = 10,
+        funding_limit: int = 10,
         scope_mode: str = SCOPE_ALL_AWARDS,
         debug: bool = False,
         request_id: Optional[str] = None
@@ -68,11 +119,19 @@ class AwardExplainTool:
         include = include or ["summary", "transactions"]
         endpoints_used = []
         result_bundle = {}
+
+        # Transactions, subawards and funding only depend on the award_id, so they are
+        # started speculatively alongside the summary and discarded if scope validation fails.
+        list_requests = self._list_requests(award_id, include, transactions_limit, subawards_limit, funding_limit)
+        speculative = {
+            section: asyncio.create_task(self._fetch_list(endpoint, payload, limit, request_id))
+            for section, (endpoint, payload, limit) in list_requests.items()
+        }
         
         try:
             # 1. Fetch Summary (Always needed for validation)
             endpoint_summary = f"awards/{award_id}/"
-            resp_summary = self.client.request("GET", endpoint_summary, request_id=request_id, tool_name="award_explain")
+            resp_summary = await self.client.arequest("GET", endpoint_summary, request_id=request_id, tool_name="award_explain")
             endpoints_used.append(endpoint_summary)
             
             # Unpack validation
@@ -90,53 +149,45 @@ class AwardExplainTool:
             if "summary" in include:
                 result_bundle["summary"] = pick_fields(resp_summary, SUMMARY_FIELDS)
                 
-            # 2. Transactions
-            if "transactions" in include:
-                endpoint_tx = "transactions/"
-                payload_tx = {
-                    "award_id": award_id,
-                    "limit": transactions_limit,
-                    "page": 1,
-                    "sort": "action_date",
-                    "order": "desc"
-                }
-                resp_tx = self.client.request("POST", endpoint_tx, json_data=payload_tx, request_id=request_id, tool_name="award_explain")
-                endpoints_used.append(endpoint_tx)
-                
-                tx_results = resp_tx.get("results", [])
-                result_bundle["transactions"] = tx_results[:transactions_limit]
-                
-                # Copy total metadata if available
-                # Often in page_metadata
-                page_meta = resp_tx.get("page_metadata", {})
-                if "total" in page_meta:
-                     result_bundle["transactions_total"] = page_meta["total"]
-
-            # 3. Subawards
-            if "subawards" in include:
-                endpoint_sub = "subawards/"
-                payload_sub = {
-                    "award_id": award_id,
-                    "limit": subawards_limit,
-                    "page": 1,
-                    "order": "desc", 
-                    "sort": "subaward_amount"
-                }
-                resp_sub = self.client.request("POST", endpoint_sub, json_data=payload_sub, request_id=request_id, tool_name="award_explain")
-                endpoints_used.append(endpoint_sub)
-                
-                sub_results = resp_sub.get("results", [])
-                result_bundle["subawards"] = sub_results[:subawards_limit]
-                
-                page_meta = resp_sub.get("page_metadata", {})
-                if "total" in page_meta:
-                     result_bundle["subawards_total"] = page_meta["total"]
+            # 2. Transactions / Subawards / Funding
+            # Sections still running at the request deadline are cancelled and reported missing.
+            ctx = current_request()
+            remaining = ctx.remaining() if ctx is not None else None
+            if speculative and remaining is not None:
+                await asyncio.wait(speculative.values(), timeout=remaining)
+
+            missing_sections = []
+            for section, (endpoint, _, _) in list_requests.items():
+                task = speculative[section]
+                if remaining is not None and not task.done():
+                    missing_sections.append(section)
+                    continue
+                try:
+                    records, total = await task
+                except APIError as e:
+                    if e.error_type != "deadline":
+                        raise
+                    missing_sections.append(section)
+                    continue
+                endpoints_used.append(endpoint)
+
+                result_bundle[section] = records
+
+                # Copy total metadata if available (page_metadata of the first page)
+                if total is not None:
+                     result_bundle[f"{section}_total"] = total
+
+            partial_meta = {}
+            if missing_sections:
+                partial_meta = {"partial": True, "missing_sections": missing_sections}
 
             return ok(
                 result_bundle,
                 request_id=request_id,
                 scope_mode=scope_mode,
                 endpoints_used=endpoints_used,
+                warnings=["deadline_exceeded"] if missing_sections else None,
+                **partial_meta,
                 # Note: Cache logic is usually handled by the caller or specialized cache decorator if we wanted strictly scoped caching.
                 # Here we just execute.
             )
@@ -145,3 +196,10 @@ class AwardExplainTool:
             return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
         except Exception as e:
             return fail("unknown", str(e), request_id)
+        finally:
+            # Discard speculative fetches that are no longer needed (out of scope or error).
+            for task in speculative.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved so asyncio doesn't log it
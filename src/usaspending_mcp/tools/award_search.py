@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
+import json
 import time
 from typing import Any, Dict, List, Optional
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import SCOPE_ALL_AWARDS, get_award_type_codes
+from usaspending_mcp.pagination import decode_cursor, encode_cursor
 from usaspending_mcp.response import fail, ok
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
@@ -34,7 +39,41 @@ class AwardSearchTool:
             "Award Type",
         ]
 
-    def execute(
+    def _filters_digest(self, filters: Dict[str, Any], sort: str, order: str) -> str:
+        canonical = json.dumps([filters, sort, order], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+    def _next_cursor(self, page_meta: Dict[str, Any], digest: str) -> Optional[str]:
+        """Keyset cursor for the page after this one, if there is one."""
+        if not page_meta.get("hasNext") or page_meta.get("last_record_unique_id") is None:
+            return None
+        return encode_cursor({
+            "id": page_meta["last_record_unique_id"],
+            "value": page_meta.get("last_record_sort_value"),
+            "q": digest,
+        })
+
+    def _read_cursor(self, cursor: str, digest: str) -> Dict[str, Any]:
+        state = decode_cursor(cursor)
+        if "id" not in state or state.get("q") != digest:
+            raise ValueError("Cursor does not belong to this search (filters, sort and order must not change)")
+        return state
+
+    async def _timed(
+        self, name: str, endpoint: str, payload: Dict[str, Any], request_id: str, timings_ms: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """One sub-call; its wall time is recorded in timings_ms[name]."""
+        start = time.perf_counter()
+        try:
+            return await self.client.arequest("POST", endpoint, json_data=payload, request_id=request_id, tool_name="award_search")
+        finally:
+            timings_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def aexecute(
         self, 
         time_period: Optional[List[Dict[str, str]]] = None, 
         filters: Optional[Dict[str, Any]] = None, 
@@ -45,6 +84,7 @@ class AwardSearchTool:
         limit: int = 10, 
         mode: str = "list",  # list, count, both
         scope_mode: str = SCOPE_ALL_AWARDS,
+        cursor: Optional[str] = None,
         award_type_groups: Optional[List[str]] = None,
         debug: bool = False,
         request_id: Optional[str] = None
@@ -85,54 +125,86 @@ class AwardSearchTool:
 
         # Normalize
         filters = self._normalize_payload(filters)
+
+        # Keyset paging: a cursor from a previous page replaces `page`, so deep pages
+        # cost the same upstream as the first one.
+        digest = self._filters_digest(filters, sort, order)
+        keyset = None
+        if cursor:
+            try:
+                keyset = self._read_cursor(cursor, digest)
+            except ValueError as e:
+                return fail("validation", str(e), request_id, scope_mode=scope_mode, hint_key="invalid_cursor")
         
         endpoints_used = []
         result_data = {}
         
+        # Count and list are independent calls: in mode="both" they run concurrently.
+        calls = {}
+        if mode in ("count", "both"):
+            calls["count"] = ("search/spending_by_award_count/", {"filters": filters})
+        if mode in ("list", "both"):
+            payload = {
+                "filters": filters,
+                "fields": fields or self._get_default_fields(),
+                "sort": sort,
+                "order": order,
+                "limit": limit
+            }
+            if keyset is not None:
+                payload["last_record_unique_id"] = keyset["id"]
+                payload["last_record_sort_value"] = keyset["value"]
+            else:
+                payload["page"] = page
+            calls["list"] = ("search/spending_by_award/", payload)
+
+        timings_ms: Dict[str, float] = {}
+        tasks = {
+            name: asyncio.create_task(self._timed(name, endpoint, payload, request_id, timings_ms))
+            for name, (endpoint, payload) in calls.items()
+        }
+
         try:
+            responses = dict(zip(tasks, await asyncio.gather(*tasks.values()), strict=True))
+
             # Mode: Count
-            if mode in ("count", "both"):
-                endpoint = "search/spending_by_award_count/"
-                payload = {"filters": filters}
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="award_search")
-                result_data["count"] = resp.get("results", {}).get("count", 0)
-                endpoints_used.append(endpoint)
+            if "count" in responses:
+                result_data["count"] = responses["count"].get("results", {}).get("count", 0)
+                endpoints_used.append(calls["count"][0])
                 
             # Mode: List
-            if mode in ("list", "both"):
-                endpoint = "search/spending_by_award/"
-                
-                # Fields
-                final_fields = fields or self._get_default_fields()
-                
-                payload = {
-                    "filters": filters,
-                    "fields": final_fields,
-                    "sort": sort,
-                    "order": order,
-                    "page": page,
-                    "limit": limit
-                }
-                
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="award_search")
+            if "list" in responses:
+                resp = responses["list"]
                 result_data["results"] = resp.get("results", [])
                 
                 # Copy only essential paging info
                 page_meta = resp.get("page_metadata", {})
                 if "total" in page_meta:
                     result_data["total"] = page_meta["total"]
+                result_data["has_next"] = bool(page_meta.get("hasNext"))
+                next_cursor = self._next_cursor(page_meta, digest)
+                if next_cursor:
+                    result_data["next_cursor"] = next_cursor
                     
-                endpoints_used.append(endpoint)
+                endpoints_used.append(calls["list"][0])
 
             return ok(
                 result_data,
                 request_id=request_id,
                 scope_mode=scope_mode,
                 endpoints_used=endpoints_used,
-                accuracy_tier="B"  # Near-exact (search based)
+                accuracy_tier="B",  # Near-exact (search based)
+                timings_ms=timings_ms
             )
 
         except APIError as e:
             return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
         except Exception as e:
             return fail("unknown", str(e), request_id)
+        finally:
+            # If one call failed, don't leave the other running
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved
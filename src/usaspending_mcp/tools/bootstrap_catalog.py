@@ -1,22 +1,209 @@
+import asyncio
+import contextvars
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from usaspending_mcp.cache import Cache
+from usaspending_mcp.agency_index import AgencyIndex
+from usaspending_mcp.async_bridge import run_sync
+from usaspending_mcp.cache import Cache, CacheEntry
+from usaspending_mcp.code_index import CodeIndex, flatten_tree, listing_records
+from usaspending_mcp.logging_config import get_logger
+from usaspending_mcp.request_context import current_request, request_scope
 from usaspending_mcp.response import fail, ok, pick_fields
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
+logger = get_logger("bootstrap_catalog")
+
+T = TypeVar("T")
+
 # Defaults
 DEFAULT_INCLUDES = ["toptier_agencies", "award_types"]
 CATALOG_CACHE_KEY = "bootstrap_catalog_v1"
 CATALOG_TTL_SECONDS = 86400  # 24 hours
+# After expiry the catalog is still served (stale) for this long while it is refreshed
+CATALOG_STALE_TTL_SECONDS = 7 * 86400
+# Refresh ahead of expiry once less than this fraction of the TTL remains
+CATALOG_REFRESH_AHEAD_FRACTION = 0.1
 AGENCY_OUTPUT_FIELDS = ["agency_name", "toptier_code", "abbreviation"]
 
+# Catalog section -> (endpoint, extractor for the section value)
+CATALOG_SECTIONS = {
+    "toptier_agencies": ("references/toptier_agencies/", lambda r: r.get("results", [])),
+    # Response is a dict of groups (contracts, grants, loans, etc.)
+    "award_types": ("references/award_types/", lambda r: r),
+    "submission_periods": ("references/submission_periods/", lambda r: r.get("available_periods", [])),
+    # Optional code lists, flattened to {"code", "description"} and indexed for resolve_entities
+    "psc": ("references/filter_tree/psc/", lambda r: flatten_tree(r.get("results"))),
+    "naics": ("references/filter_tree/naics/", lambda r: flatten_tree(r.get("results"))),
+    "assistance_listings": ("references/cfda/totals/", lambda r: listing_records(r.get("results", []))),
+}
+# Query params per section (depth=-1 returns the whole filter tree in one call)
+SECTION_PARAMS = {
+    "psc": {"depth": -1},
+    "naics": {"depth": -1},
+}
+# Sections only reported as a count in tool output (the full lists are for local lookups)
+CODE_SECTIONS = ["psc", "naics", "assistance_listings"]
+
+
+def _sections(include: List[str]) -> List[str]:
+    """Catalog sections needed for an include list ("filter" is served by award_types)."""
+    wanted = set(include)
+    if "filter" in wanted:
+        wanted.add("award_types")
+    if "codes" in wanted:
+        wanted.update(CODE_SECTIONS)
+    return [key for key in CATALOG_SECTIONS if key in wanted]
+
+
+def _slim(catalog: Dict[str, Any]) -> Dict[str, Any]:
+    """Catalog as returned to the caller: allowlisted agency fields, code lists as counts."""
+    output = dict(catalog)
+    if "toptier_agencies" in output:
+        output["toptier_agencies"] = pick_fields(output["toptier_agencies"], AGENCY_OUTPUT_FIELDS)
+    for key in CODE_SECTIONS:
+        if key in output:
+            output[key] = {"indexed_codes": len(output[key])}
+    return output
+
 class BootstrapCatalogTool:
     def __init__(self, client: USAspendingClient, cache: Cache):
         self.client = client
         self.cache = cache
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Section -> (stored_at of the catalog entry it was built from, index)
+        self._indexes: Dict[str, Tuple[float, Any]] = {}
+
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def _fetch_catalog(
+        self,
+        include: List[str],
+        request_id: Optional[str],
+        refresh: bool = False
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Fetches the requested catalog sections concurrently and merges them into the
+        cached catalog. Returns only the fetched sections.
+
+        Sections the client served stale (upstream down) are returned but not stored:
+        writing them would relabel degraded data as a fresh catalog for the full stale TTL.
+        """
+        sections = _sections(include)
+        ctx = current_request()
+        with request_scope() if ctx is None else nullcontext(ctx) as fetch_ctx:
+            stale_before = fetch_ctx.stale_responses
+            responses = await asyncio.gather(*(
+                self.client.arequest(
+                    "GET",
+                    CATALOG_SECTIONS[key][0],
+                    request_id=request_id,
+                    params=SECTION_PARAMS.get(key),
+                    tool_name="bootstrap_catalog",
+                    refresh=refresh
+                )
+                for key in sections
+            ))
+            stale = fetch_ctx.stale_responses > stale_before
+
+        catalog = {key: CATALOG_SECTIONS[key][1](resp) for key, resp in zip(sections, responses, strict=True)}
+        endpoints_used = [CATALOG_SECTIONS[key][0] for key in sections]
+        if stale:
+            logger.warning("Bootstrap catalog fetched from stale responses; keeping the cached catalog")
+            return catalog, endpoints_used
+
+        # Store full catalog in cache (resolve_entities needs full agency objects)
+        entry = await self.cache.aget_entry(CATALOG_CACHE_KEY)
+        await self.cache.aset(
+            CATALOG_CACHE_KEY,
+            {**entry.value, **catalog} if entry is not None else catalog,
+            ttl_seconds=CATALOG_TTL_SECONDS,
+            stale_ttl_seconds=CATALOG_STALE_TTL_SECONDS
+        )
+        return catalog, endpoints_used
+
+    def _maybe_refresh(self, entry: CacheEntry) -> None:
+        """Starts a background refresh when the cached catalog is stale or close to expiry."""
+        if entry.remaining() >= CATALOG_TTL_SECONDS * CATALOG_REFRESH_AHEAD_FRACTION:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        # Refresh every section the cached catalog already holds
+        include = list(dict.fromkeys(DEFAULT_INCLUDES + list(entry.value)))
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh(include),
+            context=contextvars.Context()
+        )
 
-    def execute(
+    async def _refresh(self, include: List[str]) -> None:
+        try:
+            await self._fetch_catalog(include, request_id=None, refresh=True)
+            logger.info("Bootstrap catalog refreshed in background")
+        except Exception as e:
+            # Keep serving the stale catalog; the next read retries the refresh
+            logger.warning(f"Bootstrap catalog background refresh failed: {e}")
+
+    async def _cached_entry(self, include: List[str]) -> Optional[CacheEntry]:
+        """The cached catalog (possibly stale) if it holds every requested section."""
+        entry = await self.cache.aget_entry(CATALOG_CACHE_KEY)
+        if entry is None or any(key not in entry.value for key in _sections(include)):
+            return None
+        self._maybe_refresh(entry)
+        return entry
+
+    async def aget_catalog(
+        self,
+        include: Optional[List[str]] = None,
+        request_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns the full (unslimmed) catalog. A stale cached copy is returned
+        immediately and refreshed in the background; only a cold cache fetches inline.
+        """
+        include = include or DEFAULT_INCLUDES
+        entry = await self._cached_entry(include)
+        if entry is not None:
+            return entry.value
+        catalog, _ = await self._fetch_catalog(include, request_id)
+        return catalog
+
+    async def aget_agency_index(self, request_id: Optional[str] = None) -> AgencyIndex:
+        """
+        Search index over the toptier agencies, rebuilt whenever the cached catalog
+        entry changes (refreshed here or by another instance sharing the L2 store).
+        """
+        entry = await self._cached_entry(["toptier_agencies"])
+        if entry is None:
+            catalog, _ = await self._fetch_catalog(["toptier_agencies"], request_id)
+            entry = await self.cache.aget_entry(CATALOG_CACHE_KEY)
+            if entry is None or "toptier_agencies" not in entry.value:
+                # Catalog couldn't be cached; index this copy without keeping it
+                return AgencyIndex(catalog["toptier_agencies"])
+        return self._index("toptier_agencies", entry, AgencyIndex)
+
+    def _index(self, section: str, entry: CacheEntry, build: Callable[[Any], T]) -> T:
+        """Index over one catalog section, rebuilt when the cached catalog entry is replaced."""
+        built = self._indexes.get(section)
+        if built is None or built[0] != entry.stored_at:
+            built = (entry.stored_at, build(entry.value[section]))
+            self._indexes[section] = built
+        return built[1]
+
+    async def acode_index(self, section: str) -> Optional[CodeIndex]:
+        """
+        Local index for a code section ("psc", "naics", "assistance_listings"), or None
+        if the catalog hasn't loaded it. Never fetches: these sections are opt-in.
+        Rebuilt whenever the cached catalog entry changes, like the agency index.
+        """
+        entry = await self._cached_entry([section])
+        if entry is None:
+            return None
+        return self._index(section, entry, CodeIndex)
+
+    async def aexecute(
         self, 
         include: Optional[List[str]] = None, 
         force_refresh: bool = False,
@@ -25,61 +212,29 @@ class BootstrapCatalogTool:
         include = include or DEFAULT_INCLUDES
         request_id = request_id or f"req-{int(time.time())}"
         
-        # Check cache unless forced
+        # Check cache unless forced; a stale catalog is served while it refreshes
         if not force_refresh:
-            cached_data, hit = self.cache.get(CATALOG_CACHE_KEY)
-            if hit:
+            entry = await self._cached_entry(include)
+            if entry is not None:
                 # Filter cached catalog to requested keys, slim for output
-                filtered_catalog = {k: v for k, v in cached_data.items() if k in include}
-                if "toptier_agencies" in filtered_catalog:
-                    filtered_catalog["toptier_agencies"] = pick_fields(
-                        filtered_catalog["toptier_agencies"], AGENCY_OUTPUT_FIELDS
-                    )
+                wanted = set(include) | (set(CODE_SECTIONS) if "codes" in include else set())
+                filtered_catalog = _slim({k: v for k, v in entry.value.items() if k in wanted})
+                meta_extras = {"cache_hit": True}
+                if not entry.is_fresh():
+                    meta_extras["cache_age_seconds"] = int(entry.age())
                 return ok(
                     {"catalog": filtered_catalog},
                     request_id=request_id,
                     endpoints_used=["(cached)"],
-                    cache_hit=True
+                    **meta_extras
                 )
 
-        catalog = {}
-        endpoints_used = []
-        
         try:
-            # 1. Toptier Agencies
-            if "toptier_agencies" in include:
-                endpoint = "references/toptier_agencies/"
-                resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="bootstrap_catalog")
-                catalog["toptier_agencies"] = resp.get("results", [])
-                endpoints_used.append(endpoint)
-            
-            # 2. Award Types
-            if "award_types" in include or "filter" in include:
-                endpoint = "references/award_types/"
-                resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="bootstrap_catalog")
-                # Response is a dict of groups (contracts, grants, loans, etc.)
-                catalog["award_types"] = resp
-                endpoints_used.append(endpoint)
-
-            # 3. Submission Periods
-            if "submission_periods" in include:
-                 endpoint = "references/submission_periods/"
-                 resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="bootstrap_catalog")
-                 catalog["submission_periods"] = resp.get("available_periods", [])
-                 endpoints_used.append(endpoint)
-
-            # Store full catalog in cache (resolve_entities needs full agency objects)
-            self.cache.set(CATALOG_CACHE_KEY, catalog, ttl_seconds=CATALOG_TTL_SECONDS)
+            catalog, endpoints_used = await self._fetch_catalog(include, request_id, refresh=force_refresh)
 
             # Slim output for LLM
-            output = dict(catalog)
-            if "toptier_agencies" in output:
-                output["toptier_agencies"] = pick_fields(
-                    output["toptier_agencies"], AGENCY_OUTPUT_FIELDS
-                )
-
             return ok(
-                {"catalog": output},
+                {"catalog": _slim(catalog)},
                 request_id=request_id,
                 endpoints_used=endpoints_used,
                 cache_hit=False
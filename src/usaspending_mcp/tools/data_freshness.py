@@ -2,6 +2,7 @@ import time
 from datetime import date, datetime
 from typing import Any, Dict, Optional
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.response import fail, ok
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
@@ -22,7 +23,11 @@ class DataFreshnessTool:
                 continue
         return None
 
-    def execute(
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def aexecute(
         self, 
         check_type: str = "submission_periods", 
         agency_code: Optional[str] = None, 
@@ -38,7 +43,7 @@ class DataFreshnessTool:
             # 1. Submission Periods (System-wide freshness)
             if check_type in ("submission_periods", "all"):
                 endpoint = "references/submission_periods/"
-                resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="data_freshness")
+                resp = await self.client.arequest("GET", endpoint, request_id=request_id, tool_name="data_freshness")
                 endpoints_used.append(endpoint)
                 
                 # Find latest closed period
@@ -72,7 +77,7 @@ class DataFreshnessTool:
             if check_type in ("last_updated", "all"):
                 endpoint = "awards/last_updated/"
                 try:
-                    resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="data_freshness")
+                    resp = await self.client.arequest("GET", endpoint, request_id=request_id, tool_name="data_freshness")
                     endpoints_used.append(endpoint)
                     
                     last_update = resp.get("last_updated")
@@ -93,7 +98,7 @@ class DataFreshnessTool:
                     return fail("validation", "agency_code required for agency_reporting check", request_id)
                     
                 endpoint = f"reporting/agencies/{agency_code}/overview/"
-                resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="data_freshness")
+                resp = await self.client.arequest("GET", endpoint, request_id=request_id, tool_name="data_freshness")
                 endpoints_used.append(endpoint)
                 
                 freshness_data["agency_status"] = {
@@ -1,16 +1,26 @@
+import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import FALLBACK_IDV_CODES, SCOPE_ASSISTANCE_ONLY
+from usaspending_mcp.cache import Cache
+from usaspending_mcp.idv_hierarchy import IDVHierarchyCrawl
 from usaspending_mcp.response import fail, ok, out_of_scope
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
+# PIID -> generated_unique_award_id never changes once assigned
+PIID_CACHE_TTL = 30 * 86400  # 30 days
+# Complete hierarchy rollups; the crawl pages themselves are never cached
+HIERARCHY_CACHE_TTL = 3 * 3600  # 3 hours, like other award details
+
 
 class IDVVehicleBundleTool:
-    def __init__(self, client: USAspendingClient):
+    def __init__(self, client: USAspendingClient, cache: Optional[Cache] = None):
         self.client = client
+        self.cache = cache
 
-    def _resolve_idv_id(self, idv_input: str, request_id: str) -> tuple[str, list[str]]:
+    async def _resolve_idv_id(self, idv_input: str, request_id: str) -> tuple[str, list[str]]:
         """
         Resolve an IDV identifier to its generated_unique_award_id.
 
@@ -28,6 +38,13 @@ class IDVVehicleBundleTool:
         if idv_input.startswith("CONT_IDV_"):
             return idv_input, endpoints_used
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key({"tool": "idv_vehicle_bundle", "piid": idv_input.strip().upper()})
+            cached_id, hit = await self.cache.aget(cache_key)
+            if hit:
+                return cached_id, endpoints_used
+
         # Otherwise, search for the IDV by PIID/keyword
         endpoint = "search/spending_by_award/"
         payload = {
@@ -39,7 +56,7 @@ class IDVVehicleBundleTool:
             "fields": ["Award ID", "generated_internal_id"]
         }
 
-        resp = self.client.request("POST", endpoint, json_data=payload,
+        resp = await self.client.arequest("POST", endpoint, json_data=payload,
                                    request_id=request_id, tool_name="idv_vehicle_bundle")
         endpoints_used.append(endpoint)
 
@@ -47,17 +64,70 @@ class IDVVehicleBundleTool:
         if results:
             resolved_id = results[0].get("generated_internal_id")
             if resolved_id:
+                if cache_key is not None:
+                    await self.cache.aset(cache_key, resolved_id, ttl_seconds=PIID_CACHE_TTL)
                 return resolved_id, endpoints_used
 
         # Fallback: return original input and let the API handle any errors
         return idv_input, endpoints_used
 
-    def execute(
+    async def _fetch_orders(self, resolved_id: str, orders_limit: int, request_id: str) -> Tuple[List[Any], bool]:
+        """Up to orders_limit child awards, and whether more exist."""
+        # POST /api/v2/idvs/awards/ requires:
+        # - award_id: the generated_unique_award_id (e.g., "CONT_IDV_...")
+        # - type: "child_awards" to return child awards (REQUIRED - without this, returns empty)
+        payload = {
+            "award_id": resolved_id,
+            "type": "child_awards",  # Required to get child awards
+        }
+
+        # Paged through idvs/awards/ (page/limit set by the paginator)
+        orders = self.client.paginate(
+            "POST",
+            "idvs/awards/",
+            payload,
+            page_size=orders_limit,
+            max_items=orders_limit,
+            request_id=request_id,
+            tool_name="idv_vehicle_bundle"
+        )
+        return await orders.collect(), orders.truncated
+
+    async def _crawl_hierarchy(self, resolved_id: str, top_n: int, request_id: str) -> Dict[str, Any]:
+        """Rollup of the IDV's full hierarchy; complete rollups are cached, partial ones aren't."""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key({"tool": "idv_vehicle_bundle", "hierarchy": resolved_id, "top_n": top_n})
+            cached, hit = await self.cache.aget(cache_key)
+            if hit:
+                return cached
+
+        rollup = await IDVHierarchyCrawl(self.client, resolved_id, request_id=request_id, top_n=top_n).run()
+        if cache_key is not None and rollup["complete"]:
+            await self.cache.aset(cache_key, rollup, ttl_seconds=HIERARCHY_CACHE_TTL)
+        return rollup
+
+    async def _post(self, endpoint: str, resolved_id: str, request_id: str) -> Dict[str, Any]:
+        return await self.client.arequest(
+            "POST",
+            endpoint,
+            json_data={"award_id": resolved_id},
+            request_id=request_id,
+            tool_name="idv_vehicle_bundle"
+        )
+
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def aexecute(
         self,
         idv_award_id: str,
         include: Optional[List[str]] = None,
         time_period: Optional[List[Dict[str, str]]] = None,
         scope_mode: str = "all_awards",
+        orders_limit: int = 10,
+        hierarchy_top_n: int = 10,
         request_id: Optional[str] = None
     ) -> Dict[str, Any]:
 
@@ -76,53 +146,69 @@ class IDVVehicleBundleTool:
                  remediation_hint="IDVs are strictly contracts. Switch to 'all_awards' or 'contracts_only'."
              )
 
+        tasks: Dict[str, asyncio.Task] = {}
         try:
             # 2. Resolve IDV ID (PIID -> generated_unique_award_id if needed)
-            resolved_id, resolve_endpoints = self._resolve_idv_id(idv_award_id, request_id)
+            resolved_id, resolve_endpoints = await self._resolve_idv_id(idv_award_id, request_id)
             endpoints_used.extend(resolve_endpoints)
             result_bundle["resolved_idv_id"] = resolved_id
-            # 3. Task Orders (Awards under IDV)
+
+            # 3-5. Orders, activity and funding rollup only need the resolved ID: fetch concurrently
             if "orders" in include:
-                endpoint = "idvs/awards/"
-                # POST /api/v2/idvs/awards/ requires:
-                # - award_id: the generated_unique_award_id (e.g., "CONT_IDV_...")
-                # - type: "child_awards" to return child awards (REQUIRED - without this, returns empty)
-                payload = {
-                    "award_id": resolved_id,
-                    "type": "child_awards",  # Required to get child awards
-                    "limit": 10,
-                    "page": 1
-                }
-
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="idv_vehicle_bundle")
-                result_bundle["orders"] = resp.get("results", [])
-                endpoints_used.append(endpoint)
-
-            # 4. Activity (by year/month)
+                tasks["orders"] = asyncio.create_task(self._fetch_orders(resolved_id, orders_limit, request_id))
             if "activity" in include:
-                endpoint = "idvs/activity/"
-                payload = {"award_id": resolved_id}
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="idv_vehicle_bundle")
-                result_bundle["activity"] = resp.get("results", [])
-                endpoints_used.append(endpoint)
-
-            # 5. Funding Rollup (by agency/account)
+                tasks["activity"] = asyncio.create_task(self._post("idvs/activity/", resolved_id, request_id))
             if "funding_rollup" in include:
-                endpoint = "idvs/funding_rollup/"
-                payload = {"award_id": resolved_id}
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="idv_vehicle_bundle")
+                tasks["funding_rollup"] = asyncio.create_task(self._post("idvs/funding_rollup/", resolved_id, request_id))
+            if "hierarchy" in include:
+                # Full crawl of child orders and child IDVs, rolled up (bounded by the request deadline)
+                tasks["hierarchy"] = asyncio.create_task(
+                    self._crawl_hierarchy(resolved_id, hierarchy_top_n, request_id)
+                )
+            responses = dict(zip(tasks, await asyncio.gather(*tasks.values()), strict=True))
+
+            if "orders" in responses:
+                orders, truncated = responses["orders"]
+                result_bundle["orders"] = orders
+                if truncated:
+                    result_bundle["orders_truncated"] = True
+                endpoints_used.append("idvs/awards/")
+
+            # Activity (by year/month)
+            if "activity" in responses:
+                result_bundle["activity"] = responses["activity"].get("results", [])
+                endpoints_used.append("idvs/activity/")
+
+            # Funding Rollup (by agency/account)
+            if "funding_rollup" in responses:
                 # Structure: { "total_transaction_obligated_amount": ..., "awarding_agency_count": ..., ... }
-                result_bundle["funding_rollup"] = resp
-                endpoints_used.append(endpoint)
+                result_bundle["funding_rollup"] = responses["funding_rollup"]
+                endpoints_used.append("idvs/funding_rollup/")
+
+            partial_meta = {}
+            if "hierarchy" in responses:
+                result_bundle["hierarchy"] = responses["hierarchy"]
+                if "idvs/awards/" not in endpoints_used:
+                    endpoints_used.append("idvs/awards/")
+                if not responses["hierarchy"]["complete"]:
+                    partial_meta = {"partial": True}
 
             return ok(
                 result_bundle,
                 request_id=request_id,
                 scope_mode=scope_mode,
-                endpoints_used=endpoints_used
+                endpoints_used=endpoints_used,
+                **partial_meta
             )
 
         except APIError as e:
             return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
         except Exception as e:
             return fail("unknown", str(e), request_id)
+        finally:
+            # If one sub-fetch failed, don't leave the others running
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved
@@ -1,6 +1,7 @@
 import time
 from typing import Any, Dict, List, Optional
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import SCOPE_ALL_AWARDS
 from usaspending_mcp.cache import Cache
 from usaspending_mcp.response import fail, ok
@@ -22,7 +23,11 @@ class RecipientProfileTool:
     def _is_duns(self, val: str) -> bool:
         return len(val) == 9 and val.isdigit()
 
-    def execute(
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def aexecute(
         self, 
         recipient: str,
         time_period: Optional[List[Dict[str, str]]] = None,
@@ -53,7 +58,7 @@ class RecipientProfileTool:
             # Try to resolve
             # We use our resolver tool
             # Note: ResolveEntities returns a list of matches. We take top 1.
-            resolve_res = self.resolver.execute(recipient, types=["recipient"], limit=1, request_id=request_id)
+            resolve_res = await self.resolver.aexecute(recipient, types=["recipient"], limit=1, request_id=request_id)
             if resolve_res.get("error"):
                  return fail("dependency_error", "Failed to resolve recipient", request_id)
             
@@ -97,7 +102,7 @@ class RecipientProfileTool:
                     rollup_filters["recipient_search_text"] = [recipient_name]
 
                 # We want spending by Agency and maybe by State
-                rollup_res = self.rollups.execute(
+                rollup_res = await self.rollups.aexecute(
                     time_period=time_period,
                     filters=rollup_filters,
                     group_by="awarding_agency",
@@ -1,20 +1,97 @@
+import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.cache import Cache
 from usaspending_mcp.response import fail, ok, pick_fields
+from usaspending_mcp.tools.bootstrap_catalog import CATALOG_CACHE_KEY, BootstrapCatalogTool
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
 CACHE_TTL = 3600  # 1 hour
 DEFAULT_TYPES = ["agency", "recipient"]
 AGENCY_OUTPUT_FIELDS = ["agency_name", "toptier_code", "abbreviation"]
+# Upper bound on concurrent autocomplete calls per resolve_entities call
+MAX_CONCURRENT_LOOKUPS = 4
+
+# Entity type -> (autocomplete endpoint, label used in notes)
+AUTOCOMPLETE_ENDPOINTS = {
+    "recipient": ("autocomplete/recipient/", "Recipient"),
+    # PRD: "POST /autocomplete/naics/ (if available)"; a 404 is reported in notes
+    "naics": ("autocomplete/naics/", "NAICS"),
+    "psc": ("autocomplete/psc/", "PSC"),
+    "assistance_listing": ("autocomplete/assistance_listing/", "Assistance Listing"),
+}
+# Entity type -> bootstrap catalog section with a local code index (used before autocomplete)
+CODE_INDEX_SECTIONS = {
+    "naics": "naics",
+    "psc": "psc",
+    "assistance_listing": "assistance_listings",
+}
 
 class ResolveEntitiesTool:
-    def __init__(self, client: USAspendingClient, cache: Cache):
+    def __init__(self, client: USAspendingClient, cache: Cache, catalog: Optional[BootstrapCatalogTool] = None):
         self.client = client
         self.cache = cache
+        # Shared catalog so agency lookups get its stale-while-revalidate behaviour
+        self.catalog = catalog or BootstrapCatalogTool(client, cache)
+
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def _match_agencies(self, q: str, limit: int, request_id: str) -> List[Dict[str, Any]]:
+        # Agency index comes from the bootstrap catalog; a stale copy is served
+        # while it refreshes in the background, so this only fetches on a cold cache.
+        index = await self.catalog.aget_agency_index(request_id=request_id)
+        return pick_fields(index.search(q, limit), AGENCY_OUTPUT_FIELDS)
+
+    async def _resolve_type(
+        self, entity_type: str, q: str, limit: int, request_id: str, pool: asyncio.Semaphore
+    ) -> Tuple[List[Any], bool, Optional[str]]:
+        """
+        Matches for one entity type, whether they were served without an upstream call
+        and the upstream endpoint called (None if answered locally). Autocomplete results
+        are cached per type, so overlapping `types` lists reuse each other's lookups.
+        Index-served matches (agencies, and codes when the catalog holds their list) aren't
+        cached here: the indexes are rebuilt whenever the catalog refreshes, and a lookup
+        in them is cheaper than a cache read.
+        """
+        if entity_type == "agency":
+            warm = await self.cache.aget_entry(CATALOG_CACHE_KEY) is not None
+            return await self._match_agencies(q, limit, request_id), warm, None
+        if entity_type in CODE_INDEX_SECTIONS:
+            # Code lists loaded by bootstrap_catalog answer locally; autocomplete only on a miss
+            code_index = await self.catalog.acode_index(CODE_INDEX_SECTIONS[entity_type])
+            local = code_index.search(q, limit) if code_index is not None else []
+            if local:
+                return local, True, None
+
+        cache_key = self.cache.make_key({
+            "tool": "resolve_entities",
+            "type": entity_type,
+            "q": q.lower(),
+            "limit": limit
+        })
+        cached, hit = await self.cache.aget(cache_key)
+        if hit:
+            return cached, True, None
 
-    def execute(
+        endpoint, _ = AUTOCOMPLETE_ENDPOINTS[entity_type]
+        async with pool:
+            resp = await self.client.arequest(
+                "POST",
+                endpoint,
+                json_data={"search_text": q, "limit": limit},
+                request_id=request_id,
+                tool_name="resolve_entities"
+            )
+        results = resp.get("results", [])
+
+        await self.cache.aset(cache_key, results, ttl_seconds=CACHE_TTL)
+        return results, False, endpoint
+
+    async def aexecute(
         self, 
         q: str, 
         types: Optional[List[str]] = None, 
@@ -23,139 +100,52 @@ class ResolveEntitiesTool:
     ) -> Dict[str, Any]:
         request_id = request_id or f"req-{int(time.time())}"
         types = types or DEFAULT_TYPES
-        
-        # Check cache
-        cache_key = {
-            "tool": "resolve_entities",
-            "q": q.lower(),
-            "types": sorted(types),
-            "limit": limit
-        }
-        cached_data, hit = self.cache.get(cache_key)
-        if hit:
-            return ok(
-                cached_data, 
-                request_id=request_id,
-                endpoints_used=["(cached)"],
-                cache_hit=True
-            )
 
         matches = {k: [] for k in types}
         endpoints_used = []
         notes = []
 
+        # All types are looked up concurrently (autocomplete calls bounded by the pool);
+        # a failure in one type is reported in notes and doesn't affect the others.
+        resolvable = [t for t in types if t == "agency" or t in AUTOCOMPLETE_ENDPOINTS]
+        pool = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+        outcomes = await asyncio.gather(
+            *(self._resolve_type(t, q, limit, request_id, pool) for t in resolvable),
+            return_exceptions=True
+        )
+
+        errors = []
+        all_cached = True
         try:
-            # 1. Agencies (Local Search from Toptier List)
-            if "agency" in types:
-                # We need the full agency list. We could use BootstrapCatalogTool logic here,
-                # but for simplicity we'll fetch/cache the list directly or assume it's pre-loaded.
-                # In a real app, we might share the catalog instance. Here we'll just fetch it if needed.
-                # Ideally, we should use a shared catalog service, but we'll fetch it here and rely on client cache or short TTL.
-                
-                # Check if we have agencies in cache under the catalog key to avoid re-fetching
-                catalog_data, catalog_hit = self.cache.get("bootstrap_catalog_v1")
-                agencies = []
-                
-                if catalog_hit and "toptier_agencies" in catalog_data:
-                    agencies = catalog_data["toptier_agencies"]
-                else:
-                    # Fetch fresh if missing
-                    endpoint = "references/toptier_agencies/"
-                    resp = self.client.request("GET", endpoint, request_id=request_id, tool_name="resolve_entities")
-                    agencies = resp.get("results", [])
-                    endpoints_used.append(endpoint)
-                
-                # Simple containment search
-                q_lower = q.lower()
-                agency_matches = []
-                for agency in agencies:
-                    name = agency.get("agency_name", "") or agency.get("toptier_code", "")
-                    abbrev = agency.get("abbreviation", "")
-                    
-                    if q_lower in name.lower() or (abbrev and q_lower == abbrev.lower()):
-                        agency_matches.append(agency)
-                
-                # Sort by simple relevance (exact match first, then starts with)
-                agency_matches.sort(key=lambda x: (
-                    x.get("abbreviation", "").lower() != q_lower, # Abbrev match first
-                    not x.get("agency_name", "").lower().startswith(q_lower), # Starts with second
-                    x.get("agency_name") # Alphabetical
-                ))
-                
-                matches["agency"] = pick_fields(agency_matches[:limit], AGENCY_OUTPUT_FIELDS)
-
-            # 2. Recipients (Autocomplete API)
-            if "recipient" in types:
-                endpoint = "autocomplete/recipient/"
-                payload = {"search_text": q, "limit": limit}
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="resolve_entities")
-                matches["recipient"] = resp.get("results", [])
-                endpoints_used.append(endpoint)
-
-            # 3. NAICS (Autocomplete API - assumed available based on standard USASpending structure)
-            if "naics" in types:
-                # Try glossaries or filter tree if autocomplete isn't direct. 
-                # Checking API docs, /api/v2/references/filter_tree/naics/ exists, 
-                # but autocomplete might be separate. We'll try a common pattern or skip if unsure.
-                # Given PRD says "POST /autocomplete/naics/ (if available)", let's assume it is or use filter tree search logic.
-                # For safety in v1, let's omit if not standard. 
-                # Actually, standard usage often implies `api/v2/autocomplete/funding_agency` etc. 
-                # Let's try `api/v2/autocomplete/naics` if it exists, otherwise note it.
-                # We'll stick to PRD request: "POST /autocomplete/naics/"
-                try:
-                    endpoint = "autocomplete/naics/" 
-                    payload = {"search_text": q, "limit": limit}
-                    # This might 404 if not real. Wrapping in try/except for this specific block if we aren't sure.
-                    # However, usually we want to fail or just log. We'll attempt it.
-                    resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="resolve_entities")
-                    matches["naics"] = resp.get("results", [])
-                    endpoints_used.append(endpoint)
-                except APIError as e:
-                    if e.status_code == 404:
-                         notes.append("NAICS autocomplete endpoint not found.")
-                    else:
-                        raise e
-
-            # 4. PSC (Autocomplete API)
-            if "psc" in types:
-                try:
-                    endpoint = "autocomplete/psc/"
-                    payload = {"search_text": q, "limit": limit}
-                    resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="resolve_entities")
-                    matches["psc"] = resp.get("results", [])
-                    endpoints_used.append(endpoint)
-                except APIError as e:
-                    if e.status_code == 404:
-                         notes.append("PSC autocomplete endpoint not found.")
+            for entity_type, outcome in zip(resolvable, outcomes, strict=True):
+                if isinstance(outcome, APIError):
+                    errors.append(outcome)
+                    label = AUTOCOMPLETE_ENDPOINTS.get(entity_type, (None, "Agency"))[1]
+                    if outcome.status_code == 404:
+                        notes.append(f"{label} autocomplete endpoint not found.")
                     else:
-                        raise e
-
-            # 5. Assistance Listing (CFDA)
-            if "assistance_listing" in types:
-                # often under /api/v2/autocomplete/assistance_listing/ or similar
-                try:
-                    endpoint = "autocomplete/assistance_listing/"
-                    payload = {"search_text": q, "limit": limit}
-                    resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="resolve_entities")
-                    matches["assistance_listing"] = resp.get("results", [])
-                    endpoints_used.append(endpoint)
-                except APIError:
-                     notes.append("Assistance Listing autocomplete endpoint failed or not found.")
+                        notes.append(f"{label} lookup failed ({outcome.error_type}).")
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
+                matches[entity_type], hit, endpoint = outcome
+                all_cached = all_cached and hit
+                if endpoint is not None:
+                    endpoints_used.append(endpoint)
 
-            result_data = {"matches": matches, "notes": notes}
-            
-            # Cache result
-            self.cache.set(cache_key, result_data, ttl_seconds=CACHE_TTL)
+            if errors and len(errors) == len(resolvable):
+                e = errors[0]
+                return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
 
+            partial_meta = {"partial": True} if errors else {}
             return ok(
-                result_data,
+                {"matches": matches, "notes": notes},
                 request_id=request_id,
-                endpoints_used=endpoints_used,
-                cache_hit=False
+                endpoints_used=endpoints_used if not (all_cached and resolvable) else ["(cached)"],
+                cache_hit=bool(resolvable) and all_cached,
+                **partial_meta
             )
 
-        except APIError as e:
-            return fail(e.error_type, e.message, request_id, endpoint=e.endpoint, status_code=e.status_code)
         except Exception as e:
             return fail("unknown", str(e), request_id)
@@ -1,6 +1,7 @@
 import time
 from typing import Any, Dict, List, Optional
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.award_types import SCOPE_ALL_AWARDS, get_award_type_codes
 from usaspending_mcp.response import fail, ok
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
@@ -26,7 +27,11 @@ class SpendingRollupsTool:
         }
         return mapping.get(group_by, group_by)
 
-    def execute(
+    def execute(self, *args, **kwargs) -> Dict[str, Any]:
+        """Blocking wrapper around aexecute() for synchronous callers."""
+        return run_sync(self.aexecute(*args, **kwargs))
+
+    async def aexecute(
         self, 
         time_period: Optional[List[Dict[str, str]]] = None, 
         filters: Optional[Dict[str, Any]] = None, 
@@ -97,7 +102,7 @@ class SpendingRollupsTool:
                     "page": 1
                 }
                 
-                resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="spending_rollups")
+                resp = await self.client.arequest("POST", endpoint, json_data=payload, request_id=request_id, tool_name="spending_rollups")
                 endpoints_used.append(endpoint)
                 
                 return ok(
@@ -146,7 +151,13 @@ class SpendingRollupsTool:
                 
             payload["fields"] = ["Award Amount", field_name]
             
-            resp = self.client.request("POST", endpoint, json_data=payload, request_id=request_id, tool_name="spending_rollups_fallback")
+            resp = await self.client.arequest(
+                "POST",
+                endpoint,
+                json_data=payload,
+                request_id=request_id,
+                tool_name="spending_rollups_fallback"
+            )
             endpoints_used.append(endpoint)
             
             results = resp.get("results", [])
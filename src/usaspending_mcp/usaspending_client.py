@@ -1,17 +1,42 @@
+import asyncio
+import contextvars
 import json
 import logging
 import os
+import threading
 import time
 import uuid
-from typing import Any, Callable, Dict, Optional, Union
+import weakref
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple, Union
 
 import httpx
-from tenacity import Retrying, before_sleep_log, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, before_sleep_log, retry_if_exception, stop_after_attempt, wait_exponential
 
+from usaspending_mcp.async_bridge import run_sync
+from usaspending_mcp.cache import Cache
+from usaspending_mcp.endpoint_map import endpoint_template, get_cache_ttl_class
+from usaspending_mcp.hedging import HedgePolicy
+from usaspending_mcp.latency_tracker import AdaptiveTimeout, LatencyTracker
 from usaspending_mcp.logging_config import get_logger
+from usaspending_mcp.pagination import MAX_PAGE_SIZE, Paginator
+from usaspending_mcp.rate_limiter import RateLimiter, parse_retry_after
+from usaspending_mcp.request_context import current_request
+from usaspending_mcp.retry_budget import RetryBudget
+from usaspending_mcp.single_flight import SingleFlight
 
 logger = get_logger("usaspending_client")
 
+# Endpoint classes whose cached responses are served stale and refreshed in the background.
+REFRESH_AHEAD_CLASSES = frozenset({"references"})
+
+
+def _serves_stale_on(e: "APIError") -> bool:
+    """Degraded mode applies when USAspending is unreachable or slow, not when the request is bad."""
+    if e.error_type in ("network", "deadline"):
+        return True
+    return e.error_type == "upstream" and (e.status_code is None or e.status_code >= 500)
+
 class APIError(Exception):
     def __init__(
         self, 
@@ -47,23 +72,91 @@ class APIError(Exception):
             return "Wait a few seconds before retrying."
         if self.error_type == "validation":
             return "Check filters and parameters for correctness."
+        if self.error_type == "deadline":
+            return "Narrow the query or allow more time."
         return None
 
+def _deadline_error(endpoint: str, method: str) -> APIError:
+    return APIError(
+        error_type="deadline",
+        message=f"Request deadline exceeded before {method} {endpoint} completed",
+        endpoint=endpoint,
+        method=method
+    )
+
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+def _is_retryable(e: BaseException) -> bool:
+    """Network errors, timeouts, 429s and 5xx are retried; other 4xx responses are not."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return _is_retryable_status(e.response.status_code)
+    return isinstance(e, (httpx.NetworkError, httpx.TimeoutException))
+
 class CircuitOpenError(Exception):
     """Raised when the circuit breaker is open."""
     pass
 
 class CircuitBreaker:
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60, half_open_requests: int = 2):
+    """
+    Circuit breaker over a sliding time window.
+
+    CLOSED -> OPEN when, within the last window_seconds, at least failure_threshold calls
+    failed and they make up at least failure_rate_threshold of the calls. After
+    recovery_timeout it goes HALF_OPEN and lets at most half_open_requests probes run at
+    once; that many successful probes close it, any failed probe re-opens it.
+    All state changes happen under a lock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: int = 60,
+        half_open_requests: int = 2,
+        failure_rate_threshold: float = 0.5,
+        window_seconds: float = 60.0,
+        name: str = "default"
+    ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_requests_limit = half_open_requests
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_seconds = window_seconds
+        self.name = name
+
+        self._lock = threading.Lock()
+        # (timestamp, failed) per completed call, oldest first
+        self._window: Deque[Tuple[float, bool]] = deque()
+        self._window_failures = 0
         
         self.state = "CLOSED"
-        self.failure_count = 0
         self.last_failure_time = None
         self.half_open_success_count = 0
+        # Probes currently in flight while HALF_OPEN
         self.half_open_request_count = 0
+        self.rejected_count = 0
+
+    @property
+    def failure_count(self) -> int:
+        """Failures in the current window."""
+        with self._lock:
+            self._prune(time.time())
+            return self._window_failures
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            _, failed = self._window.popleft()
+            self._window_failures -= failed
+
+    def _record(self, failed: bool, now: float) -> None:
+        self._window.append((now, failed))
+        self._window_failures += failed
+        self._prune(now)
+
+    def _reset_window(self) -> None:
+        self._window.clear()
+        self._window_failures = 0
 
     def _should_try_reset(self) -> bool:
         if self.last_failure_time is None:
@@ -71,72 +164,166 @@ class CircuitBreaker:
         return (time.time() - self.last_failure_time) >= self.recovery_timeout
 
     def _on_success(self):
-        if self.state == "HALF_OPEN":
-            self.half_open_success_count += 1
-            if self.half_open_success_count >= self.half_open_requests_limit:
-                logger.info("CircuitBreaker HALF_OPEN -> CLOSED (Recovery Success)")
-                self.state = "CLOSED"
-                self.failure_count = 0
-                self.half_open_success_count = 0
-                self.half_open_request_count = 0
-        elif self.state == "CLOSED":
-            self.failure_count = 0
+        with self._lock:
+            if self.state == "HALF_OPEN":
+                self.half_open_request_count = max(0, self.half_open_request_count - 1)
+                self.half_open_success_count += 1
+                if self.half_open_success_count >= self.half_open_requests_limit:
+                    logger.info(f"CircuitBreaker[{self.name}] HALF_OPEN -> CLOSED (Recovery Success)")
+                    self.state = "CLOSED"
+                    self._reset_window()
+                    self.half_open_success_count = 0
+                    self.half_open_request_count = 0
+            elif self.state == "CLOSED":
+                self._record(False, time.time())
 
     def _on_failure(self):
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.state == "CLOSED":
-            if self.failure_count >= self.failure_threshold:
-                logger.warning(f"CircuitBreaker CLOSED -> OPEN (Threshold {self.failure_threshold} reached)")
+        now = time.time()
+        with self._lock:
+            self.last_failure_time = now
+            if self.state == "CLOSED":
+                self._record(True, now)
+                total = len(self._window)
+                if (
+                    self._window_failures >= self.failure_threshold
+                    and self._window_failures / total >= self.failure_rate_threshold
+                ):
+                    logger.warning(
+                        f"CircuitBreaker[{self.name}] CLOSED -> OPEN "
+                        f"({self._window_failures}/{total} failed in {self.window_seconds:g}s)"
+                    )
+                    self.state = "OPEN"
+            elif self.state == "HALF_OPEN":
+                logger.warning(f"CircuitBreaker[{self.name}] HALF_OPEN -> OPEN (Probe Failed)")
                 self.state = "OPEN"
-        elif self.state == "HALF_OPEN":
-            logger.warning("CircuitBreaker HALF_OPEN -> OPEN (Probe Failed)")
-            self.state = "OPEN"
-            self.half_open_success_count = 0
-            self.half_open_request_count = 0
-
-    def call(self, func: Callable, *args, **kwargs):
-        if self.state == "OPEN":
-            if self._should_try_reset():
-                logger.info("CircuitBreaker OPEN -> HALF_OPEN (Attempting Recovery)")
-                self.state = "HALF_OPEN"
-                self.half_open_request_count = 0
                 self.half_open_success_count = 0
-            else:
-                raise CircuitOpenError("Circuit breaker is open - failing fast")
+                self.half_open_request_count = 0
+
+    def _on_neutral(self):
+        """A call finished without a success or a countable failure (e.g. a 4xx or cancellation)."""
+        with self._lock:
+            if self.state == "HALF_OPEN":
+                self.half_open_request_count = max(0, self.half_open_request_count - 1)
+
+    def _before_call(self):
+        with self._lock:
+            if self.state == "OPEN":
+                if self._should_try_reset():
+                    logger.info(f"CircuitBreaker[{self.name}] OPEN -> HALF_OPEN (Attempting Recovery)")
+                    self.state = "HALF_OPEN"
+                    self.half_open_request_count = 0
+                    self.half_open_success_count = 0
+                else:
+                    self.rejected_count += 1
+                    raise CircuitOpenError("Circuit breaker is open - failing fast")
 
-        if self.state == "HALF_OPEN":
-            if self.half_open_request_count >= self.half_open_requests_limit:
-                 raise CircuitOpenError("Circuit breaker is half-open - probe limit reached")
-            self.half_open_request_count += 1
+            if self.state == "HALF_OPEN":
+                if self.half_open_request_count >= self.half_open_requests_limit:
+                    self.rejected_count += 1
+                    raise CircuitOpenError("Circuit breaker is half-open - probe limit reached")
+                self.half_open_request_count += 1
 
+    @staticmethod
+    def _counts_as_failure(e: BaseException) -> bool:
+        # We only count network/upstream errors (and throttling) as breaker failures
+        if isinstance(e, httpx.HTTPStatusError):
+            return e.response.status_code >= 500 or e.response.status_code == 429
+        if isinstance(e, APIError):
+            return e.error_type == "network" or (
+                e.status_code is not None and (e.status_code >= 500 or e.status_code == 429)
+            )
+        return isinstance(e, (httpx.NetworkError, httpx.TimeoutException))
+
+    def _on_exception(self, e: BaseException):
+        if self._counts_as_failure(e):
+            self._on_failure()
+        else:
+            self._on_neutral()
+
+    def call(self, func: Callable, *args, **kwargs):
+        self._before_call()
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except (httpx.NetworkError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
-            # We only count network/upstream errors as breaker failures
-            should_count_failure = True
-            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500 and e.response.status_code != 429:
-                should_count_failure = False
-            
-            if should_count_failure:
-                self._on_failure()
+        except BaseException as e:
+            self._on_exception(e)
             raise
+        self._on_success()
+        return result
+
+    async def acall(self, func: Callable[..., Awaitable[Any]], *args, **kwargs):
+        """Async counterpart of call(): awaits func under the same breaker rules."""
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            # Includes cancellation, so an abandoned half-open probe frees its slot
+            self._on_exception(e)
+            raise
+        self._on_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune(time.time())
+            total = len(self._window)
+            return {
+                "state": self.state,
+                "window_calls": total,
+                "window_failures": self._window_failures,
+                "failure_rate": round(self._window_failures / total, 3) if total else 0.0,
+                "half_open_inflight": self.half_open_request_count,
+                "rejected": self.rejected_count,
+            }
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per endpoint template, so one flaky endpoint can't block the others."""
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        template = endpoint_template(endpoint)
+        breaker = self._breakers.get(template)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(template)
+                if breaker is None:
+                    breaker = CircuitBreaker(name=template, **self.breaker_kwargs)
+                    self._breakers[template] = breaker
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {template: breaker.snapshot() for template, breaker in sorted(breakers.items())}
 
 class USAspendingClient:
-    def __init__(self):
+    def __init__(self, cache: Optional[Cache] = None):
         self.base_url = os.getenv("USASPENDING_BASE_URL", "https://api.usaspending.gov/api/v2").rstrip("/")
         self.timeout = float(os.getenv("USASPENDING_TIMEOUT_S", "60.0"))
         self.max_retries = int(os.getenv("USASPENDING_MAX_RETRIES", "3"))
         self.backoff_base = float(os.getenv("USASPENDING_BACKOFF_BASE_S", "0.5"))
-        
-        self.client = httpx.Client(timeout=self.timeout)
+        self.max_connections = int(os.getenv("USASPENDING_MAX_CONNECTIONS", "200"))
+        self.single_flight_enabled = os.getenv("USASPENDING_SINGLE_FLIGHT", "true").lower() == "true"
+        self.single_flight = SingleFlight()
+
+        # One AsyncClient per event loop: httpx connection pools cannot be shared across loops.
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
         
         # Initialize Breaker with defaults or from config file if available
         rules_path = os.path.join(os.path.dirname(__file__), "router_rules.json")
-        cb_config = {"failure_threshold": 5, "recovery_timeout_seconds": 60, "half_open_requests": 2}
+        cb_config = {
+            "failure_threshold": 5,
+            "recovery_timeout_seconds": 60,
+            "half_open_requests": 2,
+            "failure_rate_threshold": 0.5,
+            "window_seconds": 60
+        }
+        rules = {}
         if os.path.exists(rules_path):
             try:
                 with open(rules_path, "r") as f:
@@ -145,12 +332,143 @@ class USAspendingClient:
             except Exception:
                 pass
         
-        self.breaker = CircuitBreaker(
+        self.breakers = CircuitBreakerRegistry(
             failure_threshold=cb_config["failure_threshold"],
             recovery_timeout=cb_config["recovery_timeout_seconds"],
-            half_open_requests=cb_config["half_open_requests"]
+            half_open_requests=cb_config["half_open_requests"],
+            failure_rate_threshold=cb_config["failure_rate_threshold"],
+            window_seconds=cb_config["window_seconds"]
+        )
+
+        # Process-wide rate limit (one client per process); env overrides the global rate/burst
+        rate_config = {"requests_per_second": 10, "burst": 20, **rules.get("rate_limits", {})}
+        if os.getenv("USASPENDING_RATE_LIMIT_RPS"):
+            rate_config["requests_per_second"] = float(os.getenv("USASPENDING_RATE_LIMIT_RPS"))
+        if os.getenv("USASPENDING_RATE_LIMIT_BURST"):
+            rate_config["burst"] = float(os.getenv("USASPENDING_RATE_LIMIT_BURST"))
+        self.rate_limiter = RateLimiter.from_config(rate_config)
+
+        # Retries across all requests are capped at a fraction of request volume (no retry storms)
+        retry_config = dict(rules.get("retry_budget", {}))
+        if os.getenv("USASPENDING_RETRY_BUDGET_RATIO"):
+            retry_config["ratio"] = float(os.getenv("USASPENDING_RETRY_BUDGET_RATIO"))
+        self.retry_budget = RetryBudget.from_config(
+            retry_config,
+            enabled=os.getenv("USASPENDING_RETRY_BUDGET", "true").lower() == "true"
+        )
+
+        # Latency per endpoint template; drives per-attempt timeouts and the hedge delay for idempotent GETs
+        self.latency = LatencyTracker()
+        self.timeouts = AdaptiveTimeout.from_config(
+            self.latency,
+            self.timeout,
+            rules.get("adaptive_timeouts", {}),
+            enabled=os.getenv("USASPENDING_ADAPTIVE_TIMEOUTS", "true").lower() == "true"
+        )
+        self.hedging = HedgePolicy.from_config(
+            self.latency,
+            rules.get("hedging", {}),
+            enabled=os.getenv("USASPENDING_HEDGING", "true").lower() == "true"
+        )
+
+        # Response cache: TTLs per endpoint class come from router_rules "caching_ttl_seconds"
+        self.cache = cache
+        self.cache_ttls: Dict[str, int] = rules.get("caching_ttl_seconds", {})
+        self.response_cache_enabled = os.getenv("USASPENDING_RESPONSE_CACHE", "true").lower() == "true"
+
+        # Refresh-ahead: hot reference entries are re-fetched in the background once less
+        # than this fraction of their TTL remains, and served stale for one more TTL.
+        self.refresh_ahead_fraction = float(os.getenv("USASPENDING_REFRESH_AHEAD_FRACTION", "0.1"))
+        # Degraded mode: expired responses are kept this long and served (tagged stale)
+        # when the breaker is open or USAspending times out.
+        self.stale_if_error_seconds = float(os.getenv("USASPENDING_STALE_IF_ERROR_S", "86400"))
+        self.stale_served = 0
+        # Keys being refreshed; shared by every event loop using this client (server loop
+        # and the sync bridge loop), hence the lock
+        self._refreshing: Set[str] = set()
+        self._refreshing_lock = threading.Lock()
+        self.background_refreshes = 0
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections // 4),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Closes the AsyncClient bound to the running event loop, if any."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _request_key(self, method: str, endpoint: str, params: Optional[Dict], json_data: Optional[Dict]) -> str:
+        """Identity of an upstream call: method, endpoint, params and canonicalized JSON body."""
+        return json.dumps(
+            [method.upper(), f"/{endpoint.lstrip('/')}", params, json_data],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+
+    def _response_cache_ttl(self, endpoint: str) -> Optional[int]:
+        if self.cache is None or not self.response_cache_enabled:
+            return None
+        ttl_class = get_cache_ttl_class(endpoint)
+        return self.cache_ttls.get(ttl_class) if ttl_class else None
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict]
+    ) -> None:
+        """Re-fetches a cached response in the background; at most one refresh per key."""
+        with self._refreshing_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+            self.background_refreshes += 1
+
+        # Fresh context: the refresh must not count against (or log as) the triggering tool call.
+        task = asyncio.get_running_loop().create_task(
+            self.arequest(method, endpoint, tool_name="refresh_ahead", params=params, json_data=json_data, refresh=True),
+            context=contextvars.Context()
         )
 
+        def _done(t: asyncio.Task) -> None:
+            with self._refreshing_lock:
+                self._refreshing.discard(cache_key)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(
+                    f"Background refresh failed: {endpoint}",
+                    extra={"endpoint": endpoint, "error_type": "refresh_failed"}
+                )
+
+        task.add_done_callback(_done)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of client-side counters."""
+        return {
+            "single_flight": self.single_flight.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "retry_budget": self.retry_budget.stats(),
+            "circuit_breakers": self.breakers.stats(),
+            "refresh_ahead": {"inflight": len(self._refreshing), "scheduled": self.background_refreshes},
+            "stale_served": self.stale_served,
+            "hedging": self.hedging.stats(),
+            "latency": {
+                template: {**stats, "read_timeout_s": round(self.timeouts.read_timeout(template), 2)}
+                for template, stats in self.latency.stats().items()
+            },
+        }
+
     def request(
         self, 
         method: str, 
@@ -158,13 +476,72 @@ class USAspendingClient:
         request_id: Optional[str] = None,
         tool_name: str = "unknown",
         params: Optional[Dict] = None,
-        json_data: Optional[Dict] = None
+        json_data: Optional[Dict] = None,
+        refresh: bool = False
     ) -> Union[Dict, Any]:
-        
+        """Blocking wrapper around arequest() for synchronous callers."""
+        return run_sync(
+            self.arequest(
+                method,
+                endpoint,
+                request_id=request_id,
+                tool_name=tool_name,
+                params=params,
+                json_data=json_data,
+                refresh=refresh
+            )
+        )
+
+    async def arequest(
+        self, 
+        method: str, 
+        endpoint: str, 
+        request_id: Optional[str] = None,
+        tool_name: str = "unknown",
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        refresh: bool = False,
+        use_cache: bool = True
+    ) -> Union[Dict, Any]:
+        """
+        Calls the USAspending API. Cacheable endpoints are served from the response cache;
+        refresh=True skips the cache read but still stores the new response, and
+        use_cache=False bypasses the cache entirely (one-off pages of a large crawl).
+        """
         request_id = request_id or str(uuid.uuid4())
-        
-        try:
-            return self.breaker.call(
+        endpoint_clean = f"/{endpoint.lstrip('/')}"
+        ctx = current_request()
+
+        ttl = self._response_cache_ttl(endpoint) if use_cache else None
+        cache_key = None
+        stale_ttl = 0
+        if ttl:
+            cache_key = self.cache.make_key(
+                {"method": method.upper(), "endpoint": endpoint_clean, "params": params, "json": json_data}
+            )
+            refresh_ahead = get_cache_ttl_class(endpoint) in REFRESH_AHEAD_CLASSES
+            stale_ttl = max(ttl if refresh_ahead else 0, self.stale_if_error_seconds)
+            entry = None if refresh else await self.cache.aget_entry(cache_key)
+            if entry is not None:
+                fresh = entry.is_fresh()
+                if refresh_ahead and (not fresh or entry.remaining() < ttl * self.refresh_ahead_fraction):
+                    self._schedule_refresh(cache_key, method, endpoint, params, json_data)
+                if fresh or refresh_ahead:
+                    logger.info(
+                        f"USAspending cache hit: {endpoint_clean}",
+                        extra={
+                            "endpoint": endpoint_clean,
+                            "method": method,
+                            "cache_hit": True,
+                            "stale": not fresh
+                        }
+                    )
+                    if ctx is not None:
+                        ctx.record_cache(hit=True)
+                    return entry.value
+
+        async def call_upstream():
+            result = await self.breakers.get(endpoint_clean).acall(
                 self._do_request,
                 method=method,
                 endpoint=endpoint,
@@ -173,23 +550,173 @@ class USAspendingClient:
                 params=params,
                 json_data=json_data
             )
-        except CircuitOpenError as e:
-            logger.error(
-                f"Circuit breaker open for {endpoint}",
-                extra={
-                    "endpoint": endpoint,
-                    "error_type": "circuit_open",
-                    "circuit_state": "OPEN"
-                }
-            )
-            raise APIError(
-                error_type="upstream",
-                message=str(e),
-                endpoint=endpoint,
-                method=method
-            ) from e
+            if cache_key is not None:
+                await self.cache.aset(cache_key, result, ttl_seconds=ttl, stale_ttl_seconds=stale_ttl)
+            return result
+        
+        try:
+            if not self.single_flight_enabled:
+                result = await call_upstream()
+            else:
+                key = self._request_key(method, endpoint, params, json_data)
+                # The shared call is bounded by the latest deadline among joined callers;
+                # this caller stops waiting at its own
+                try:
+                    result = await self.single_flight.do(
+                        key, call_upstream, deadline=ctx.deadline if ctx is not None else None
+                    )
+                except asyncio.TimeoutError:
+                    raise _deadline_error(endpoint, method) from None
+            if ctx is not None and self.cache is not None and self.response_cache_enabled:
+                ctx.record_cache(hit=False)
+            return result
+        except (CircuitOpenError, APIError) as e:
+            error = e
+            if isinstance(e, CircuitOpenError):
+                logger.error(
+                    f"Circuit breaker open for {endpoint_template(endpoint_clean)}",
+                    extra={
+                        "endpoint": endpoint_clean,
+                        "error_type": "circuit_open",
+                        "circuit_state": self.breakers.get(endpoint_clean).state
+                    }
+                )
+                error = APIError(
+                    error_type="upstream",
+                    message=str(e),
+                    endpoint=endpoint,
+                    method=method
+                )
 
-    def _do_request(
+            if cache_key is not None and _serves_stale_on(error):
+                entry = await self.cache.aget_entry(cache_key)
+                if entry is not None:
+                    self.stale_served += 1
+                    logger.warning(
+                        f"Serving stale response for {endpoint_clean} ({error.error_type})",
+                        extra={
+                            "endpoint": endpoint_clean,
+                            "method": method,
+                            "cache_hit": True,
+                            "error_type": "stale_data"
+                        }
+                    )
+                    if ctx is not None:
+                        ctx.record_cache(hit=True)
+                        if not entry.is_fresh():
+                            ctx.record_stale(entry.age())
+                    return entry.value
+
+            if error is e:
+                raise
+            raise error from e
+
+    def paginate(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Dict[str, Any],
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        request_id: Optional[str] = None,
+        tool_name: str = "unknown",
+        use_cache: bool = True
+    ) -> Paginator:
+        """
+        Streams records across pages of a list endpoint (see Paginator). The "page" and
+        "limit" keys of json_data are managed by the paginator.
+        """
+        return Paginator(
+            self,
+            method,
+            endpoint,
+            json_data,
+            page_size=page_size,
+            max_items=max_items,
+            max_bytes=max_bytes,
+            max_pages=max_pages,
+            request_id=request_id,
+            tool_name=tool_name,
+            use_cache=use_cache
+        )
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        endpoint_clean: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict]
+    ) -> httpx.Response:
+        """
+        Sends one attempt. Eligible GETs are hedged: if no answer arrives within the
+        hedge delay, an identical request is sent and the first good response wins.
+        """
+        template = endpoint_template(endpoint_clean)
+        delay = self.hedging.delay(method, template)
+        read_timeout = self.timeouts.read_timeout(template)
+        overall = self.timeout
+        # A request deadline caps every phase of the attempt at the time left
+        ctx = current_request()
+        remaining = ctx.remaining() if ctx is not None else None
+        if remaining is not None:
+            read_timeout = min(read_timeout, remaining)
+            overall = min(overall, remaining)
+        timeout = httpx.Timeout(overall, connect=self.timeouts.connect_timeout(read_timeout), read=read_timeout)
+
+        async def send(rate_limited: bool = False) -> httpx.Response:
+            if rate_limited:
+                await self.rate_limiter.acquire(endpoint_clean)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method=method, url=url, params=params, json=json_data, timeout=timeout)
+            except httpx.TimeoutException:
+                # Censored sample: lets the timeout widen again if the endpoint got slower
+                self.latency.record(template, time.perf_counter() - start)
+                logger.warning(
+                    f"USAspending request timed out after {read_timeout:.1f}s: {endpoint_clean}",
+                    extra={"endpoint": endpoint_clean, "method": method, "error_type": "timeout"}
+                )
+                raise
+            self.latency.record(template, time.perf_counter() - start)
+            return response
+
+        if delay is None:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done and not self.hedging.budget.try_spend():
+            self.hedging.denied += 1
+            await asyncio.wait({primary})
+        if primary.done():
+            return primary.result()
+
+        self.hedging.sent += 1
+        hedge = asyncio.ensure_future(send(rate_limited=True))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # A throttled or failed answer doesn't win; keep waiting for the other request
+                    if task.exception() is None and not _is_retryable_status(task.result().status_code):
+                        if task is hedge:
+                            self.hedging.won += 1
+                        return task.result()
+            # Neither gave a good response: surface the primary's outcome
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved
+
+    async def _do_request(
         self,
         method: str,
         endpoint: str,
@@ -202,32 +729,65 @@ class USAspendingClient:
         url = f"{self.base_url}{endpoint_clean}"
         start_time = time.perf_counter()
         
-        retryer = Retrying(
-            stop=stop_after_attempt(self.max_retries + 1),
-            wait=wait_exponential(multiplier=self.backoff_base, min=self.backoff_base, max=10),
-            retry=retry_if_exception_type((httpx.NetworkError, httpx.TimeoutException, httpx.HTTPStatusError)),
+        backoff = wait_exponential(multiplier=self.backoff_base, min=self.backoff_base, max=10)
+        ctx = current_request()
+
+        def wait_before_retry(retry_state) -> float:
+            # A 429 with Retry-After already paused the rate limiter for that long
+            exc = retry_state.outcome.exception()
+            if isinstance(exc, httpx.HTTPStatusError) and exc.response.headers.get("Retry-After"):
+                return 0
+            return backoff(retry_state)
+
+        def out_of_time(retry_state) -> bool:
+            # Don't start a retry whose backoff alone would run past the request deadline
+            remaining = ctx.remaining() if ctx is not None else None
+            return remaining is not None and remaining <= (retry_state.upcoming_sleep or 0)
+
+        def budget_exhausted(retry_state) -> bool:
+            # Checked last, so a credit is only spent on a retry that would otherwise happen
+            if self.retry_budget.try_spend():
+                return False
+            logger.warning(
+                f"Retry budget exhausted; not retrying {endpoint_clean}",
+                extra={"endpoint": endpoint_clean, "method": method, "error_type": "retry_budget"}
+            )
+            return True
+
+        self.retry_budget.earn()
+        retryer = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1) | out_of_time | budget_exhausted,
+            wait=wait_before_retry,
+            retry=retry_if_exception(_is_retryable),
             before_sleep=before_sleep_log(logger, logging.WARNING),
             reraise=True
         )
 
         response = None
+        client = self._get_async_client()
+        queue_wait_s = 0.0
         
         try:
-            for attempt in retryer:
+            async for attempt in retryer:
                 with attempt:
+                    remaining = ctx.remaining() if ctx is not None else None
+                    if remaining is not None:
+                        if remaining <= 0:
+                            raise _deadline_error(endpoint_clean, method)
+                        try:
+                            queue_wait_s += await asyncio.wait_for(self.rate_limiter.acquire(endpoint_clean), remaining)
+                        except asyncio.TimeoutError:
+                            raise _deadline_error(endpoint_clean, method) from None
+                    else:
+                        queue_wait_s += await self.rate_limiter.acquire(endpoint_clean)
                     try:
-                        response = self.client.request(
-                            method=method,
-                            url=url,
-                            params=params,
-                            json=json_data
-                        )
+                        response = await self._send(client, method, url, endpoint_clean, params, json_data)
                         response.raise_for_status()
                     except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 429 or e.response.status_code >= 500:
-                            raise e
-                        else:
-                            raise e
+                        if e.response.status_code == 429:
+                            self.rate_limiter.on_throttled(parse_retry_after(e.response.headers.get("Retry-After")))
+                        raise
+                    self.rate_limiter.on_success()
                             
         except httpx.HTTPStatusError as e:
             status_code = e.response.status_code
@@ -248,6 +808,7 @@ class USAspendingClient:
                     "method": method,
                     "status_code": status_code,
                     "latency_ms": latency_ms,
+                    "queue_wait_ms": queue_wait_s * 1000,
                     "error_type": error_type
                 }
             )
@@ -263,12 +824,25 @@ class USAspendingClient:
             
         except (httpx.NetworkError, httpx.TimeoutException) as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
+            if ctx is not None and ctx.expired():
+                logger.error(
+                    f"Request deadline exceeded: {endpoint_clean}",
+                    extra={
+                        "endpoint": endpoint_clean,
+                        "method": method,
+                        "latency_ms": latency_ms,
+                        "queue_wait_ms": queue_wait_s * 1000,
+                        "error_type": "deadline"
+                    }
+                )
+                raise _deadline_error(endpoint_clean, method) from e
             logger.error(
                 f"Network error connecting to {endpoint_clean}",
                 extra={
                     "endpoint": endpoint_clean,
                     "method": method,
                     "latency_ms": latency_ms,
+                    "queue_wait_ms": queue_wait_s * 1000,
                     "error_type": "network"
                 }
             )
@@ -278,6 +852,20 @@ class USAspendingClient:
                 endpoint=endpoint_clean,
                 method=method
             ) from e
+
+        except APIError as e:
+            if e.error_type == "deadline":
+                logger.error(
+                    f"Request deadline exceeded: {endpoint_clean}",
+                    extra={
+                        "endpoint": endpoint_clean,
+                        "method": method,
+                        "latency_ms": (time.perf_counter() - start_time) * 1000,
+                        "queue_wait_ms": queue_wait_s * 1000,
+                        "error_type": "deadline"
+                    }
+                )
+            raise
             
         except Exception as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
@@ -308,6 +896,7 @@ class USAspendingClient:
                 "method": method,
                 "status_code": status_code,
                 "latency_ms": latency_ms,
+                "queue_wait_ms": queue_wait_s * 1000,
                 "cache_hit": False
             }
         )
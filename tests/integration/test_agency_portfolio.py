@@ -1,7 +1,12 @@
+import asyncio
+import time
+
 import httpx
 import pytest
 import respx
 
+from usaspending_mcp.endpoint_map import get_cache_ttl_class
+from usaspending_mcp.response import REMEDIATION_HINTS
 from usaspending_mcp.tools.agency_portfolio import AgencyPortfolioTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
@@ -51,3 +56,50 @@ def test_agency_portfolio_summary_fail(tool):
     # Code implementation catches APIError and returns result_bundle with "summary_error" key
     assert "summary" not in result
     assert "summary_error" in result
+
+@respx.mock
+def test_agency_portfolio_views_fetched_concurrently_with_isolated_failures(tool):
+    base = f"{tool.client.base_url}/agency/097"
+
+    def slow(payload):
+        async def respond(request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json=payload)
+        return respond
+
+    respx.get(f"{base}/").mock(side_effect=slow({"name": "Department of Defense"}))
+    respx.get(f"{base}/budgetary_resources/").mock(side_effect=slow({"agency_data_by_year": []}))
+    object_class = respx.get(f"{base}/object_class/").mock(side_effect=slow({"results": [{"name": "Personnel"}]}))
+    respx.get(f"{base}/program_activity/").mock(return_value=httpx.Response(404))
+
+    start = time.monotonic()
+    result = tool.execute(
+        "097",
+        views=["summary", "budgetary_resources", "object_class", "program_activity"],
+        time_period=[{"start_date": "2023-10-01", "end_date": "2024-09-30"}]
+    )
+
+    assert time.monotonic() - start < 0.35
+    assert result["summary"]["name"] == "Department of Defense"
+    assert result["object_class"]["results"] == [{"name": "Personnel"}]
+    assert "program_activity_error" in result
+    assert result["meta"]["failed_views"] == ["program_activity"]
+    assert object_class.calls.last.request.url.params["fiscal_year"] == "2024"
+
+def test_account_views_have_their_own_cache_ttl():
+    assert get_cache_ttl_class("agency/097/object_class/") == "agency_accounts"
+    assert get_cache_ttl_class("agency/097/awards/") == "rollups"
+
+@respx.mock
+def test_agency_portfolio_rejects_malformed_end_date(tool):
+    result = tool.execute("097", time_period=[{"start_date": "2024-10-01", "end_date": "2025-13-40"}])
+
+    assert result["error"]["type"] == "validation"
+    assert "end_date" in result["error"]["message"]
+    assert result["error"]["remediation_hint"] == REMEDIATION_HINTS["validation"]["invalid_time_period"]
+
+def test_agency_portfolio_rejects_non_object_time_period_entries(tool):
+    result = tool.execute("097", time_period=["2024-10-01", "2025-09-30"])
+
+    assert result["error"]["type"] == "validation"
+    assert result["error"]["remediation_hint"] == REMEDIATION_HINTS["validation"]["invalid_time_period"]
@@ -1,8 +1,12 @@
+import asyncio
+import time
+
 import httpx
 import pytest
 import respx
 
 from usaspending_mcp.award_types import SCOPE_ASSISTANCE_ONLY, SCOPE_CONTRACTS_ONLY
+from usaspending_mcp.request_context import request_scope
 from usaspending_mcp.tools.award_explain import AwardExplainTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
@@ -85,3 +89,73 @@ def test_award_explain_subawards_limit(tool):
     result = tool.execute(award_id, include=["subawards"], subawards_limit=10)
     
     assert len(result["subawards"]) == 10
+
+@respx.mock
+def test_award_explain_fetches_sections_concurrently(tool):
+    award_id = "CONT_AWD_FANOUT"
+    
+    respx.get(f"{tool.client.base_url}/awards/{award_id}/").mock(
+        return_value=httpx.Response(200, json={"type": "A"})
+    )
+    respx.post(f"{tool.client.base_url}/transactions/").mock(
+        return_value=httpx.Response(200, json={"results": [{"action_date": "2023-01-01"}]})
+    )
+    respx.post(f"{tool.client.base_url}/subawards/").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}]})
+    )
+    respx.post(f"{tool.client.base_url}/awards/funding/").mock(
+        return_value=httpx.Response(200, json={"results": [{"transaction_obligated_amount": 10}], "page_metadata": {"total": 1}})
+    )
+    
+    result = tool.execute(award_id, include=["summary", "transactions", "subawards", "funding"])
+    
+    assert result["summary"]["type"] == "A"
+    assert len(result["transactions"]) == 1
+    assert len(result["subawards"]) == 1
+    assert result["funding"] == [{"transaction_obligated_amount": 10}]
+    assert result["funding_total"] == 1
+
+@respx.mock
+def test_award_explain_discards_speculative_results_out_of_scope(tool):
+    award_id = "GRANT_AWD_SPEC"
+    
+    respx.get(f"{tool.client.base_url}/awards/{award_id}/").mock(
+        return_value=httpx.Response(200, json={"type": "02"})
+    )
+    respx.post(f"{tool.client.base_url}/transactions/").mock(
+        return_value=httpx.Response(200, json={"results": [{"action_date": "2023-01-01"}]})
+    )
+    
+    result = tool.execute(award_id, include=["summary", "transactions"], scope_mode=SCOPE_CONTRACTS_ONLY)
+    
+    assert result["error"]["type"] == "validation"
+    assert "transactions" not in result
+    assert "summary" not in result
+
+@respx.mock
+def test_award_explain_returns_partial_result_at_deadline(tool):
+    award_id = "CONT_AWD_123"
+
+    async def slow_subawards(request):
+        await asyncio.sleep(2)
+        return httpx.Response(200, json={"results": []})
+
+    respx.get(f"{tool.client.base_url}/awards/{award_id}/").mock(
+        return_value=httpx.Response(200, json={"id": 123, "type": "A"})
+    )
+    respx.post(f"{tool.client.base_url}/transactions/").mock(
+        return_value=httpx.Response(200, json={"results": [{"action_date": "2023-01-01"}]})
+    )
+    respx.post(f"{tool.client.base_url}/subawards/").mock(side_effect=slow_subawards)
+
+    start = time.monotonic()
+    with request_scope(deadline_ms=300):
+        result = tool.execute(award_id, include=["summary", "transactions", "subawards"])
+
+    assert time.monotonic() - start < 1.0
+    assert result["summary"]["type"] == "A"
+    assert len(result["transactions"]) == 1
+    assert "subawards" not in result
+    assert result["meta"]["partial"] is True
+    assert result["meta"]["missing_sections"] == ["subawards"]
+    assert "deadline_exceeded" in result["meta"]["warnings"]
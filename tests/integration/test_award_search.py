@@ -1,8 +1,12 @@
+import asyncio
+import json
+
 import httpx
 import pytest
 import respx
 
 from usaspending_mcp.award_types import SCOPE_CONTRACTS_ONLY
+from usaspending_mcp.pagination import encode_cursor
 from usaspending_mcp.tools.award_search import AwardSearchTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
@@ -91,3 +95,71 @@ def test_award_search_truncation(tool):
     payload = json.loads(respx.calls.last.request.content.decode())
     assert payload["limit"] == 50
 
+
+@respx.mock
+def test_award_search_keyset_cursor(tool):
+    route = respx.post(f"{tool.client.base_url}/search/spending_by_award/")
+    route.side_effect = [
+        httpx.Response(200, json={
+            "results": [{"Award ID": "A1"}],
+            "page_metadata": {"page": 1, "hasNext": True, "last_record_unique_id": 101, "last_record_sort_value": "5000.0"}
+        }),
+        httpx.Response(200, json={
+            "results": [{"Award ID": "A2"}],
+            "page_metadata": {"page": 1, "hasNext": False, "last_record_unique_id": 102, "last_record_sort_value": "4000.0"}
+        }),
+    ]
+    filters = {"keywords": ["test"]}
+
+    first = tool.execute(filters=dict(filters), limit=1)
+    second = tool.execute(filters=dict(filters), limit=1, cursor=first["next_cursor"])
+
+    assert first["has_next"] is True
+    assert second["results"] == [{"Award ID": "A2"}]
+    assert "next_cursor" not in second
+    sent = json.loads(route.calls.last.request.content)
+    assert sent["last_record_unique_id"] == 101
+    assert sent["last_record_sort_value"] == "5000.0"
+    assert "page" not in sent
+
+def test_award_search_rejects_foreign_cursor(tool):
+    cursor = encode_cursor({"id": 101, "value": "5000.0", "q": "other-search"})
+
+    result = tool.execute(filters={"keywords": ["test"]}, cursor=cursor)
+    assert result["error"]["type"] == "validation"
+
+    result = tool.execute(filters={"keywords": ["test"]}, cursor="not a cursor!")
+    assert result["error"]["type"] == "validation"
+
+@respx.mock
+def test_award_search_both_runs_count_and_list_concurrently(tool):
+    in_flight = 0
+    peak = 0
+
+    def slow(payload):
+        async def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.2)
+            finally:
+                in_flight -= 1
+            return httpx.Response(200, json=payload)
+        return respond
+
+    respx.post(f"{tool.client.base_url}/search/spending_by_award_count/").mock(
+        side_effect=slow({"results": {"count": 7}})
+    )
+    respx.post(f"{tool.client.base_url}/search/spending_by_award/").mock(
+        side_effect=slow({"results": [{"Award ID": "A1"}], "page_metadata": {"page": 1}})
+    )
+
+    result = tool.execute(mode="both", filters={"keywords": ["test"]})
+
+    # Both calls were in flight at the same time
+    assert peak == 2
+    assert result["count"] == 7
+    assert result["results"] == [{"Award ID": "A1"}]
+    assert set(result["meta"]["timings_ms"]) == {"count", "list"}
+    assert result["meta"]["timings_ms"]["list"] >= 200
@@ -1,9 +1,12 @@
+import time
+
 import httpx
 import pytest
 import respx
 
+from usaspending_mcp.async_bridge import run_sync
 from usaspending_mcp.cache import Cache
-from usaspending_mcp.tools.bootstrap_catalog import BootstrapCatalogTool
+from usaspending_mcp.tools.bootstrap_catalog import CATALOG_CACHE_KEY, BootstrapCatalogTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
 
@@ -63,3 +66,94 @@ def test_bootstrap_catalog_force_refresh(tool):
     tool.execute(include=["toptier_agencies"], force_refresh=True)
     
     assert route.call_count == 2
+
+@respx.mock
+def test_bootstrap_catalog_serves_stale_and_refreshes_in_background(tool):
+    agencies_url = f"{tool.client.base_url}/references/toptier_agencies/"
+    types_url = f"{tool.client.base_url}/references/award_types/"
+    agencies = [{"agency_name": "DoD", "toptier_code": "097", "abbreviation": "DOD"}]
+    agencies_route = respx.get(agencies_url).mock(return_value=httpx.Response(200, json={"results": agencies}))
+    respx.get(types_url).mock(return_value=httpx.Response(200, json={"contracts": [{"code": "A"}]}))
+
+    # Expired catalog still inside its stale window
+    stale_catalog = {"toptier_agencies": [{"agency_name": "Old", "toptier_code": "001"}]}
+    tool.cache.set(CATALOG_CACHE_KEY, stale_catalog, ttl_seconds=0, stale_ttl_seconds=60)
+
+    result = tool.execute(include=["toptier_agencies"])
+
+    assert result["catalog"]["toptier_agencies"][0]["agency_name"] == "Old"
+    assert result["meta"]["cache_hit"] is True
+    assert "cache_age_seconds" in result["meta"]
+
+    # Background refresh replaces the catalog, including the default sections
+    async def wait_for_refresh():
+        await tool._refresh_task
+
+    run_sync(wait_for_refresh())
+    catalog, hit = tool.cache.get(CATALOG_CACHE_KEY)
+    assert hit is True
+    assert catalog["toptier_agencies"][0]["agency_name"] == "DoD"
+    assert "award_types" in catalog
+    assert agencies_route.call_count == 1
+
+@respx.mock
+def test_bootstrap_catalog_does_not_store_stale_responses_as_fresh():
+    client = USAspendingClient(cache=Cache())
+    client.max_retries = 0
+    client.cache_ttls["references"] = 0.01
+    tool = BootstrapCatalogTool(client, Cache())
+    agencies = [{"agency_name": "DoD", "toptier_code": "097", "abbreviation": "DOD"}]
+    respx.get(f"{client.base_url}/references/toptier_agencies/").mock(side_effect=[
+        httpx.Response(200, json={"results": agencies}),
+        httpx.Response(503),
+    ])
+
+    tool.execute(include=["toptier_agencies"])
+    stored_at = tool.cache.get_entry(CATALOG_CACHE_KEY).stored_at
+    time.sleep(0.02)
+
+    # Upstream is down: the client serves its stale response, which must not be re-stored
+    result = tool.execute(include=["toptier_agencies"], force_refresh=True)
+
+    assert result["catalog"]["toptier_agencies"][0]["toptier_code"] == "097"
+    assert client.metrics()["stale_served"] == 1
+    assert tool.cache.get_entry(CATALOG_CACHE_KEY).stored_at == stored_at
+
+@respx.mock
+def test_bootstrap_catalog_cache_miss_for_missing_section(tool):
+    periods_url = f"{tool.client.base_url}/references/submission_periods/"
+    route = respx.get(periods_url).mock(
+        return_value=httpx.Response(200, json={"available_periods": [{"period": 1}]})
+    )
+    tool.cache.set(CATALOG_CACHE_KEY, {"toptier_agencies": []}, ttl_seconds=60)
+
+    result = tool.execute(include=["submission_periods"])
+
+    assert result["catalog"]["submission_periods"] == [{"period": 1}]
+    assert route.call_count == 1
+    # Fetched sections are merged into the cached catalog
+    catalog, _ = tool.cache.get(CATALOG_CACHE_KEY)
+    assert set(catalog) == {"toptier_agencies", "submission_periods"}
+
+@respx.mock
+def test_bootstrap_catalog_code_lists_are_indexed_not_returned(tool):
+    psc = respx.get(f"{tool.client.base_url}/references/filter_tree/psc/").mock(
+        return_value=httpx.Response(200, json={"results": [
+            {"id": "D", "description": "IT and Telecom", "children": [{"id": "D302", "description": "Systems Development"}]},
+        ]})
+    )
+    respx.get(f"{tool.client.base_url}/references/filter_tree/naics/").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "54", "description": "Professional Services"}]})
+    )
+    respx.get(f"{tool.client.base_url}/references/cfda/totals/").mock(
+        return_value=httpx.Response(200, json={"results": [{"code": "20.205"}, {"code": "93.778"}]})
+    )
+
+    result = tool.execute(include=["codes"])
+
+    assert psc.calls[0].request.url.params["depth"] == "-1"
+    assert result["catalog"]["psc"] == {"indexed_codes": 2}
+    assert result["catalog"]["naics"] == {"indexed_codes": 1}
+    assert result["catalog"]["assistance_listings"] == {"indexed_codes": 2}
+    assert [r["code"] for r in run_sync(tool.acode_index("psc")).search("D3")] == ["D302"]
+    assert tool.execute(include=["codes"])["meta"]["cache_hit"] is True
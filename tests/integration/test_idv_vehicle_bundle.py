@@ -1,8 +1,13 @@
+import asyncio
+import json
+import time
+
 import httpx
 import pytest
 import respx
 
 from usaspending_mcp.award_types import SCOPE_ASSISTANCE_ONLY
+from usaspending_mcp.cache import Cache
 from usaspending_mcp.tools.idv_vehicle_bundle import IDVVehicleBundleTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
@@ -41,3 +46,182 @@ def test_idv_scope_rejection(tool):
     assert "error" in result
     assert result["error"]["type"] == "validation"
     assert "contracts_only" in result["error"]["remediation_hint"]
+
+@respx.mock
+def test_idv_orders_span_pages_up_to_limit(tool):
+    route = respx.post(f"{tool.client.base_url}/idvs/awards/")
+    route.side_effect = [
+        httpx.Response(200, json={"results": [{"id": i} for i in range(100)], "page_metadata": {"hasNext": True}}),
+        httpx.Response(200, json={"results": [{"id": i} for i in range(100, 200)], "page_metadata": {"hasNext": True}}),
+    ]
+
+    result = tool.execute("CONT_IDV_123", include=["orders"], orders_limit=150)
+
+    assert [o["id"] for o in result["orders"]] == list(range(150))
+    assert result["orders_truncated"] is True
+    assert route.call_count == 2
+
+@respx.mock
+def test_piid_resolution_is_cached():
+    tool = IDVVehicleBundleTool(USAspendingClient(), Cache())
+    search = respx.post(f"{tool.client.base_url}/search/spending_by_award/").mock(
+        return_value=httpx.Response(200, json={"results": [{"generated_internal_id": "CONT_IDV_NNK14MA74C_8000"}]})
+    )
+    respx.post(f"{tool.client.base_url}/idvs/funding_rollup/").mock(
+        return_value=httpx.Response(200, json={"total_transaction_obligated_amount": 5000})
+    )
+
+    first = tool.execute("nnk14ma74c", include=["funding_rollup"])
+    second = tool.execute("NNK14MA74C", include=["funding_rollup"])
+
+    assert first["resolved_idv_id"] == second["resolved_idv_id"] == "CONT_IDV_NNK14MA74C_8000"
+    assert search.call_count == 1
+
+@respx.mock
+def test_idv_sub_fetches_run_concurrently(tool):
+    in_flight = 0
+    peak = 0
+
+    def slow(payload):
+        async def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.2)
+            finally:
+                in_flight -= 1
+            return httpx.Response(200, json=payload)
+        return respond
+
+    respx.post(f"{tool.client.base_url}/idvs/awards/").mock(side_effect=slow({"results": [{"id": 1}]}))
+    respx.post(f"{tool.client.base_url}/idvs/activity/").mock(side_effect=slow({"results": [{"month": 1}]}))
+    respx.post(f"{tool.client.base_url}/idvs/funding_rollup/").mock(
+        side_effect=slow({"total_transaction_obligated_amount": 5000})
+    )
+
+    result = tool.execute("CONT_IDV_123", include=["orders", "activity", "funding_rollup"])
+
+    # All three sub-fetches were in flight at the same time
+    assert peak == 3
+    assert result["orders"] == [{"id": 1}]
+    assert result["activity"] == [{"month": 1}]
+    assert result["funding_rollup"]["total_transaction_obligated_amount"] == 5000
+
+def _hierarchy_side_effect(tree, slow=0.0):
+    """tree: idv_id -> {"child_idvs": [...], "child_awards": [...]}; one record per page."""
+    async def respond(request):
+        payload = json.loads(request.content)
+        records = tree.get(payload["award_id"], {}).get(payload["type"], [])
+        if slow:
+            await asyncio.sleep(slow)
+        page = payload["page"]
+        return httpx.Response(200, json={
+            "results": records[page - 1:page],
+            "page_metadata": {"hasNext": page < len(records)},
+        })
+    return respond
+
+def _order(piid, agency, amount):
+    """A child_awards row as idvs/awards/ returns it (no recipient)."""
+    return {
+        "award_id": hash(piid) % 100000,
+        "award_type": "DELIVERY ORDER",
+        "description": f"ORDER {piid}",
+        "awarding_agency": agency,
+        "funding_agency": agency,
+        "generated_unique_award_id": f"CONT_AWD_{piid}_9700_ROOT_9700",
+        "last_date_to_order": None,
+        "obligated_amount": amount,
+        "period_of_performance_current_end_date": "2025-09-30",
+        "period_of_performance_start_date": "2024-10-01",
+        "piid": piid,
+    }
+
+def _recipient_side_effect(recipients):
+    """recipients: piid -> recipient name, served as search/spending_by_award/ rows."""
+    async def respond(request):
+        payload = json.loads(request.content)
+        rows = [
+            {"Award ID": piid, "Recipient Name": recipients[piid], "generated_internal_id": f"CONT_AWD_{piid}_9700_ROOT_9700"}
+            for piid in payload["filters"]["award_ids"]
+            if piid in recipients
+        ]
+        return httpx.Response(200, json={"results": rows, "page_metadata": {"hasNext": False}})
+    return respond
+
+@respx.mock
+def test_idv_hierarchy_rolls_up_all_levels(tool):
+    tree = {
+        "CONT_IDV_ROOT": {
+            "child_idvs": [{"generated_unique_award_id": "CONT_IDV_CHILD"}],
+            "child_awards": [_order("O1", "DOD", 100), _order("O2", "GSA", 50)],
+        },
+        "CONT_IDV_CHILD": {
+            "child_awards": [_order("O3", "DOD", 300), _order("O4", "DOD", 20)],
+        },
+    }
+    respx.post(f"{tool.client.base_url}/idvs/awards/").mock(side_effect=_hierarchy_side_effect(tree))
+    respx.post(f"{tool.client.base_url}/search/spending_by_award/").mock(
+        side_effect=_recipient_side_effect({"O1": "ACME CORP", "O2": "BETA LLC", "O3": "ACME CORP"})
+    )
+
+    result = tool.execute("CONT_IDV_ROOT", include=["hierarchy"])
+    hierarchy = result["hierarchy"]
+
+    assert hierarchy["complete"] is True
+    assert hierarchy["totals"]["orders"] == 4
+    assert hierarchy["totals"]["idvs"] == 1
+    assert hierarchy["totals"]["obligated_amount"] == 470
+    assert [(lvl["level"], lvl["orders"]) for lvl in hierarchy["by_level"]] == [(1, 2), (2, 2)]
+    assert hierarchy["top_agencies"][0] == {"name": "DOD", "orders": 3, "obligated_amount": 420}
+    assert hierarchy["top_recipients"] == [
+        {"name": "ACME CORP", "orders": 2, "obligated_amount": 400},
+        {"name": "BETA LLC", "orders": 1, "obligated_amount": 50},
+        {"name": "(not reported)", "orders": 1, "obligated_amount": 20},
+    ]
+    assert [o["piid"] for o in hierarchy["top_orders"]] == ["O3", "O1", "O2", "O4"]
+    assert hierarchy["top_orders"][0]["recipient_name"] == "ACME CORP"
+    assert hierarchy["top_orders"][0]["level"] == 2
+    assert "partial" not in result["meta"]
+
+@respx.mock
+def test_idv_hierarchy_caches_the_rollup_not_the_crawl_pages():
+    tool = IDVVehicleBundleTool(USAspendingClient(cache=Cache()), Cache())
+    tree = {"CONT_IDV_ROOT": {"child_awards": [_order("O1", "DOD", 100), _order("O2", "DOD", 50)]}}
+    crawl = respx.post(f"{tool.client.base_url}/idvs/awards/").mock(side_effect=_hierarchy_side_effect(tree))
+    respx.post(f"{tool.client.base_url}/search/spending_by_award/").mock(
+        side_effect=_recipient_side_effect({"O1": "ACME CORP"})
+    )
+
+    first = tool.execute("CONT_IDV_ROOT", include=["hierarchy"])
+    calls = crawl.call_count
+    second = tool.execute("CONT_IDV_ROOT", include=["hierarchy"])
+
+    assert tool.client.cache.stats()["entries"] == 0
+    assert tool.cache.stats()["entries"] == 1
+    assert crawl.call_count == calls
+    assert second["hierarchy"] == first["hierarchy"]
+
+@respx.mock
+def test_idv_hierarchy_stops_at_deadline_with_partial_rollup(tool):
+    from usaspending_mcp.request_context import request_scope
+
+    tree = {"CONT_IDV_ROOT": {"child_awards": [
+        {"generated_unique_award_id": f"O{i}", "awarding_agency": "DOD", "obligated_amount": 10} for i in range(50)
+    ]}}
+    respx.post(f"{tool.client.base_url}/idvs/awards/").mock(side_effect=_hierarchy_side_effect(tree, slow=0.05))
+
+    async def run():
+        with request_scope(400):
+            return await tool.aexecute("CONT_IDV_ROOT", include=["hierarchy"])
+
+    start = time.monotonic()
+    result = asyncio.run(run())
+
+    assert time.monotonic() - start < 2
+    hierarchy = result["hierarchy"]
+    assert hierarchy["complete"] is False
+    assert hierarchy["stopped_reason"] == "deadline"
+    assert 0 < hierarchy["totals"]["orders"] < 50
+    assert result["meta"]["partial"] is True
@@ -1,8 +1,13 @@
+import asyncio
+import time
+
 import httpx
 import pytest
 import respx
 
 from usaspending_mcp.cache import Cache
+from usaspending_mcp.router import Router
+from usaspending_mcp.tools.bootstrap_catalog import BootstrapCatalogTool
 from usaspending_mcp.tools.resolve_entities import ResolveEntitiesTool
 from usaspending_mcp.usaspending_client import USAspendingClient
 
@@ -75,3 +80,191 @@ def test_naics_autocomplete_endpoint(tool):
     result = tool.execute(q="software", types=["naics"])
     assert len(result["matches"]["naics"]) == 1
     assert result["matches"]["naics"][0]["code"] == "541511"
+
+@respx.mock
+def test_lookups_run_concurrently_and_fail_independently(tool):
+    async def slow_recipients(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"results": [{"recipient_name": "BOEING COMPANY"}]})
+
+    async def slow_psc(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"results": [{"psc_code": "1510"}]})
+
+    respx.post(f"{tool.client.base_url}/autocomplete/recipient/").mock(side_effect=slow_recipients)
+    respx.post(f"{tool.client.base_url}/autocomplete/psc/").mock(side_effect=slow_psc)
+    respx.post(f"{tool.client.base_url}/autocomplete/naics/").mock(return_value=httpx.Response(404))
+
+    start = time.monotonic()
+    result = tool.execute(q="aircraft", types=["recipient", "psc", "naics"])
+
+    assert time.monotonic() - start < 0.35
+    assert result["matches"]["recipient"] == [{"recipient_name": "BOEING COMPANY"}]
+    assert result["matches"]["psc"] == [{"psc_code": "1510"}]
+    assert result["matches"]["naics"] == []
+    assert result["notes"] == ["NAICS autocomplete endpoint not found."]
+    assert result["meta"]["partial"] is True
+
+@respx.mock
+def test_each_type_is_cached_separately(tool):
+    recipients = respx.post(f"{tool.client.base_url}/autocomplete/recipient/").mock(
+        return_value=httpx.Response(200, json={"results": [{"recipient_name": "BOEING COMPANY"}]})
+    )
+    psc = respx.post(f"{tool.client.base_url}/autocomplete/psc/").mock(
+        return_value=httpx.Response(200, json={"results": []})
+    )
+
+    tool.execute(q="Boeing", types=["recipient"])
+    result = tool.execute(q="Boeing", types=["recipient", "psc"])
+
+    assert recipients.call_count == 1
+    assert psc.call_count == 1
+    assert result["matches"]["recipient"] == [{"recipient_name": "BOEING COMPANY"}]
+    assert result["meta"]["cache_hit"] is False
+
+@respx.mock
+def test_all_lookups_failing_is_an_error(tool):
+    respx.post(f"{tool.client.base_url}/autocomplete/recipient/").mock(return_value=httpx.Response(400))
+
+    result = tool.execute(q="Boeing", types=["recipient"])
+
+    assert result["error"]["type"] == "validation"
+
+@respx.mock
+def test_agency_index_resolves_name_variants_and_rebuilds_on_refresh(tool):
+    agencies = respx.get(f"{tool.client.base_url}/references/toptier_agencies/")
+    agencies.side_effect = [
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Defense", "toptier_code": "097", "abbreviation": "DOD"},
+            {"agency_name": "Department of Health and Human Services", "toptier_code": "075", "abbreviation": "HHS"},
+        ]}),
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Energy", "toptier_code": "089", "abbreviation": "DOE"},
+        ]}),
+    ]
+
+    result = tool.execute(q="Dept of Defense", types=["agency"])
+    assert [m["toptier_code"] for m in result["matches"]["agency"]] == ["097"]
+    result = tool.execute(q="HHS department", types=["agency"])
+    assert [m["toptier_code"] for m in result["matches"]["agency"]] == ["075"]
+
+    # A catalog refresh rebuilds the index
+    tool.catalog.execute(include=["toptier_agencies"], force_refresh=True)
+    result = tool.execute(q="Dept of Energy", types=["agency"])
+    assert [m["toptier_code"] for m in result["matches"]["agency"]] == ["089"]
+    assert agencies.call_count == 2
+
+@respx.mock
+def test_repeated_agency_query_sees_refreshed_catalog(tool):
+    agencies = respx.get(f"{tool.client.base_url}/references/toptier_agencies/")
+    agencies.side_effect = [
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Energy", "toptier_code": "089", "abbreviation": "DOE"},
+        ]}),
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Energy", "toptier_code": "089", "abbreviation": "DOE"},
+            {"agency_name": "Department of Education", "toptier_code": "091", "abbreviation": "ED"},
+        ]}),
+    ]
+
+    first = tool.execute(q="Department", types=["agency"])
+    assert [m["toptier_code"] for m in first["matches"]["agency"]] == ["089"]
+    assert first["meta"]["cache_hit"] is False
+
+    tool.catalog.execute(include=["toptier_agencies"], force_refresh=True)
+
+    second = tool.execute(q="Department", types=["agency"])
+    assert sorted(m["toptier_code"] for m in second["matches"]["agency"]) == ["089", "091"]
+    assert second["meta"]["cache_hit"] is True
+
+@respx.mock
+def test_code_lookups_use_local_index_and_fall_back_on_miss(tool):
+    respx.get(f"{tool.client.base_url}/references/filter_tree/naics/").mock(
+        return_value=httpx.Response(200, json={"results": [
+            {"id": "5415", "description": "Computer Systems Design and Related Services", "children": [
+                {"id": "541511", "description": "Custom Computer Programming Services", "children": None},
+            ]},
+        ]})
+    )
+    autocomplete = respx.post(f"{tool.client.base_url}/autocomplete/naics/").mock(
+        return_value=httpx.Response(200, json={"results": [{"code": "336411", "description": "Aircraft Manufacturing"}]})
+    )
+
+    # Without the code lists loaded, autocomplete is used
+    tool.execute(q="programming", types=["naics"])
+    assert autocomplete.call_count == 1
+
+    tool.catalog.execute(include=["naics"])
+    result = tool.execute(q="computer programming", types=["naics"])
+    assert result["matches"]["naics"] == [{"code": "541511", "description": "Custom Computer Programming Services"}]
+    assert autocomplete.call_count == 1
+
+    # Local miss -> upstream autocomplete
+    result = tool.execute(q="aircraft", types=["naics"])
+    assert result["matches"]["naics"][0]["code"] == "336411"
+    assert autocomplete.call_count == 2
+
+@respx.mock
+def test_code_index_rebuilds_when_catalog_is_refreshed(tool):
+    naics = respx.get(f"{tool.client.base_url}/references/filter_tree/naics/")
+    naics.side_effect = [
+        httpx.Response(200, json={"results": [{"id": "541511", "description": "Custom Computer Programming Services"}]}),
+        httpx.Response(200, json={"results": [{"id": "336411", "description": "Aircraft Manufacturing"}]}),
+    ]
+
+    tool.catalog.execute(include=["naics"])
+    assert tool.execute(q="programming", types=["naics"])["matches"]["naics"][0]["code"] == "541511"
+
+    # A second catalog instance on the same cache refreshes the code list
+    BootstrapCatalogTool(tool.client, tool.cache).execute(include=["naics"], force_refresh=True)
+
+    result = tool.execute(q="aircraft", types=["naics"])
+    assert result["matches"]["naics"] == [{"code": "336411", "description": "Aircraft Manufacturing"}]
+
+@respx.mock
+def test_repeated_code_query_sees_refreshed_catalog(tool):
+    programming = {"id": "541511", "description": "Custom Computer Programming Services"}
+    training = {"id": "611420", "description": "Computer Programming Training"}
+    respx.get(f"{tool.client.base_url}/references/filter_tree/naics/").mock(side_effect=[
+        httpx.Response(200, json={"results": [programming]}),
+        httpx.Response(200, json={"results": [programming, training]}),
+    ])
+
+    tool.catalog.execute(include=["naics"])
+    first = tool.execute(q="computer programming", types=["naics"])
+    assert [m["code"] for m in first["matches"]["naics"]] == ["541511"]
+
+    tool.catalog.execute(include=["naics"], force_refresh=True)
+
+    second = tool.execute(q="computer programming", types=["naics"])
+    assert sorted(m["code"] for m in second["matches"]["naics"]) == ["541511", "611420"]
+    assert second["meta"]["cache_hit"] is True
+
+@respx.mock
+def test_agency_index_follows_catalog_refreshed_by_another_instance(tool):
+    agencies = respx.get(f"{tool.client.base_url}/references/toptier_agencies/")
+    agencies.side_effect = [
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Defense", "toptier_code": "097", "abbreviation": "DOD"},
+        ]}),
+        httpx.Response(200, json={"results": [
+            {"agency_name": "Department of Energy", "toptier_code": "089", "abbreviation": "DOE"},
+        ]}),
+    ]
+    assert tool.execute(q="Defense", types=["agency"])["matches"]["agency"][0]["toptier_code"] == "097"
+
+    # A second catalog instance on the same cache refreshes the agency list
+    other = BootstrapCatalogTool(tool.client, tool.cache)
+    other.execute(include=["toptier_agencies"], force_refresh=True)
+
+    result = tool.execute(q="Energy", types=["agency"])
+    assert [m["toptier_code"] for m in result["matches"]["agency"]] == ["089"]
+
+def test_router_shares_the_servers_catalog():
+    client = USAspendingClient()
+    cache = Cache()
+    catalog = BootstrapCatalogTool(client, cache)
+
+    router = Router(client, cache, catalog=catalog)
+
+    assert router.tools["resolve_entities"].catalog is catalog
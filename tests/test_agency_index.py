@@ -0,0 +1,42 @@
+from usaspending_mcp.agency_index import AgencyIndex, normalize
+
+AGENCIES = [
+    {"agency_name": "Department of Defense", "toptier_code": "097", "abbreviation": "DOD"},
+    {"agency_name": "Department of Education", "toptier_code": "091", "abbreviation": "ED"},
+    {"agency_name": "Department of Health and Human Services", "toptier_code": "075", "abbreviation": "HHS"},
+    {"agency_name": "Department of Homeland Security", "toptier_code": "070", "abbreviation": "DHS"},
+    {"agency_name": "National Aeronautics and Space Administration", "toptier_code": "080", "abbreviation": "NASA"},
+    {"agency_name": "General Services Administration", "toptier_code": "047", "abbreviation": "GSA"},
+]
+
+
+def codes(results):
+    return [a["toptier_code"] for a in results]
+
+def test_normalize_expands_aliases_and_punctuation():
+    assert normalize("Dept. of Health & Human Svcs") == "department of health and human services"
+    assert normalize("U.S. Dept of Defense") == "us department of defense"
+
+def test_agency_index_matches_abbreviations_and_name_variants():
+    index = AgencyIndex(AGENCIES)
+
+    assert codes(index.search("ed")) == ["091"]
+    assert codes(index.search("Defense")) == ["097"]
+    assert codes(index.search("Dept of Defense")) == ["097"]
+    assert codes(index.search("HHS department")) == ["075"]
+    assert codes(index.search("health & human svcs")) == ["075"]
+    assert codes(index.search("space")) == ["080"]
+
+def test_agency_index_tolerates_misspellings():
+    index = AgencyIndex(AGENCIES)
+
+    assert codes(index.search("Depatment of Defnse")) == ["097"]
+    assert codes(index.search("homland security")) == ["070"]
+
+def test_agency_index_ranks_abbreviation_then_prefix_then_tokens():
+    index = AgencyIndex(AGENCIES)
+
+    # Common words alone still match, ranked by name; limit applies
+    assert codes(index.search("Department", limit=2)) == ["097", "091"]
+    assert index.search("zzzz") == []
+    assert index.search("") == []
@@ -1,8 +1,11 @@
+import asyncio
+import threading
 import time
 
 import pytest
 
-from usaspending_mcp.cache import Cache
+from usaspending_mcp.cache import Cache, CacheKey, make_key
+from usaspending_mcp.cache_store import SQLiteCacheStore
 
 
 @pytest.fixture
@@ -48,3 +51,176 @@ def test_cache_miss_unknown(cache):
     result, hit = cache.get("non_existent")
     assert hit is False
     assert result is None
+
+def test_cache_evicts_least_recently_used_by_count():
+    cache = Cache(max_entries=2)
+    cache.set("a", 1, ttl_seconds=60)
+    cache.set("b", 2, ttl_seconds=60)
+    
+    # Touch "a" so "b" becomes least recently used
+    cache.get("a")
+    cache.set("c", 3, ttl_seconds=60)
+    
+    assert cache.get("a") == (1, True)
+    assert cache.get("b") == (None, False)
+    assert cache.get("c") == (3, True)
+    assert cache.stats()["evictions"] == 1
+
+def test_cache_evicts_by_approximate_size():
+    cache = Cache(max_entries=100, max_bytes=250)
+    for i in range(5):
+        cache.set(f"k{i}", "x" * 100, ttl_seconds=60)
+    
+    stats = cache.stats()
+    assert stats["bytes"] <= 250
+    assert stats["entries"] == 2
+    assert cache.get("k4")[1] is True
+    assert cache.get("k0")[1] is False
+
+def test_cache_skips_values_larger_than_max_bytes():
+    cache = Cache(max_bytes=10)
+    cache.set("big", "x" * 100, ttl_seconds=60)
+    
+    assert cache.get("big") == (None, False)
+    assert cache.stats()["entries"] == 0
+
+def test_cache_periodic_sweep_removes_unread_expired_entries():
+    cache = Cache(sweep_interval_seconds=0)
+    cache.set("written_once", "foo", ttl_seconds=0.01)
+    
+    time.sleep(0.02)
+    cache.set("other", "bar", ttl_seconds=60)
+    
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["expirations"] == 1
+
+def test_cache_manual_sweep():
+    cache = Cache(sweep_interval_seconds=3600)
+    cache.set("a", 1, ttl_seconds=0.01)
+    cache.set("b", 2, ttl_seconds=60)
+    
+    time.sleep(0.02)
+    
+    assert cache.sweep() == 1
+    assert cache.stats()["entries"] == 1
+
+def test_cache_key_ignores_order_of_order_insensitive_lists(cache):
+    key1 = {"filters": {"award_type_codes": ["A", "B", "C", "D"], "keywords": ["x"]}}
+    key2 = {"filters": {"keywords": ["x"], "award_type_codes": ["D", "C", "B", "A"]}}
+    
+    cache.set(key1, "value", ttl_seconds=60)
+    
+    assert cache.get(key2) == ("value", True)
+    # Input lists are not reordered in place
+    assert key2["filters"]["award_type_codes"] == ["D", "C", "B", "A"]
+
+def test_cache_key_keeps_order_of_other_lists():
+    assert make_key({"fields": ["a", "b"]}) != make_key({"fields": ["b", "a"]})
+
+def test_make_key_is_stable_and_reusable(cache):
+    key = cache.make_key({"tool": "resolve_entities", "q": "nasa"})
+    
+    assert isinstance(key, CacheKey)
+    assert key == make_key({"q": "nasa", "tool": "resolve_entities"})
+    assert make_key(key) is key
+    
+    cache.set(key, "value", ttl_seconds=60)
+    assert cache.get({"q": "nasa", "tool": "resolve_entities"}) == ("value", True)
+
+def test_string_and_structured_keys_do_not_collide(cache):
+    cache.set("1", "string", ttl_seconds=60)
+    cache.set(1, "int", ttl_seconds=60)
+    
+    assert cache.get("1") == ("string", True)
+    assert cache.get(1) == ("int", True)
+
+
+def test_cache_keeps_expired_entries_for_stale_window(cache):
+    cache.set("catalog", "old", ttl_seconds=0.01, stale_ttl_seconds=60)
+    time.sleep(0.02)
+    
+    # get() only returns fresh data; get_entry() still exposes the stale value
+    assert cache.get("catalog") == (None, False)
+    entry = cache.get_entry("catalog")
+    assert entry.value == "old"
+    assert entry.is_fresh() is False
+    assert entry.age() >= 0.02
+    assert cache.stats()["stale_hits"] == 1
+
+def test_cache_drops_entries_after_stale_window(cache):
+    cache.set("catalog", "old", ttl_seconds=0.01, stale_ttl_seconds=0.01)
+    time.sleep(0.03)
+    
+    assert cache.get_entry("catalog") is None
+    assert cache.sweep() == 0
+
+def test_cache_l2_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = Cache(l2=SQLiteCacheStore(path))
+    cache.set({"q": "nasa"}, {"results": [1, 2]}, ttl_seconds=60)
+    
+    # New instance, empty L1: reads through from L2 and promotes into L1
+    restarted = Cache(l2=SQLiteCacheStore(path))
+    assert restarted.get({"q": "nasa"}) == ({"results": [1, 2]}, True)
+    assert restarted.stats()["l2_hits"] == 1
+    assert restarted.stats()["entries"] == 1
+
+def test_cache_l2_respects_ttl(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    Cache(l2=SQLiteCacheStore(path)).set("short", "value", ttl_seconds=0.01)
+    time.sleep(0.02)
+    
+    restarted = Cache(l2=SQLiteCacheStore(path))
+    assert restarted.get("short") == (None, False)
+    assert restarted.l2.count() == 0
+
+def test_cache_warm_from_l2(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = Cache(l2=SQLiteCacheStore(path))
+    for i in range(3):
+        cache.set(f"key{i}", i, ttl_seconds=60)
+    
+    restarted = Cache(max_entries=2, l2=SQLiteCacheStore(path))
+    assert restarted.warm_from_l2() == 2
+    # Most recently stored entries are loaded
+    assert restarted.stats()["entries"] == 2
+
+def test_cache_snapshot_round_trip(tmp_path):
+    snapshot = str(tmp_path / "snapshot.sqlite3")
+    cache = Cache()
+    cache.set("catalog", {"toptier_agencies": []}, ttl_seconds=60, stale_ttl_seconds=60)
+    cache.set("gone", "value", ttl_seconds=0)
+    assert cache.save_snapshot(snapshot) == 1
+    
+    fresh = Cache()
+    assert fresh.load_snapshot(snapshot) == 1
+    entry = fresh.get_entry("catalog")
+    assert entry.value == {"toptier_agencies": []}
+    assert entry.stale_until > entry.expires_at
+
+def test_async_lookups_do_l2_io_off_the_loop_and_outside_the_lock(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    Cache(l2=SQLiteCacheStore(path)).set("key", "value", ttl_seconds=60)
+    cache = Cache(l2=SQLiteCacheStore(path))
+    calls = []
+    l2_get = cache.l2.get
+
+    def tracked_get(key):
+        # Another thread must be able to take the cache lock while L2 is read
+        acquired = cache._lock.acquire(blocking=False)
+        if acquired:
+            cache._lock.release()
+        calls.append((threading.get_ident(), acquired))
+        return l2_get(key)
+
+    cache.l2.get = tracked_get
+
+    async def run():
+        return await cache.aget("key"), threading.get_ident()
+
+    value, loop_thread = asyncio.run(run())
+
+    assert value == ("value", True)
+    assert calls and calls[0][0] != loop_thread
+    assert calls[0][1] is True
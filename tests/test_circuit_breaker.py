@@ -1,5 +1,6 @@
+import asyncio
 import time
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -89,4 +90,83 @@ def test_half_open_to_open_on_failure():
     # Half-Open failure resets to OPEN
     with pytest.raises(httpx.NetworkError):
         cb.call(MagicMock(side_effect=httpx.NetworkError("Fail Again")))
-    assert cb.state == "OPEN"
\ No newline at end of file
+    assert cb.state == "OPEN"
+
+def test_async_call_opens_after_threshold():
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    func = AsyncMock(side_effect=httpx.NetworkError("API Down"))
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(httpx.NetworkError):
+                await cb.acall(func)
+        with pytest.raises(CircuitOpenError):
+            await cb.acall(func)
+
+    asyncio.run(run())
+    assert cb.state == "OPEN"
+    assert func.call_count == 2
+
+def test_circuit_breaker_uses_failure_rate_in_window():
+    cb = CircuitBreaker(failure_threshold=3, recovery_timeout=60, failure_rate_threshold=0.5)
+    ok = MagicMock(return_value="OK")
+    fail = MagicMock(side_effect=httpx.NetworkError("Flaky"))
+
+    # 3 failures out of 7 calls (43%) stays closed
+    for _ in range(4):
+        cb.call(ok)
+    for _ in range(3):
+        with pytest.raises(httpx.NetworkError):
+            cb.call(fail)
+    assert cb.state == "CLOSED"
+
+    # 4 of 8 (50%) opens
+    with pytest.raises(httpx.NetworkError):
+        cb.call(fail)
+    assert cb.state == "OPEN"
+
+def test_circuit_breaker_window_forgets_old_failures():
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout=60, window_seconds=0.05)
+    fail = MagicMock(side_effect=httpx.NetworkError("Flaky"))
+
+    with pytest.raises(httpx.NetworkError):
+        cb.call(fail)
+    time.sleep(0.06)
+    with pytest.raises(httpx.NetworkError):
+        cb.call(fail)
+
+    assert cb.state == "CLOSED"
+    assert cb.failure_count == 1
+
+def test_half_open_limits_concurrent_probes():
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0, half_open_requests=2)
+    with pytest.raises(httpx.NetworkError):
+        cb.call(MagicMock(side_effect=httpx.NetworkError("Fail")))
+
+    async def slow_probe():
+        await asyncio.sleep(0.05)
+        return "OK"
+
+    async def run():
+        probes = [asyncio.create_task(cb.acall(slow_probe)) for _ in range(2)]
+        await asyncio.sleep(0)
+        # Both probe slots are taken
+        with pytest.raises(CircuitOpenError):
+            await cb.acall(slow_probe)
+        # A cancelled probe frees its slot
+        probes[0].cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+        assert cb.state == "HALF_OPEN"
+        assert await cb.acall(slow_probe) == "OK"
+
+    asyncio.run(run())
+    assert cb.state == "CLOSED"
+
+def test_client_errors_do_not_count_as_failures():
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    response = httpx.Response(404, request=httpx.Request("GET", "https://example.test"))
+    func = MagicMock(side_effect=httpx.HTTPStatusError("Not found", request=response.request, response=response))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        cb.call(func)
+    assert cb.state == "CLOSED"
@@ -1,8 +1,14 @@
 
+import asyncio
+import time
+
 import httpx
 import pytest
 import respx
 
+from usaspending_mcp.cache import Cache
+from usaspending_mcp.request_context import request_scope
+from usaspending_mcp.response import ok
 from usaspending_mcp.usaspending_client import APIError, USAspendingClient
 
 
@@ -87,3 +93,323 @@ def test_network_error(client):
         client.request("GET", endpoint, tool_name="test_tool")
         
     assert excinfo.value.error_type == "network"
+
+@respx.mock
+def test_async_request_concurrent(client):
+    endpoint = "references/toptier_agencies/"
+    url = f"{client.base_url}/{endpoint}"
+
+    mock_data = {"results": []}
+    route = respx.get(url).mock(return_value=httpx.Response(200, json=mock_data))
+
+    async def run():
+        try:
+            return await asyncio.gather(*(client.arequest("GET", endpoint, tool_name="test_tool", params={"page": i}) for i in range(20)))
+        finally:
+            await client.aclose()
+
+    responses = asyncio.run(run())
+    assert responses == [mock_data] * 20
+    assert route.call_count == 20
+
+@respx.mock
+def test_identical_concurrent_requests_are_coalesced(client):
+    endpoint = "search/spending_by_category/awarding_agency/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.post(url).mock(return_value=httpx.Response(200, json={"results": []}))
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                client.arequest("POST", endpoint, json_data={"filters": {"a": 1, "b": 2}, "limit": 5}),
+                client.arequest("POST", endpoint, json_data={"limit": 5, "filters": {"b": 2, "a": 1}}),
+                client.arequest("POST", endpoint, json_data={"filters": {"a": 1, "b": 3}, "limit": 5}),
+            )
+        finally:
+            await client.aclose()
+
+    responses = asyncio.run(run())
+    assert responses == [{"results": []}] * 3
+    assert route.call_count == 2
+    assert client.metrics()["single_flight"]["coalesced"] == 1
+
+@respx.mock
+def test_response_cache_serves_repeat_requests():
+    client = USAspendingClient(cache=Cache())
+    endpoint = "awards/CONT_AWD_123/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.get(url).mock(return_value=httpx.Response(200, json={"id": 123}))
+
+    with request_scope():
+        assert client.request("GET", endpoint) == {"id": 123}
+        first = ok({}, request_id="req-1")
+    with request_scope():
+        assert client.request("GET", endpoint) == {"id": 123}
+        second = ok({}, request_id="req-2")
+
+    assert route.call_count == 1
+    assert first["meta"]["cache_hit"] is False
+    assert second["meta"]["cache_hit"] is True
+    assert second["meta"]["upstream_cache"] == {"hits": 1, "misses": 0}
+
+@respx.mock
+def test_response_cache_skips_uncacheable_endpoints():
+    client = USAspendingClient(cache=Cache())
+    endpoint = "awards/last_updated/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.get(url).mock(return_value=httpx.Response(200, json={"last_updated": "2024-01-18"}))
+
+    client.request("GET", endpoint)
+    client.request("GET", endpoint)
+
+    assert route.call_count == 2
+
+@respx.mock
+def test_response_cache_does_not_store_errors():
+    client = USAspendingClient(cache=Cache())
+    client.max_retries = 0
+    endpoint = "search/spending_by_award/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.post(url)
+    route.side_effect = [
+        httpx.Response(500),
+        httpx.Response(200, json={"results": []}),
+    ]
+
+    with pytest.raises(APIError):
+        client.request("POST", endpoint, json_data={"filters": {}})
+    assert client.request("POST", endpoint, json_data={"filters": {}}) == {"results": []}
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_reference_responses_are_served_stale_and_refreshed():
+    client = USAspendingClient(cache=Cache())
+    client.cache_ttls["references"] = 0.05
+    endpoint = "references/award_types/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.get(url)
+    route.side_effect = [
+        httpx.Response(200, json={"version": 1}),
+        httpx.Response(200, json={"version": 2}),
+    ]
+
+    async def run():
+        assert await client.arequest("GET", endpoint) == {"version": 1}
+        await asyncio.sleep(0.06)
+        # Expired: served stale immediately while a background refresh runs
+        stale = await client.arequest("GET", endpoint)
+        while client.metrics()["refresh_ahead"]["inflight"]:
+            await asyncio.sleep(0.01)
+        return stale, await client.arequest("GET", endpoint)
+
+    stale, refreshed = asyncio.run(run())
+    assert stale == {"version": 1}
+    assert refreshed == {"version": 2}
+    assert route.call_count == 2
+
+@respx.mock
+def test_refresh_bypasses_cached_response():
+    client = USAspendingClient(cache=Cache())
+    endpoint = "references/toptier_agencies/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.get(url).mock(return_value=httpx.Response(200, json={"results": []}))
+
+    client.request("GET", endpoint)
+    client.request("GET", endpoint, refresh=True)
+    client.request("GET", endpoint)
+
+    assert route.call_count == 2
+
+@respx.mock
+def test_rate_limit_honors_retry_after(client):
+    endpoint = "search/spending_by_award/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.post(url)
+    route.side_effect = [
+        httpx.Response(429, headers={"Retry-After": "0.3"}),
+        httpx.Response(200, json={"results": []})
+    ]
+
+    start = time.monotonic()
+    assert client.request("POST", endpoint, json_data={"filters": {}}) == {"results": []}
+
+    assert time.monotonic() - start >= 0.3
+    stats = client.metrics()["rate_limiter"]
+    assert stats["throttled"] == 1
+    assert stats["total_wait_ms"] >= 250  # pause is measured from the 429, queueing from the retry
+
+@respx.mock
+def test_client_errors_are_not_retried(client):
+    endpoint = "search/spending_by_award/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.post(url).mock(return_value=httpx.Response(422, json={"detail": "Invalid filter"}))
+
+    with pytest.raises(APIError):
+        client.request("POST", endpoint, json_data={"filters": {}})
+    assert route.call_count == 1
+
+@respx.mock
+def test_circuit_breakers_are_per_endpoint(client):
+    client.max_retries = 0
+    flaky = "idvs/activity/"
+    respx.post(f"{client.base_url}/{flaky}").mock(return_value=httpx.Response(503))
+    respx.get(f"{client.base_url}/references/toptier_agencies/").mock(
+        return_value=httpx.Response(200, json={"results": []})
+    )
+
+    for _ in range(5):
+        with pytest.raises(APIError):
+            client.request("POST", flaky, json_data={"award_id": 1})
+    with pytest.raises(APIError, match="Circuit breaker is open"):
+        client.request("POST", flaky, json_data={"award_id": 1})
+
+    # Other endpoints are unaffected
+    assert client.request("GET", "references/toptier_agencies/") == {"results": []}
+    breakers = client.metrics()["circuit_breakers"]
+    assert breakers["idvs/activity/"]["state"] == "OPEN"
+    assert breakers["references/toptier_agencies/"]["state"] == "CLOSED"
+
+@respx.mock
+def test_degraded_mode_serves_stale_response_on_upstream_failure():
+    client = USAspendingClient(cache=Cache())
+    client.max_retries = 0
+    client.cache_ttls["award_summary"] = 0.01
+    endpoint = "awards/CONT_AWD_123/"
+    url = f"{client.base_url}/{endpoint}"
+
+    route = respx.get(url)
+    route.side_effect = [
+        httpx.Response(200, json={"id": 123}),
+        httpx.Response(503),
+    ]
+
+    client.request("GET", endpoint)
+    time.sleep(0.02)
+    with request_scope():
+        assert client.request("GET", endpoint) == {"id": 123}
+        result = ok({}, request_id="req-1", warnings=["approximate_total"])
+
+    assert route.call_count == 2
+    assert result["meta"]["warnings"] == ["approximate_total", "stale_data"]
+    assert result["meta"]["stale_data_age_seconds"] == 0
+    assert client.metrics()["stale_served"] == 1
+
+@respx.mock
+def test_degraded_mode_when_circuit_is_open():
+    client = USAspendingClient(cache=Cache())
+    client.cache_ttls["award_summary"] = 0.01
+    endpoint = "awards/CONT_AWD_123/"
+    route = respx.get(f"{client.base_url}/{endpoint}").mock(return_value=httpx.Response(200, json={"id": 123}))
+
+    client.request("GET", endpoint)
+    time.sleep(0.02)
+    breaker = client.breakers.get(endpoint)
+    breaker.state = "OPEN"
+    breaker.last_failure_time = time.time()
+
+    with request_scope():
+        assert client.request("GET", endpoint) == {"id": 123}
+        result = ok({}, request_id="req-1")
+
+    assert route.call_count == 1
+    assert result["meta"]["warnings"] == ["stale_data"]
+
+@respx.mock
+def test_degraded_mode_does_not_mask_client_errors():
+    client = USAspendingClient(cache=Cache())
+    client.cache_ttls["award_summary"] = 0.01
+    endpoint = "awards/CONT_AWD_123/"
+    route = respx.get(f"{client.base_url}/{endpoint}")
+    route.side_effect = [
+        httpx.Response(200, json={"id": 123}),
+        httpx.Response(404),
+    ]
+
+    client.request("GET", endpoint)
+    time.sleep(0.02)
+    with pytest.raises(APIError):
+        client.request("GET", endpoint)
+
+@respx.mock
+def test_deadline_stops_retries(client):
+    client.max_retries = 5
+    client.backoff_base = 0.2
+    endpoint = "broken_endpoint/"
+    route = respx.get(f"{client.base_url}/{endpoint}").mock(return_value=httpx.Response(500))
+
+    start = time.monotonic()
+    with request_scope(deadline_ms=300):
+        with pytest.raises(APIError):
+            client.request("GET", endpoint)
+
+    assert time.monotonic() - start < 1.0
+    assert route.call_count < 6
+
+@respx.mock
+def test_deadline_caps_attempt_timeout(client):
+    endpoint = "search/spending_by_award/"
+    route = respx.post(f"{client.base_url}/{endpoint}").mock(return_value=httpx.Response(200, json={}))
+
+    with request_scope(deadline_ms=500):
+        client.request("POST", endpoint, json_data={"filters": {}})
+
+    timeouts = route.calls.last.request.extensions["timeout"]
+    assert timeouts["read"] <= 0.5
+    assert timeouts["connect"] <= 0.5
+
+@respx.mock
+def test_expired_deadline_fails_fast_or_serves_stale():
+    client = USAspendingClient(cache=Cache())
+    client.cache_ttls["award_summary"] = 0.01
+    cached = "awards/CONT_AWD_123/"
+    route = respx.get(url__startswith=f"{client.base_url}/awards/").mock(
+        return_value=httpx.Response(200, json={"id": 123})
+    )
+    client.request("GET", cached)
+    time.sleep(0.02)
+
+    with request_scope(deadline_ms=0):
+        assert client.request("GET", cached) == {"id": 123}
+        with pytest.raises(APIError) as excinfo:
+            client.request("GET", "awards/CONT_AWD_456/")
+
+    assert excinfo.value.error_type == "deadline"
+    assert route.call_count == 1
+
+@respx.mock
+def test_coalesced_callers_keep_their_own_deadlines(client):
+    endpoint = "search/spending_by_award/"
+
+    async def respond(request):
+        await asyncio.sleep(0.6)
+        return httpx.Response(200, json={"results": []})
+
+    route = respx.post(f"{client.base_url}/{endpoint}").mock(side_effect=respond)
+
+    async def call(deadline_ms):
+        with request_scope(deadline_ms=deadline_ms):
+            return await client.arequest("POST", endpoint, json_data={"filters": {}})
+
+    async def run():
+        try:
+            return await asyncio.gather(call(200), call(10000), return_exceptions=True)
+        finally:
+            await client.aclose()
+
+    short, long = asyncio.run(run())
+
+    assert isinstance(short, APIError) and short.error_type == "deadline"
+    # The shared call outlived the first caller's deadline
+    assert long == {"results": []}
+    assert route.call_count == 1
+    assert client.metrics()["single_flight"]["leaders"] == 1
+    assert client.metrics()["single_flight"]["coalesced"] == 1
@@ -0,0 +1,34 @@
+from usaspending_mcp.code_index import CodeIndex, flatten_tree, listing_records
+
+NAICS_TREE = [
+    {"id": "54", "description": "Professional, Scientific, and Technical Services", "children": [
+        {"id": "5415", "description": "Computer Systems Design and Related Services", "children": [
+            {"id": "541511", "description": "Custom Computer Programming Services", "children": None},
+            {"id": "541512", "description": "Computer Systems Design Services", "children": None},
+        ]},
+    ]},
+    {"id": "23", "description": "Construction", "children": []},
+]
+
+
+def test_flatten_tree_and_listing_records():
+    records = flatten_tree(NAICS_TREE)
+
+    assert [r["code"] for r in records] == ["54", "5415", "541511", "541512", "23"]
+    assert listing_records([{"code": "20.205", "description": "Highway Planning"}, {"total": 1}]) == [
+        {"code": "20.205", "description": "Highway Planning"}
+    ]
+
+def test_code_index_prefix_search_lists_broader_codes_first():
+    index = CodeIndex(flatten_tree(NAICS_TREE))
+
+    assert [r["code"] for r in index.search("5415")] == ["5415", "541511", "541512"]
+    assert [r["code"] for r in index.search("541511")] == ["541511"]
+
+def test_code_index_description_tokens_must_all_match():
+    index = CodeIndex(flatten_tree(NAICS_TREE))
+
+    assert [r["code"] for r in index.search("computer programming")] == ["541511"]
+    assert [r["code"] for r in index.search("comput design")][0] == "541512"
+    assert index.search("aircraft") == []
+    assert index.search("999") == []
@@ -1,6 +1,12 @@
 import pytest
 
-from usaspending_mcp.endpoint_map import ENDPOINT_MAP, get_cost_hint, get_endpoints_for_tool
+from usaspending_mcp.endpoint_map import (
+    ENDPOINT_MAP,
+    endpoint_template,
+    get_cache_ttl_class,
+    get_cost_hint,
+    get_endpoints_for_tool,
+)
 
 
 @pytest.mark.unit
@@ -31,3 +37,21 @@ def test_get_cost_hint():
     assert get_cost_hint("bootstrap_catalog") == 1
     # Default
     assert get_cost_hint("unknown_tool") == 1
+
+@pytest.mark.unit
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template("awards/CONT_AWD_123/") == "awards/{award_id}/"
+    assert endpoint_template("/agency/097/") == "agency/{toptier_code}/"
+    assert endpoint_template("agency/097/budgetary_resources/") == "agency/{toptier_code}/budgetary_resources/"
+    assert endpoint_template("search/spending_by_award/") == "search/spending_by_award/"
+
+@pytest.mark.unit
+def test_get_cache_ttl_class():
+    assert get_cache_ttl_class("references/toptier_agencies/") == "references"
+    assert get_cache_ttl_class("autocomplete/recipient/") == "entity_resolution"
+    assert get_cache_ttl_class("search/spending_by_category/recipient/") == "rollups"
+    assert get_cache_ttl_class("awards/CONT_AWD_123/") == "award_summary"
+    assert get_cache_ttl_class("transactions/") == "award_details"
+    assert get_cache_ttl_class("awards/last_updated/") is None
+    assert get_cache_ttl_class("unknown/endpoint/") is None
+
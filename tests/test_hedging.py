@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from usaspending_mcp.hedging import HedgeBudget, HedgePolicy
+from usaspending_mcp.latency_tracker import LatencyTracker
+from usaspending_mcp.usaspending_client import USAspendingClient
+
+
+def test_hedge_budget_caps_hedges_to_ratio():
+    budget = HedgeBudget(ratio=0.25, burst=1)
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+    for _ in range(4):
+        budget.earn()
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+def test_hedge_policy_only_for_eligible_gets_with_history():
+    tracker = LatencyTracker()
+    policy = HedgePolicy(tracker, endpoints=["awards/{award_id}/", "references/"], min_samples=5, min_delay_ms=1)
+
+    assert policy.delay("GET", "awards/{award_id}/") is None  # no history yet
+    for _ in range(5):
+        tracker.record("awards/{award_id}/", 0.2)
+
+    assert policy.delay("GET", "awards/{award_id}/") == pytest.approx(0.2, rel=0.2)
+    assert policy.delay("POST", "awards/{award_id}/") is None
+    assert policy.delay("GET", "search/spending_by_award/") is None
+    for _ in range(5):
+        tracker.record("references/toptier_agencies/", 0.2)
+    assert policy.delay("GET", "references/toptier_agencies/") is not None
+
+@respx.mock
+def test_slow_get_is_hedged_and_fast_response_wins():
+    client = USAspendingClient()
+    endpoint = "awards/CONT_AWD_123/"
+    for _ in range(client.hedging.min_samples):
+        client.latency.record("awards/{award_id}/", 0.01)
+
+    calls = []
+
+    async def respond(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"id": "slow"})
+        return httpx.Response(200, json={"id": "hedge"})
+
+    respx.get(f"{client.base_url}/{endpoint}").mock(side_effect=respond)
+
+    start = time.monotonic()
+    assert client.request("GET", endpoint) == {"id": "hedge"}
+    assert time.monotonic() - start < 0.5
+    assert client.metrics()["hedging"] == {"sent": 1, "won": 1, "budget_denied": 0}
+
+@respx.mock
+def test_throttled_hedge_does_not_beat_pending_primary():
+    client = USAspendingClient()
+    endpoint = "awards/CONT_AWD_123/"
+    for _ in range(client.hedging.min_samples):
+        client.latency.record("awards/{award_id}/", 0.01)
+
+    calls = []
+
+    async def respond(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"id": "primary"})
+        return httpx.Response(429)
+
+    respx.get(f"{client.base_url}/{endpoint}").mock(side_effect=respond)
+
+    assert client.request("GET", endpoint) == {"id": "primary"}
+    assert len(calls) == 2
+    assert client.metrics()["hedging"]["won"] == 0
+
+@respx.mock
+def test_hedging_respects_budget():
+    client = USAspendingClient()
+    client.hedging.budget = HedgeBudget(ratio=0, burst=0)
+    endpoint = "awards/CONT_AWD_123/"
+    for _ in range(client.hedging.min_samples):
+        client.latency.record("awards/{award_id}/", 0.01)
+
+    async def respond(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"id": 123})
+
+    route = respx.get(f"{client.base_url}/{endpoint}").mock(side_effect=respond)
+
+    assert client.request("GET", endpoint) == {"id": 123}
+    assert route.call_count == 1
+    assert client.metrics()["hedging"]["budget_denied"] == 1
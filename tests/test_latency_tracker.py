@@ -0,0 +1,63 @@
+import httpx
+import pytest
+import respx
+
+from usaspending_mcp.latency_tracker import AdaptiveTimeout, LatencyHistogram, LatencyTracker
+from usaspending_mcp.usaspending_client import USAspendingClient
+
+
+def test_histogram_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms)
+
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.2)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.2)
+
+def test_histogram_decays_old_samples():
+    histogram = LatencyHistogram(max_samples=100)
+    for _ in range(100):
+        histogram.record(1000)
+    for _ in range(200):
+        histogram.record(10)
+
+    # Recent fast samples dominate after decay
+    assert histogram.percentile(90) == pytest.approx(10, rel=0.2)
+
+def test_adaptive_timeout_from_percentile_with_floor_and_ceiling():
+    tracker = LatencyTracker()
+    timeouts = AdaptiveTimeout(tracker, ceiling_seconds=60, factor=3, min_samples=10, floor_seconds=2)
+
+    # No history: the configured ceiling
+    assert timeouts.read_timeout("references/award_types/") == 60
+
+    for _ in range(10):
+        tracker.record("references/award_types/", 0.05)
+        tracker.record("search/spending_by_category/recipient/", 8.0)
+        tracker.record("idvs/activity/", 40.0)
+
+    assert timeouts.read_timeout("references/award_types/") == 2
+    assert timeouts.read_timeout("search/spending_by_category/recipient/") == pytest.approx(24, rel=0.2)
+    assert timeouts.read_timeout("idvs/activity/") == 60
+    assert timeouts.connect_timeout(2) == 2
+    assert timeouts.connect_timeout(24) == 5
+
+@respx.mock
+def test_client_applies_adaptive_read_timeout():
+    client = USAspendingClient()
+    endpoint = "references/award_types/"
+    for _ in range(client.timeouts.min_samples):
+        client.latency.record(endpoint, 0.05)
+
+    seen = {}
+
+    def respond(request):
+        seen.update(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    respx.get(f"{client.base_url}/{endpoint}").mock(side_effect=respond)
+    client.request("GET", endpoint)
+
+    assert seen["read"] == client.timeouts.floor
+    assert seen["connect"] == client.timeouts.floor
+    assert client.metrics()["latency"][endpoint]["read_timeout_s"] == client.timeouts.floor
@@ -0,0 +1,118 @@
+import asyncio
+import json
+
+import httpx
+import respx
+
+from usaspending_mcp.usaspending_client import USAspendingClient
+
+ENDPOINT = "search/spending_by_award/"
+
+
+def _paged_route(client, total):
+    """Mocks ENDPOINT serving `total` records in whatever page/limit is requested."""
+    def respond(request):
+        body = json.loads(request.content)
+        page, limit = body["page"], body["limit"]
+        start = (page - 1) * limit
+        results = [{"id": i} for i in range(start, min(start + limit, total))]
+        return httpx.Response(200, json={
+            "results": results,
+            "page_metadata": {"page": page, "hasNext": start + limit < total, "total": total}
+        })
+
+    return respx.post(f"{client.base_url}/{ENDPOINT}").mock(side_effect=respond)
+
+@respx.mock
+def test_paginator_streams_all_pages():
+    client = USAspendingClient()
+    route = _paged_route(client, total=25)
+
+    async def run():
+        pages = client.paginate("POST", ENDPOINT, {"filters": {}}, page_size=10)
+        return pages, await pages.collect()
+
+    pages, records = asyncio.run(run())
+
+    assert [r["id"] for r in records] == list(range(25))
+    assert route.call_count == 3
+    assert pages.total == 25
+    assert pages.truncated is False
+
+@respx.mock
+def test_paginator_prefetches_next_page():
+    client = USAspendingClient()
+    route = _paged_route(client, total=25)
+
+    async def run():
+        pages = client.paginate("POST", ENDPOINT, {"filters": {}}, page_size=10)
+        async for record in pages:
+            await asyncio.sleep(0.05)
+            # Page 2 is requested while page 1 is still being consumed
+            return record, route.call_count
+
+    first, calls = asyncio.run(run())
+
+    assert first == {"id": 0}
+    assert calls == 2
+
+@respx.mock
+def test_paginator_stops_at_item_budget():
+    client = USAspendingClient()
+    route = _paged_route(client, total=100)
+
+    async def run():
+        pages = client.paginate("POST", ENDPOINT, {"filters": {}}, page_size=10, max_items=15)
+        return pages, await pages.collect()
+
+    pages, records = asyncio.run(run())
+
+    assert len(records) == 15
+    assert route.call_count == 2
+    assert pages.truncated is True
+    sent = [json.loads(call.request.content) for call in route.calls]
+    assert [(body["page"], body["limit"]) for body in sent] == [(1, 10), (2, 10)]
+
+@respx.mock
+def test_paginator_stops_at_byte_budget():
+    client = USAspendingClient()
+    _paged_route(client, total=100)
+
+    async def run():
+        pages = client.paginate("POST", ENDPOINT, {"filters": {}}, page_size=10, max_bytes=50)
+        return pages, await pages.collect()
+
+    pages, records = asyncio.run(run())
+
+    # Each record is ~8-9 bytes of JSON; iteration stops once 50 bytes were yielded
+    assert 5 <= len(records) <= 7
+    assert pages.bytes >= 50
+    assert pages.truncated is True
+
+@respx.mock
+def test_closing_paginator_cancels_prefetched_page():
+    client = USAspendingClient()
+    cancelled = []
+
+    async def respond(request):
+        page = json.loads(request.content)["page"]
+        if page > 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        return httpx.Response(200, json={"results": [{"id": 0}], "page_metadata": {"hasNext": True}})
+
+    respx.post(f"{client.base_url}/{ENDPOINT}").mock(side_effect=respond)
+
+    async def run():
+        async with client.paginate("POST", ENDPOINT, {"filters": {}}, page_size=1) as pages:
+            async for _ in pages:
+                await asyncio.sleep(0.05)
+                break
+        # Cancelled on exit, not when the generator is eventually finalized
+        await asyncio.sleep(0.05)
+        return list(cancelled)
+
+    assert asyncio.run(run()) == [2]
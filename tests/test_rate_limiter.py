@@ -0,0 +1,66 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from usaspending_mcp.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # Third and fourth callers queue behind each other
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+def test_cancelled_waiter_returns_its_token():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    async def run():
+        await limiter.acquire("/awards/1/")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire("/awards/2/"), 0.01)
+
+    asyncio.run(run())
+    # The next caller queues for one refill (<= 0.1s), not behind the abandoned reservation (~0.2s)
+    assert limiter._global.reserve() <= 0.1
+
+def test_endpoint_class_limit_applies_only_to_its_class():
+    limiter = RateLimiter(rate=1000, burst=1000, class_limits={"rollups": (10, 1)})
+
+    async def run():
+        await limiter.acquire("/search/spending_by_award/")
+        start = time.monotonic()
+        await limiter.acquire("/references/toptier_agencies/")
+        other = time.monotonic() - start
+        waited = await limiter.acquire("/search/spending_by_category/")
+        return other, waited
+
+    other, waited = asyncio.run(run())
+    assert other < 0.05
+    assert waited == pytest.approx(0.1, abs=0.05)
+    assert limiter.stats()["queued"] == 1
+
+def test_throttling_slows_down_pauses_and_recovers():
+    limiter = RateLimiter(rate=100, burst=100, recovery_step=0.25)
+
+    limiter.on_throttled(retry_after=0.1)
+    assert limiter.factor == 0.5
+
+    waited = asyncio.run(limiter.acquire("/awards/1/"))
+    assert waited >= 0.09
+
+    limiter.on_success()
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.factor == 1.0
+    assert limiter.stats()["throttled"] == 1
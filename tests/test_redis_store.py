@@ -0,0 +1,161 @@
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from usaspending_mcp.cache import Cache
+from usaspending_mcp.redis_store import RedisCacheStore, RESPClient, decode_value, encode_value
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Stand-in Redis server: enough of RESP2 and the commands RedisCacheStore uses."""
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _get(self, key):
+        value, expires_at = self.server.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            self.server.data.pop(key, None)
+            return None
+        return value
+
+    def handle(self):
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            cmd = args[0].upper()
+            self.server.commands.append(cmd)
+            if cmd == b"PING":
+                reply = b"+PONG\r\n"
+            elif cmd == b"GET":
+                reply = self._bulk(self._get(args[1]))
+            elif cmd == b"MGET":
+                reply = b"*%d\r\n" % (len(args) - 1) + b"".join(self._bulk(self._get(k)) for k in args[1:])
+            elif cmd == b"SET":
+                expires_at = None
+                if len(args) >= 5 and args[3].upper() == b"PX":
+                    expires_at = time.time() + int(args[4]) / 1000
+                self.server.data[args[1]] = (args[2], expires_at)
+                reply = b"+OK\r\n"
+            elif cmd == b"DEL":
+                removed = sum(self.server.data.pop(k, None) is not None for k in args[1:])
+                reply = b":%d\r\n" % removed
+            elif cmd == b"SCAN":
+                cursor = int(args[1])
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                count = int(args[args.index(b"COUNT") + 1])
+                keys = sorted(k for k in list(self.server.data) if fnmatch.fnmatchcase(k.decode(), pattern))
+                batch = keys[cursor:cursor + count]
+                next_cursor = b"%d" % (cursor + count) if cursor + count < len(keys) else b"0"
+                reply = b"*2\r\n" + self._bulk(next_cursor) + b"*%d\r\n" % len(batch) + b"".join(self._bulk(k) for k in batch)
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def redis_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakeRedisHandler)
+    server.daemon_threads = True
+    server.data = {}
+    server.commands = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _store(server) -> RedisCacheStore:
+    host, port = server.server_address
+    return RedisCacheStore(RESPClient.from_url(f"redis://{host}:{port}/0"))
+
+
+def test_encode_decode_round_trip():
+    small = {"results": [1, 2]}
+    large = {"results": [{"name": "DEPARTMENT OF DEFENSE"}] * 200}
+
+    assert decode_value(encode_value(small, 1.0, 2.0, 3.0)) == (small, 1.0, 2.0, 3.0)
+    encoded = encode_value(large, 1.0, 2.0, 3.0)
+    # Large bodies are compressed
+    assert len(encoded) < len(str(large))
+    assert decode_value(encoded) == (large, 1.0, 2.0, 3.0)
+
+def test_instances_share_remote_cache(redis_server):
+    cache_a = Cache(l2=_store(redis_server))
+    cache_b = Cache(l2=_store(redis_server))
+
+    cache_a.set({"q": "nasa"}, {"results": ["NASA"]}, ttl_seconds=60)
+
+    assert cache_b.get({"q": "nasa"}) == ({"results": ["NASA"]}, True)
+    assert cache_b.stats()["l2_hits"] == 1
+    # Served from L1 afterwards
+    redis_server.commands.clear()
+    assert cache_b.get({"q": "nasa"}) == ({"results": ["NASA"]}, True)
+    assert redis_server.commands == []
+
+def test_remote_rows_expire_after_stale_window(redis_server):
+    cache = Cache(l2=_store(redis_server))
+    cache.set("short", "value", ttl_seconds=0.01, stale_ttl_seconds=0.01)
+    time.sleep(0.03)
+
+    assert Cache(l2=_store(redis_server)).get_entry("short") is None
+
+def test_warm_from_remote_and_clear(redis_server):
+    cache = Cache(l2=_store(redis_server))
+    cache.set("a", 1, ttl_seconds=60)
+    cache.set("b", 2, ttl_seconds=60)
+
+    restarted = Cache(l2=_store(redis_server))
+    assert restarted.warm_from_l2() == 2
+    assert restarted.l2.count() == 2
+
+    restarted.clear()
+    assert redis_server.data == {}
+
+def test_items_stops_scanning_at_limit(redis_server):
+    cache = Cache(l2=_store(redis_server))
+    for i in range(10):
+        cache.set(f"key{i}", i, ttl_seconds=60)
+    store = _store(redis_server)
+    store.scan_count = 2
+    redis_server.commands.clear()
+
+    assert len(list(store.items(limit=3))) == 3
+    # Two batches of two keys, not all five
+    assert redis_server.commands.count(b"SCAN") == 2
+
+def test_unreachable_remote_cache_is_bypassed():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    store = RedisCacheStore(RESPClient("127.0.0.1", port), retry_after_seconds=60)
+    cache = Cache(l2=store)
+
+    cache.set("key", "value", ttl_seconds=60)
+    assert cache.get("key") == ("value", True)
+    assert cache.get("other") == (None, False)
+    stats = cache.stats()["l2"]
+    assert stats["online"] is False
+    # One failed attempt, then bypassed until retry_after_seconds
+    assert stats["errors"] == 1
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+import respx
+
+from usaspending_mcp.retry_budget import RetryBudget
+from usaspending_mcp.usaspending_client import APIError, USAspendingClient
+
+
+def test_retry_budget_caps_retries_to_ratio():
+    budget = RetryBudget(ratio=0.25, burst=2)
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+    for _ in range(4):
+        budget.earn()
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+    stats = budget.stats()
+    assert stats["requests"] == 4
+    assert stats["retries"] == 3
+    assert stats["denied"] == 2
+
+def test_disabled_retry_budget_always_allows():
+    budget = RetryBudget(ratio=0, burst=0, enabled=False)
+
+    assert all(budget.try_spend() for _ in range(5))
+    assert budget.stats()["denied"] == 0
+
+@respx.mock
+def test_exhausted_retry_budget_fails_fast():
+    client = USAspendingClient()
+    client.max_retries = 3
+    client.backoff_base = 0.01
+    client.retry_budget = RetryBudget(ratio=0.1, burst=1)
+    endpoint = "broken_endpoint/"
+    route = respx.get(f"{client.base_url}/{endpoint}").mock(return_value=httpx.Response(503))
+
+    with pytest.raises(APIError):
+        client.request("GET", endpoint)
+    # The one retry credit is used, then no more retries
+    assert route.call_count == 2
+
+    with pytest.raises(APIError):
+        client.request("GET", endpoint)
+    assert route.call_count == 3
+
+    stats = client.metrics()["retry_budget"]
+    assert stats["retries"] == 1
+    assert stats["denied"] == 2
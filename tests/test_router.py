@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -52,6 +53,28 @@ def test_router_assistance_only_denies_idv(router):
     assert resp["meta"]["route_name"] != "idv_vehicle_bundle"
     assert resp["meta"]["route_name"] == "award_search"
 
+def test_router_sync_and_async_paths_share_the_wall_budget(router):
+    from usaspending_mcp.request_context import current_request
+
+    remaining = []
+
+    def execute(**kwargs):
+        remaining.append(current_request().remaining())
+        return {"tool_version": "1.0", "meta": {}}
+
+    async def aexecute(**kwargs):
+        return execute(**kwargs)
+
+    router.tools["award_explain"].execute.side_effect = execute
+    router.tools["award_explain"].aexecute = aexecute
+    budget_s = router.rules["budgets"]["max_wall_ms"] / 1000
+
+    router.route_request("Explain award CONT_AWD_123")
+    asyncio.run(router.aroute_request("Explain award CONT_AWD_123"))
+
+    assert len(remaining) == 2
+    assert all(0 < r <= budget_s for r in remaining)
+
 def test_router_budgets_check(router):
     router.rules["budgets"]["max_usaspending_requests"] = 0
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from unittest.mock import patch
 
@@ -10,6 +11,22 @@ def test_stdio_server_import():
     from usaspending_mcp import stdio_server
     assert stdio_server.main is not None
 
+def test_stdio_server_warms_caches_at_startup():
+    from usaspending_mcp import stdio_server
+
+    warmed = []
+
+    async def warm():
+        warmed.append(True)
+
+    async def serve():
+        await asyncio.sleep(0)
+
+    with patch.object(stdio_server, "warm_caches", warm), patch.object(stdio_server.mcp, "run_stdio_async", serve):
+        asyncio.run(stdio_server.run_stdio())
+
+    assert warmed == [True]
+
 def test_http_app_healthz():
     client = TestClient(app)
     response = client.get("/healthz")
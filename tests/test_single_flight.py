@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from usaspending_mcp.request_context import current_request
+from usaspending_mcp.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    sf = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    async def run():
+        return await asyncio.gather(*(sf.do("key", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert results == [{"value": 42}] * 5
+    assert calls == 1
+    assert sf.stats() == {"inflight": 0, "leaders": 1, "coalesced": 4}
+
+def test_distinct_keys_are_not_coalesced():
+    sf = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(sf.do("a", fetch), sf.do("b", fetch))
+
+    assert asyncio.run(run()) == ["ok", "ok"]
+    assert sf.stats()["leaders"] == 2
+    assert sf.stats()["coalesced"] == 0
+
+def test_exception_is_shared_with_followers():
+    sf = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(sf.do("key", fetch), sf.do("key", fetch), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert sf.stats()["coalesced"] == 1
+
+def test_cancelled_follower_does_not_cancel_leader():
+    sf = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        leader = asyncio.create_task(sf.do("key", fetch))
+        follower = asyncio.create_task(sf.do("key", fetch))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader
+
+    assert asyncio.run(run()) == "done"
+
+def test_sequential_calls_are_not_coalesced():
+    sf = SingleFlight()
+
+    async def fetch():
+        return "fresh"
+
+    async def run():
+        await sf.do("key", fetch)
+        await sf.do("key", fetch)
+
+    asyncio.run(run())
+    assert sf.stats()["leaders"] == 2
+
+def test_shared_call_runs_with_latest_caller_deadline():
+    sf = SingleFlight()
+    seen = []
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        seen.append(current_request().deadline)
+        return "ok"
+
+    async def run():
+        now = time.monotonic()
+        return await asyncio.gather(
+            sf.do("key", fetch, deadline=now + 0.01),
+            sf.do("key", fetch, deadline=now + 5),
+            return_exceptions=True
+        ), now
+
+    (first, second), now = asyncio.run(run())
+
+    assert isinstance(first, asyncio.TimeoutError)
+    assert second == "ok"
+    assert seen == [pytest.approx(now + 5)]